@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Measure import time of the package in fresh interpreters.
+
+Each statement is executed in a new Python process ``--repeat`` times,
+and the median of the elapsed time excluding the interpreter startup is reported.
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+from collections import OrderedDict
+from timeit import default_timer
+
+
+STATEMENT_LIST = [
+    "import pytablewriter",
+    "from pytablewriter import CsvTableWriter",
+    "from pytablewriter import MarkdownTableWriter",
+    "from pytablewriter import ExcelXlsxTableWriter",
+    "from pytablewriter import TableWriterFactory",
+    "import pytablewriter; [fmt.writer_class for fmt in pytablewriter.TableFormat]",
+]
+
+EXIT_REGRESSION = 2
+
+
+def measure_process_time(statement, repeat):
+    elapsed_time_list = []
+
+    for _ in range(repeat):
+        start_time = default_timer()
+        subprocess.check_call([sys.executable, "-c", statement])
+        elapsed_time_list.append(default_timer() - start_time)
+
+    elapsed_time_list.sort()
+
+    return elapsed_time_list[len(elapsed_time_list) // 2]
+
+
+def parse_option():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--statements", nargs="+", default=STATEMENT_LIST, help="statements to measure"
+    )
+    parser.add_argument("--repeat", type=int, default=11, help="number of processes to measure")
+    parser.add_argument("-o", "--output", help="path to write results as JSON")
+    parser.add_argument("--baseline", help="path to a JSON result file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="ratio of time increase regarded as a regression (defaults to %(default)s)",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    options = parse_option()
+
+    startup_time = measure_process_time("pass", options.repeat)
+    result_list = []
+    for statement in options.statements:
+        elapsed_time = max(measure_process_time(statement, options.repeat) - startup_time, 0.0)
+        result_list.append(OrderedDict([("statement", statement), ("elapsed_time", elapsed_time)]))
+
+        print("{:.4f}s: {}".format(elapsed_time, statement), file=sys.stderr)
+
+    output = OrderedDict(
+        [("python", sys.version), ("startup_time", startup_time), ("results", result_list)]
+    )
+
+    is_regression = False
+    if options.baseline:
+        with io.open(options.baseline, encoding="utf-8") as f:
+            baseline_map = {
+                result["statement"]: result["elapsed_time"] for result in json.load(f)["results"]
+            }
+
+        for result in result_list:
+            baseline_time = baseline_map.get(result["statement"])
+            if not baseline_time:
+                continue
+
+            result["time_ratio"] = result["elapsed_time"] / baseline_time
+            if result["time_ratio"] > 1 + options.threshold:
+                is_regression = True
+                print(
+                    "regression: {:.2f}x: {}".format(result["time_ratio"], result["statement"]),
+                    file=sys.stderr,
+                )
+
+    json_text = json.dumps(output, indent=4)
+    if options.output:
+        with io.open(options.output, "w", encoding="utf-8") as f:
+            f.write(json_text if sys.version_info[0] >= 3 else json_text.decode("utf-8"))
+    else:
+        print(json_text)
+
+    return EXIT_REGRESSION if is_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,491 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Benchmark table writers with synthetic tables.
+
+Measure throughput and peak memory of ``write_table``/``dumps``/``dump``/``write_table_iter``
+for each table format, output results as JSON, and compare them with a baseline result.
+
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from timeit import default_timer
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# measure the package of the repository without installation
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+import pytablewriter as ptw  # noqa: E402
+from pytablewriter.style import Style, ThousandSeparator  # noqa: E402
+from pytablewriter.writer.binary._interface import AbstractBinaryTableWriter  # noqa: E402
+
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+PRESET_MAP = {
+    "baseline": {"row_list": [100], "column_list": [20]},
+    "quick": {"row_list": [100, 1000], "column_list": [2, 20]},
+    "default": {"row_list": [100, 1000, 10000], "column_list": [2, 20, 200]},
+    "full": {"row_list": [100, 1000, 10000, 100000, 1000000], "column_list": [2, 20, 200]},
+}
+TYPE_MIX_LIST = ["int", "float", "str", "datetime", "multibyte", "nullable", "mixed"]
+METHOD_LIST = ["write_table", "dumps", "dump", "write_table_iter", "write_table_iter_reuse"]
+ITER_METHOD_LIST = ["write_table_iter", "write_table_iter_reuse"]
+
+# formats that require external services
+EXCLUDE_FORMAT_LIST = [ptw.TableFormat.ELASTICSEARCH]
+
+# formats measured with each of the JSON encoder backends
+JSON_FORMAT_LIST = [ptw.TableFormat.JSON, ptw.TableFormat.JSON_LINES]
+JSON_BACKEND_LIST = ["json", "orjson", "ujson", "rapidjson"]
+
+EXIT_REGRESSION = 2
+
+
+class ValueGenerator(object):
+    __MULTIBYTE_CHAR_LIST = list("あいうえおアイウエオ漢字表計算")
+
+    def __init__(self, seed):
+        self.__random = random.Random(seed)
+        self.__base_datetime = datetime.datetime(2017, 1, 1)
+
+    def create_value_matrix(self, type_mix, row_count, col_count):
+        if type_mix == "mixed":
+            base_type_list = [value for value in TYPE_MIX_LIST if value != "mixed"]
+            col_type_list = [
+                base_type_list[col_idx % len(base_type_list)] for col_idx in range(col_count)
+            ]
+        else:
+            col_type_list = [type_mix] * col_count
+
+        gen_func_list = [getattr(self, "_gen_" + col_type) for col_type in col_type_list]
+
+        return [[gen_func() for gen_func in gen_func_list] for _row_idx in range(row_count)]
+
+    def _gen_int(self):
+        return self.__random.randint(-10 ** 6, 10 ** 6)
+
+    def _gen_float(self):
+        return round(self.__random.uniform(-10 ** 4, 10 ** 4), self.__random.randint(0, 6))
+
+    def _gen_str(self):
+        return "".join(
+            self.__random.choice("abcdefghijklmnopqrstuvwxyz")
+            for _ in range(self.__random.randint(1, 16))
+        )
+
+    def _gen_datetime(self):
+        return self.__base_datetime + datetime.timedelta(seconds=self.__random.randint(0, 10 ** 8))
+
+    def _gen_multibyte(self):
+        return "".join(
+            self.__random.choice(self.__MULTIBYTE_CHAR_LIST)
+            for _ in range(self.__random.randint(1, 8))
+        )
+
+    def _gen_nullable(self):
+        value = self.__random.random()
+
+        if value < 0.1:
+            return None
+        if value < 0.15:
+            return float("nan")
+        if value < 0.6:
+            return self._gen_int()
+
+        return self._gen_float()
+
+
+class BenchmarkCase(object):
+    def __init__(
+        self, table_format, method, row_count, col_count, type_mix, is_styled, json_backend=None
+    ):
+        self.table_format = table_format
+        self.format_name = table_format.name_list[0]
+        self.method = method
+        self.row_count = row_count
+        self.col_count = col_count
+        self.type_mix = type_mix
+        self.is_styled = is_styled
+        self.json_backend = json_backend
+
+    def create_writer(self, value_matrix):
+        writer = self.table_format.writer_class()
+        writer.table_name = "benchmark"
+        writer.header_list = ["col{:d}".format(col_idx) for col_idx in range(self.col_count)]
+
+        if self.json_backend:
+            writer.json_backend = self.json_backend
+
+        if self.method in ITER_METHOD_LIST:
+            writer.value_matrix = iter(value_matrix)
+        else:
+            writer.value_matrix = value_matrix
+
+        if self.method == "write_table_iter_reuse":
+            writer.is_reuse_inferred_type_hint = True
+
+        if self.is_styled:
+            writer.style_list = [
+                Style(
+                    align="right" if col_idx % 2 else "left",
+                    font_weight="bold" if col_idx % 3 == 0 else "normal",
+                    thousand_separator=ThousandSeparator.COMMA,
+                )
+                for col_idx in range(self.col_count)
+            ]
+
+        return writer
+
+    def get_skip_reason(self, writer):
+        is_binary = isinstance(writer, AbstractBinaryTableWriter)
+
+        if self.method == "dumps" and is_binary:
+            return "binary format writers do not support dumps"
+        if self.method == "dump" and not hasattr(writer, "dump"):
+            return "writer does not support dump"
+        if self.method in ITER_METHOD_LIST and not writer.support_split_write:
+            return "writer does not support write_table_iter"
+
+        return None
+
+    def run(self, writer, work_dir):
+        output_path = os.path.join(work_dir, "benchmark." + self.__get_extension())
+        is_binary = isinstance(writer, AbstractBinaryTableWriter)
+
+        if self.method == "dumps":
+            writer.dumps()
+        elif self.method == "dump":
+            writer.dump(output_path)
+        elif is_binary:
+            writer.open(output_path)
+            try:
+                if hasattr(writer, "make_worksheet"):
+                    writer.make_worksheet(writer.table_name)
+
+                self.__write(writer)
+            finally:
+                writer.close()
+        else:
+            with io.open(output_path, "w", encoding="utf-8") as f:
+                writer.stream = f
+                self.__write(writer)
+
+    def to_dict(self):
+        return OrderedDict(
+            [
+                ("format", self.format_name),
+                ("method", self.method),
+                ("rows", self.row_count),
+                ("columns", self.col_count),
+                ("type_mix", self.type_mix),
+                ("styled", self.is_styled),
+                ("json_backend", self.json_backend),
+            ]
+        )
+
+    def __write(self, writer):
+        if self.method in ITER_METHOD_LIST:
+            writer.write_table_iter(chunk_size=max(self.row_count // 10, 1))
+        else:
+            writer.write_table()
+
+    def __get_extension(self):
+        extension_list = self.table_format.file_extension_list
+
+        return extension_list[0] if extension_list else "txt"
+
+
+def measure(case, value_matrix, repeat, is_measure_memory, work_dir):
+    result = case.to_dict()
+
+    try:
+        skip_reason = case.get_skip_reason(case.create_writer(value_matrix))
+    except ImportError as e:
+        skip_reason = "{}: {}".format(e.__class__.__name__, e)
+
+    if skip_reason:
+        result["status"] = "skipped"
+        result["message"] = skip_reason
+        return result
+
+    elapsed_time_list = []
+    try:
+        for _ in range(repeat):
+            writer = case.create_writer(value_matrix)
+            start_time = default_timer()
+            case.run(writer, work_dir)
+            elapsed_time_list.append(default_timer() - start_time)
+
+        peak_memory = None
+        if is_measure_memory and tracemalloc is not None:
+            writer = case.create_writer(value_matrix)
+            tracemalloc.start()
+            try:
+                case.run(writer, work_dir)
+                _current_memory, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result["status"] = "error"
+        result["message"] = "{}: {}".format(e.__class__.__name__, e)
+        return result
+
+    elapsed_time = min(elapsed_time_list)
+    result["status"] = "ok"
+    result["elapsed_time"] = elapsed_time
+    result["rows_per_sec"] = case.row_count / elapsed_time if elapsed_time > 0 else None
+    result["cells_per_sec"] = (
+        case.row_count * case.col_count / elapsed_time if elapsed_time > 0 else None
+    )
+    result["peak_memory"] = peak_memory
+
+    return result
+
+
+def compare(result_list, baseline, threshold):
+    baseline_map = {}
+    for baseline_result in baseline.get("results", []):
+        if baseline_result.get("status") == "ok":
+            baseline_map[to_result_key(baseline_result)] = baseline_result
+
+    comparison_list = []
+    for result in result_list:
+        baseline_result = baseline_map.get(to_result_key(result))
+        if result.get("status") != "ok" or baseline_result is None:
+            continue
+
+        time_ratio = result["elapsed_time"] / baseline_result["elapsed_time"]
+        memory_ratio = None
+        if result.get("peak_memory") and baseline_result.get("peak_memory"):
+            memory_ratio = float(result["peak_memory"]) / baseline_result["peak_memory"]
+
+        comparison = OrderedDict(to_result_key_dict(result))
+        comparison["time_ratio"] = time_ratio
+        comparison["memory_ratio"] = memory_ratio
+        comparison["is_regression"] = time_ratio > 1 + threshold or (
+            memory_ratio is not None and memory_ratio > 1 + threshold
+        )
+        comparison_list.append(comparison)
+
+    return comparison_list
+
+
+def to_result_key_dict(result):
+    return [
+        (name, result.get(name))
+        for name in ("format", "method", "rows", "columns", "type_mix", "styled", "json_backend")
+    ]
+
+
+def to_result_key(result):
+    return tuple(value for _name, value in to_result_key_dict(result))
+
+
+def get_environment():
+    return OrderedDict(
+        [
+            ("pytablewriter", ptw.__version__),
+            ("python", platform.python_version()),
+            ("implementation", platform.python_implementation()),
+            ("platform", platform.platform()),
+            ("created_at", datetime.datetime.utcnow().isoformat()),
+        ]
+    )
+
+
+def print_comparison(comparison_list, stream):
+    writer = ptw.MarkdownTableWriter()
+    writer.table_name = "comparison with the baseline"
+    writer.header_list = list(comparison_list[0].keys())
+    writer.value_matrix = [list(comparison.values()) for comparison in comparison_list]
+    writer.stream = stream
+    writer.write_table()
+
+
+def parse_option():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--preset",
+        choices=sorted(PRESET_MAP),
+        default="quick",
+        help="table sizes to measure. --rows and --columns override the preset.",
+    )
+    parser.add_argument("--rows", type=int, nargs="+", help="numbers of rows")
+    parser.add_argument("--columns", type=int, nargs="+", help="numbers of columns")
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        metavar="FORMAT",
+        help="names of table formats (defaults to all of the formats that can run locally)",
+    )
+    parser.add_argument(
+        "--methods", nargs="+", choices=METHOD_LIST, default=METHOD_LIST, help="methods to measure"
+    )
+    parser.add_argument(
+        "--type-mixes",
+        nargs="+",
+        choices=TYPE_MIX_LIST,
+        default=TYPE_MIX_LIST,
+        help="data types of columns",
+    )
+    parser.add_argument(
+        "--style",
+        choices=["none", "styled", "both"],
+        default="both",
+        help="measure with/without style_list",
+    )
+    parser.add_argument(
+        "--json-backends",
+        nargs="+",
+        choices=JSON_BACKEND_LIST,
+        default=JSON_BACKEND_LIST,
+        help="JSON encoder backends to measure for JSON/JSON Lines formats "
+        "(backends not installed are skipped)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="number of measurements for each case (use the best)"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip peak memory measurement with tracemalloc"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of synthetic tables")
+    parser.add_argument("-o", "--output", help="path to write results as JSON")
+    parser.add_argument(
+        "--baseline",
+        help="JSON result file recorded on the same machine to compare with "
+        "(no comparison if not specified)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="ratio of time/memory increase regarded as a regression (defaults to %(default)s)",
+    )
+
+    return parser.parse_args()
+
+
+def get_table_format_list(format_name_list):
+    if not format_name_list:
+        return [
+            table_format
+            for table_format in ptw.TableFormat
+            if table_format not in EXCLUDE_FORMAT_LIST
+        ]
+
+    table_format_list = []
+    for format_name in format_name_list:
+        for table_format in ptw.TableFormat:
+            if format_name.strip().lower() in table_format.name_list:
+                table_format_list.append(table_format)
+                break
+        else:
+            raise ValueError("unknown format: {}".format(format_name))
+
+    return table_format_list
+
+
+def main():
+    options = parse_option()
+    preset = PRESET_MAP[options.preset]
+    row_list = options.rows or preset["row_list"]
+    column_list = options.columns or preset["column_list"]
+    styled_list = {"none": [False], "styled": [True], "both": [False, True]}[options.style]
+
+    value_generator = ValueGenerator(options.seed)
+    work_dir = tempfile.mkdtemp(prefix="pytablewriter_benchmark_")
+    result_list = []
+
+    try:
+        for row_count, col_count, type_mix in itertools.product(
+            row_list, column_list, options.type_mixes
+        ):
+            value_matrix = value_generator.create_value_matrix(type_mix, row_count, col_count)
+
+            for table_format, method, is_styled in itertools.product(
+                get_table_format_list(options.formats), options.methods, styled_list
+            ):
+                json_backend_list = (
+                    options.json_backends if table_format in JSON_FORMAT_LIST else [None]
+                )
+
+                for json_backend in json_backend_list:
+                    case = BenchmarkCase(
+                        table_format,
+                        method,
+                        row_count,
+                        col_count,
+                        type_mix,
+                        is_styled,
+                        json_backend=json_backend,
+                    )
+                    result = measure(
+                        case, value_matrix, options.repeat, not options.no_memory, work_dir
+                    )
+                    result_list.append(result)
+
+                    print(
+                        "{format} {method} rows={rows} columns={columns} type={type_mix} "
+                        "styled={styled} json_backend={json_backend}: {status} {elapsed}".format(
+                            elapsed="{:.4f}s".format(result["elapsed_time"])
+                            if result["status"] == "ok"
+                            else result.get("message"),
+                            **result
+                        ),
+                        file=sys.stderr,
+                    )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = OrderedDict([("environment", get_environment()), ("results", result_list)])
+
+    is_regression = False
+    if options.baseline:
+        with io.open(options.baseline, encoding="utf-8") as f:
+            comparison_list = compare(result_list, json.load(f), options.threshold)
+
+        output["comparisons"] = comparison_list
+        if comparison_list:
+            print_comparison(comparison_list, sys.stderr)
+        is_regression = any([comparison["is_regression"] for comparison in comparison_list])
+
+    json_text = json.dumps(output, indent=4)
+    if options.output:
+        with io.open(options.output, "w", encoding="utf-8") as f:
+            f.write(json_text if sys.version_info[0] >= 3 else json_text.decode("utf-8"))
+    else:
+        print(json_text)
+
+    if is_regression:
+        print("performance regressions detected", file=sys.stderr)
+        return EXIT_REGRESSION
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
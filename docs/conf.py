@@ -315,6 +315,12 @@ rp_class = u"""
 .. |timedelta| replace:: :py:class:`datetime.timedelta`
 
 .. |Style| replace:: :py:class:`~pytablewriter.style.Style`
+.. |PhaseProfile| replace:: :py:class:`~pytablewriter.PhaseProfile`
+.. |WriteProfile| replace:: :py:class:`~pytablewriter.WriteProfile`
+.. |FormatAttr| replace:: :py:class:`~pytablewriter.FormatAttr`
+.. |TableFormat| replace:: :py:class:`~pytablewriter.TableFormat`
+.. |TableWriterFactory| replace:: :py:class:`~pytablewriter.TableWriterFactory`
+.. |WriterPlugin| replace:: :py:class:`~pytablewriter.WriterPlugin`
 .. |TableData| replace:: `TableData <https://tabledata.rtfd.io/en/latest/pages/reference/data.html#tabledata>`__
 .. |Typecode| replace:: :py:class:`typepy.Typecode`
 
@@ -326,6 +332,7 @@ rp_class = u"""
 .. |HtmlTableWriter| replace:: :py:class:`~pytablewriter.HtmlTableWriter`
 .. |JavaScriptTableWriter| replace:: :py:class:`~pytablewriter.JavaScriptTableWriter`
 .. |JsonTableWriter| replace:: :py:class:`~pytablewriter.JsonTableWriter`
+.. |JsonLinesTableWriter| replace:: :py:class:`~pytablewriter.JsonLinesTableWriter`
 .. |LatexMatrixWriter| replace:: :py:class:`~pytablewriter.LatexMatrixWriter`
 .. |LatexTableWriter| replace:: :py:class:`~pytablewriter.LatexTableWriter`
 .. |LtsvTableWriter| replace:: :py:class:`~pytablewriter.LtsvTableWriter`
@@ -6,26 +6,8 @@
 
 from __future__ import absolute_import
 
-from typepy import (
-    Bool,
-    DateTime,
-    Dictionary,
-    Infinity,
-    Integer,
-    IpAddress,
-    List,
-    Nan,
-    NoneType,
-    NullString,
-    RealNumber,
-    String,
-)
-
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
-from ._factory import TableWriterFactory
-from ._function import dump_tabledata
-from ._logger import set_log_level, set_logger
-from ._table_format import FormatAttr, TableFormat
+from ._lazy import create_lazy_attr_loader as _create_lazy_attr_loader
 from .error import (
     EmptyHeaderError,
     EmptyTableDataError,
@@ -34,31 +16,77 @@ from .error import (
     NotSupportedError,
     WriterNotFoundError,
 )
-from .style import Align, Format
-from .writer import (
-    CsvTableWriter,
-    ElasticsearchWriter,
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    HtmlTableWriter,
-    JavaScriptTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    NullTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    SqliteTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
+
+
+# import writers and their dependencies at the first access to reduce the import time
+_LAZY_MODULE_ATTR_MAP = {
+    "typepy": [
+        "Bool",
+        "DateTime",
+        "Dictionary",
+        "Infinity",
+        "Integer",
+        "IpAddress",
+        "List",
+        "Nan",
+        "NoneType",
+        "NullString",
+        "RealNumber",
+        "String",
+    ],
+    "._factory": ["TableWriterFactory"],
+    "._function": ["dump_tabledata"],
+    "._logger": ["PhaseProfile", "WriteProfile", "set_log_level", "set_logger"],
+    "._plugin": ["WriterPlugin"],
+    "._table_format": ["FormatAttr", "TableFormat"],
+    ".style": ["Align", "Format"],
+    ".writer": [
+        "CsvTableWriter",
+        "ElasticsearchWriter",
+        "ExcelXlsTableWriter",
+        "ExcelXlsxTableWriter",
+        "HtmlTableWriter",
+        "JavaScriptTableWriter",
+        "JsonLinesTableWriter",
+        "JsonTableWriter",
+        "LatexMatrixWriter",
+        "LatexTableWriter",
+        "LtsvTableWriter",
+        "MarkdownTableWriter",
+        "MediaWikiTableWriter",
+        "NullTableWriter",
+        "NumpyTableWriter",
+        "PandasDataFrameWriter",
+        "PythonCodeTableWriter",
+        "RstCsvTableWriter",
+        "RstGridTableWriter",
+        "RstSimpleTableWriter",
+        "SpaceAlignedTableWriter",
+        "SqliteTableWriter",
+        "TomlTableWriter",
+        "TsvTableWriter",
+    ],
+    ".writer._table_writer": ["LineBreakHandling"],
+}
+_LAZY_SUBMODULE_LIST = ["sanitizer", "style", "writer"]
+
+__all__ = tuple(
+    ["__author__", "__copyright__", "__email__", "__license__", "__version__"]
+    + [
+        "EmptyHeaderError",
+        "EmptyTableDataError",
+        "EmptyTableNameError",
+        "EmptyValueError",
+        "NotSupportedError",
+        "WriterNotFoundError",
+    ]
+    + [
+        attr_name
+        for attr_name_list in _LAZY_MODULE_ATTR_MAP.values()
+        for attr_name in attr_name_list
+    ]
+)
+
+__getattr__, __dir__ = _create_lazy_attr_loader(
+    __name__, globals(), _LAZY_MODULE_ATTR_MAP, _LAZY_SUBMODULE_LIST
 )
-from .writer._table_writer import LineBreakHandling
@@ -10,15 +10,60 @@ import os
 
 import typepy
 
-from ._table_format import FormatAttr, TableFormat
+from ._format_index import TableFormatIndex
+from ._plugin import WriterPlugin, load_entry_point_plugins
+from ._table_format import TableFormat
 from .error import WriterNotFoundError
 
 
 class TableWriterFactory(object):
     """
     A factor class of table writer classes.
+    Table formats are looked up from an index that is built at the first use.
+    The index includes writer plugins (|WriterPlugin|) registered as entry points
+    of the ``pytablewriter.writers`` group.
     """
 
+    __index = None
+
+    @classmethod
+    def _get_index(cls):
+        if cls.__index is None:
+            cls.__index = TableFormatIndex(TableFormat).extend(load_entry_point_plugins())
+
+        return cls.__index
+
+    @classmethod
+    def register(cls, plugin):
+        """
+        Register a writer plugin to the factory.
+        Names and file extensions of built-in formats and
+        previously registered plugins take precedence over the plugin.
+
+        :param pytablewriter.WriterPlugin plugin: Plugin to register.
+        :raises TypeError: If the ``plugin`` is not a |WriterPlugin| instance.
+
+        :Example:
+            .. code:: python
+
+                >>> import pytablewriter as ptw
+                >>> ptw.TableWriterFactory.register(
+                ...     ptw.WriterPlugin(
+                ...         name_list=["my_format"],
+                ...         writer_class="my_package.writer:MyTableWriter",
+                ...         file_extension_list=["myf"],
+                ...     )
+                ... )
+                >>> writer = ptw.TableWriterFactory.create_from_format_name("my_format")
+        """
+
+        if not isinstance(plugin, WriterPlugin):
+            raise TypeError(
+                "plugin must be a WriterPlugin instance: actual={}".format(type(plugin).__name__)
+            )
+
+        cls.__index = cls._get_index().extend([plugin])
+
     @classmethod
     def create_from_file_extension(cls, file_extension):
         """
@@ -67,14 +112,10 @@ class TableWriterFactory(object):
 
         file_extension = file_extension.lstrip(".").lower()
 
-        for table_format in TableFormat:
-            if file_extension not in table_format.file_extension_list:
-                continue
-
-            if table_format.format_attribute & FormatAttr.SECONDARY_EXT:
-                continue
-
-            return table_format.writer_class()
+        index = cls._get_index()
+        table_format = index.get_by_file_extension(file_extension)
+        if table_format is not None:
+            return index.get_writer_class(table_format)()
 
         raise WriterNotFoundError(
             "\n".join(
@@ -131,11 +172,10 @@ class TableWriterFactory(object):
 
         format_name = format_name.lower()
 
-        for table_format in TableFormat:
-            if format_name in table_format.name_list and not (
-                table_format.format_attribute & FormatAttr.SECONDARY_NAME
-            ):
-                return table_format.writer_class()
+        index = cls._get_index()
+        table_format = index.get_by_name(format_name)
+        if table_format is not None:
+            return index.get_writer_class(table_format)()
 
         raise WriterNotFoundError(
             "\n".join(
@@ -198,12 +238,7 @@ class TableWriterFactory(object):
 
         """
 
-        format_name_set = set()
-        for table_format in TableFormat:
-            for format_name in table_format.name_list:
-                format_name_set.add(format_name)
-
-        return sorted(list(format_name_set))
+        return list(cls._get_index().format_name_list)
 
     @classmethod
     def get_extension_list(cls):
@@ -239,9 +274,31 @@ class TableWriterFactory(object):
                 xlsx
         """
 
-        file_extension_set = set()
-        for table_format in TableFormat:
-            for file_extension in table_format.file_extension_list:
-                file_extension_set.add(file_extension)
+        return list(cls._get_index().file_extension_list)
+
+    @classmethod
+    def find_table_format_list(cls, format_attribute):
+        """
+        Search table formats that have all of the specified attributes
+        without creating writer instances.
+
+        :param int format_attribute:
+            Bitmap of :py:class:`~pytablewriter.FormatAttr` to look for.
+        :return: Table formats that matched the attributes.
+        :rtype: list
+
+        :Example:
+            .. code:: python
+
+                >>> import pytablewriter as ptw
+                >>> for table_format in ptw.TableWriterFactory.find_table_format_list(
+                ...     ptw.FormatAttr.BIN | ptw.FormatAttr.SPLIT_WRITE
+                ... ):
+                ...     print(table_format.name)
+                ...
+                EXCEL_XLS
+                EXCEL_XLSX
+                SQLITE
+        """
 
-        return sorted(list(file_extension_set))
+        return list(cls._get_index().find_all_attr(format_attribute))
@@ -0,0 +1,140 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from ._table_format import FormatAttr
+
+
+class TableFormatIndex(object):
+    """
+    Immutable index of table formats to look up formats by names, file extensions,
+    and attributes in constant time.
+
+    :param table_formats:
+        Table formats to index in the order of priority.
+        Items are |TableFormat|, |WriterPlugin|, or objects that have the same properties
+        (``name_list``, ``writer_class``, ``format_attribute``, and ``file_extension_list``).
+    """
+
+    @property
+    def table_format_list(self):
+        """
+        :return: Indexed table formats in the order of priority.
+        :rtype: tuple
+        """
+
+        return self.__table_format_list
+
+    @property
+    def format_name_list(self):
+        """
+        :return: Sorted format names.
+        :rtype: tuple
+        """
+
+        return self.__format_name_list
+
+    @property
+    def file_extension_list(self):
+        """
+        :return: Sorted file extensions (without leading dots).
+        :rtype: tuple
+        """
+
+        return self.__file_extension_list
+
+    def __init__(self, table_formats):
+        self.__table_format_list = tuple(table_formats)
+        self.__name_map = {}
+        self.__extension_map = {}
+        self.__attr_cache = {}
+        self.__writer_class_cache = {}
+
+        format_name_set = set()
+        file_extension_set = set()
+
+        for table_format in self.__table_format_list:
+            format_attribute = table_format.format_attribute
+
+            for format_name in table_format.name_list:
+                format_name_set.add(format_name)
+
+                if not format_attribute & FormatAttr.SECONDARY_NAME:
+                    self.__name_map.setdefault(format_name, table_format)
+
+            for file_extension in table_format.file_extension_list:
+                file_extension_set.add(file_extension)
+
+                if not format_attribute & FormatAttr.SECONDARY_EXT:
+                    self.__extension_map.setdefault(file_extension, table_format)
+
+        self.__format_name_list = tuple(sorted(format_name_set))
+        self.__file_extension_list = tuple(sorted(file_extension_set))
+
+    def extend(self, table_formats):
+        """
+        :param table_formats:
+            Table formats to add.
+            The formats have lower priority than the formats already indexed.
+        :return: A new index that includes the table formats in addition to the current formats.
+        :rtype: TableFormatIndex
+        """
+
+        return TableFormatIndex(self.__table_format_list + tuple(table_formats))
+
+    def get_by_name(self, format_name):
+        """
+        :param str format_name: Format name (lower case).
+        :return: Table format associated with the name. |None| if not found.
+        """
+
+        return self.__name_map.get(format_name)
+
+    def get_by_file_extension(self, file_extension):
+        """
+        :param str file_extension: File extension (lower case, without a leading dot).
+        :return: Table format associated with the file extension. |None| if not found.
+        """
+
+        return self.__extension_map.get(file_extension)
+
+    def get_writer_class(self, table_format):
+        """
+        :return: Writer class of the table format. The class is resolved once per format.
+        """
+
+        try:
+            return self.__writer_class_cache[table_format]
+        except KeyError:
+            pass
+
+        writer_class = table_format.writer_class
+        self.__writer_class_cache[table_format] = writer_class
+
+        return writer_class
+
+    def find_all_attr(self, format_attribute):
+        """
+        :param int format_attribute:
+            Bitmap of :py:class:`~pytablewriter.FormatAttr` to look for.
+        :return: Table formats that have all of the attributes.
+        :rtype: tuple
+        """
+
+        try:
+            return self.__attr_cache[format_attribute]
+        except KeyError:
+            pass
+
+        table_format_list = tuple(
+            table_format
+            for table_format in self.__table_format_list
+            if table_format.format_attribute & format_attribute == format_attribute
+        )
+        self.__attr_cache[format_attribute] = table_format_list
+
+        return table_format_list
@@ -6,8 +6,11 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import itertools
+
 import dataproperty
 import six
+from typepy import Integer
 
 
 def quote_datetime_formatter(value):
@@ -58,6 +61,32 @@ def dump_tabledata(value, format_name="rst_grid_table", **kwargs):
     return writer.dumps()
 
 
+def iter_chunk(iterable, chunk_size):
+    """
+    :param iterable: Rows to divide.
+    :param int chunk_size: Maximum number of rows for each chunk.
+    :return:
+        Iterator of ``(chunk, is_last_chunk)`` tuples.
+        Yield a single empty chunk if the ``iterable`` is empty.
+    """
+
+    if not Integer(chunk_size).is_type() or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer: actual={}".format(chunk_size))
+
+    row_iter = iter(iterable)
+    chunk = list(itertools.islice(row_iter, chunk_size))
+
+    while True:
+        next_chunk = list(itertools.islice(row_iter, chunk_size))
+
+        if not next_chunk:
+            yield (chunk, True)
+            return
+
+        yield (chunk, False)
+        chunk = next_chunk
+
+
 def normalize_enum(value, enum_class):
     if value is None or not isinstance(value, six.string_types):
         return value
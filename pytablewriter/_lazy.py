@@ -0,0 +1,64 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import
+
+import importlib
+import sys
+
+
+# module level __getattr__ (PEP 562) is available from Python 3.7
+IS_LAZY_IMPORT_AVAILABLE = sys.version_info >= (3, 7)
+
+
+def create_lazy_attr_loader(package_name, package_globals, module_attr_map, submodule_list=()):
+    """
+    Create module level ``__getattr__`` and ``__dir__`` functions that import
+    attributes of a package at the first access.
+    The attributes are imported immediately if the Python version
+    does not support module level ``__getattr__``.
+
+    :param str package_name: ``__name__`` of the package.
+    :param dict package_globals: ``globals()`` of the package.
+    :param dict module_attr_map:
+        Mapping of module names to the names of attributes that imported from the modules.
+        Relative module names are resolved from the package.
+    :param list submodule_list:
+        Names of subpackages/submodules of the package that imported at the first access.
+    :return: A tuple of ``__getattr__`` and ``__dir__`` functions.
+    """
+
+    attr_module_map = {
+        attr_name: module_name
+        for module_name, attr_name_list in module_attr_map.items()
+        for attr_name in attr_name_list
+    }
+
+    def __getattr__(name):
+        if name in submodule_list:
+            value = importlib.import_module("." + name, package_name)
+            package_globals[name] = value
+
+            return value
+
+        try:
+            module_name = attr_module_map[name]
+        except KeyError:
+            raise AttributeError("module {!r} has no attribute {!r}".format(package_name, name))
+
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        package_globals[name] = value
+
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(attr_module_map) | set(submodule_list))
+
+    if not IS_LAZY_IMPORT_AVAILABLE:
+        for name in list(attr_module_map) + list(submodule_list):
+            __getattr__(name)
+
+    return (__getattr__, __dir__)
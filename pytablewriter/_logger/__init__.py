@@ -3,3 +3,4 @@
 from __future__ import absolute_import
 
 from ._logger import WriterLogger, logger, set_log_level, set_logger
+from ._profiler import PhaseProfile, WriteProfile, WriterProfiler
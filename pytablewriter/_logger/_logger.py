@@ -10,6 +10,7 @@ import dataproperty
 from mbstrdecoder import MultiByteStrDecoder
 
 from ._null_logger import NullLogger
+from ._profiler import WriterProfiler
 
 
 try:
@@ -102,20 +103,30 @@ class WriterLogger(object):
     def logger(self):
         return self.__logger
 
+    @property
+    def profiler(self):
+        return self.__profiler
+
     def __init__(self, writer):
         self.__writer = writer
         self.__logger = logger
+        self.__profiler = WriterProfiler(writer)
 
         self.logger.debug("created WriterLogger: format={}".format(writer.format_name))
 
     def __enter__(self):
+        self.__profiler.__enter__()
         self.logging_start_write()
         return self
 
     def __exit__(self, *exc):
         self.logging_complete_write()
+        self.__profiler.__exit__(*exc)
         return False
 
+    def profile_phase(self, name):
+        return self.__profiler.phase(name)
+
     def logging_start_write(self, extra_message_list=None):
         log_entry_list = [
             self.__get_format_name_message(),
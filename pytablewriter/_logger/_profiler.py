@@ -0,0 +1,316 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import contextlib
+from collections import OrderedDict, namedtuple
+from timeit import default_timer
+
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+PhaseProfile = namedtuple("PhaseProfile", "name elapsed_time row_count allocated_memory")
+PhaseProfile.__doc__ = """
+Profile of a phase of writing a table.
+
+- ``name``: Name of the phase.
+- ``elapsed_time``: Wall time of the phase in seconds.
+- ``row_count``: Number of rows processed by the phase.
+  |None| if the phase processes columns instead of rows.
+- ``allocated_memory``: Increase of memory blocks allocated by Python during the phase
+  in bytes. |None| if memory profiling is disabled.
+"""
+
+
+class WriteProfile(object):
+    """
+    Profile of writing a table.
+    Phases of the same name (e.g. the phases of each iteration of
+    :py:meth:`~pytablewriter.writer._table_writer.AbstractTableWriter.write_table_iter`)
+    are accumulated to a phase.
+    The ``write`` phase is the elapsed time except the preprocess phases:
+    emitting and flushing tables to the stream.
+    """
+
+    WRITE_PHASE_NAME = "write"
+
+    @property
+    def format_name(self):
+        return self.__format_name
+
+    @property
+    def table_name(self):
+        return self.__table_name
+
+    @property
+    def elapsed_time(self):
+        """
+        :return: Total wall time of writing the table in seconds.
+        :rtype: float
+        """
+
+        return self.__elapsed_time
+
+    @property
+    def row_count(self):
+        """
+        :return: Number of value rows written.
+        :rtype: int
+        """
+
+        return self.__row_count
+
+    @property
+    def peak_memory(self):
+        """
+        :return:
+            Peak increase of memory blocks allocated by Python while writing in bytes.
+            |None| if memory profiling is disabled.
+        """
+
+        return self.__peak_memory
+
+    @property
+    def phase_list(self):
+        """
+        :return: Profiles of phases in the order of execution.
+        :rtype: list of |PhaseProfile|
+        """
+
+        return self.__phase_list
+
+    def __init__(self, format_name, table_name, elapsed_time, row_count, peak_memory, phase_list):
+        self.__format_name = format_name
+        self.__table_name = table_name
+        self.__elapsed_time = elapsed_time
+        self.__row_count = row_count
+        self.__peak_memory = peak_memory
+        self.__phase_list = phase_list
+
+    def __repr__(self):
+        return "WriteProfile({})".format(
+            ", ".join(
+                [
+                    "format={}".format(self.format_name),
+                    "table-name={}".format(self.table_name),
+                    "elapsed={:.6f}".format(self.elapsed_time),
+                    "rows={}".format(self.row_count),
+                    "phases=[{}]".format(
+                        ", ".join(
+                            [
+                                "{}={:.6f}".format(phase.name, phase.elapsed_time)
+                                for phase in self.phase_list
+                            ]
+                        )
+                    ),
+                ]
+            )
+        )
+
+    def get_phase(self, name):
+        """
+        :param str name: Name of a phase.
+        :return: Profile of the phase. |None| if the phase not executed.
+        :rtype: |PhaseProfile|
+        """
+
+        for phase in self.phase_list:
+            if phase.name == name:
+                return phase
+
+        return None
+
+    def as_dict(self):
+        """
+        :return: The profile as a dictionary that can be serialized to JSON.
+        :rtype: dict
+        """
+
+        return OrderedDict(
+            [
+                ("format_name", self.format_name),
+                ("table_name", self.table_name),
+                ("elapsed_time", self.elapsed_time),
+                ("row_count", self.row_count),
+                ("peak_memory", self.peak_memory),
+                ("phases", [phase._asdict() for phase in self.phase_list]),
+            ]
+        )
+
+
+class _PhaseRecord(object):
+    def __init__(self):
+        self.elapsed_time = 0.0
+        self.row_count = None
+        self.allocated_memory = None
+
+    def add_row_count(self, row_count):
+        self.row_count = (self.row_count or 0) + row_count
+
+    def add_allocated_memory(self, allocated_memory):
+        self.allocated_memory = (self.allocated_memory or 0) + allocated_memory
+
+
+class WriterProfiler(object):
+    """
+    Record wall time, row counts, and allocated memory for each phase of writing tables.
+    A profile covers the outermost write of nested writes
+    (e.g. all of the iterations of ``write_table_iter``).
+    """
+
+    @property
+    def profile(self):
+        """
+        :return: Profile of the latest write. |None| if no profile recorded.
+        :rtype: |WriteProfile|
+        """
+
+        return self.__profile
+
+    @property
+    def is_enabled(self):
+        return bool(getattr(self.__writer, "is_profiling", False))
+
+    def __init__(self, writer):
+        self.__writer = writer
+        self.__profile = None
+        self.__depth = 0
+        self.__is_recording = False
+
+    def __enter__(self):
+        self.__depth += 1
+
+        if self.__depth == 1 and self.is_enabled:
+            self.__start()
+
+        return self
+
+    def __exit__(self, *exc):
+        self.__depth -= 1
+
+        if self.__depth == 0 and self.__is_recording:
+            self.__complete()
+
+        return False
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.__is_recording:
+            yield
+            return
+
+        record = self.__get_phase_record(name)
+        start_memory = self.__get_current_memory()
+        start_time = default_timer()
+
+        try:
+            yield
+        finally:
+            elapsed_time = default_timer() - start_time
+            record.elapsed_time += elapsed_time
+            self.__preprocess_time += elapsed_time
+
+            if start_memory is not None:
+                record.add_allocated_memory(self.__get_current_memory() - start_memory)
+
+    def add_row_count(self, name, row_count):
+        if not self.__is_recording:
+            return
+
+        self.__get_phase_record(name).add_row_count(row_count)
+
+    def __get_phase_record(self, name):
+        try:
+            return self.__phase_record_map[name]
+        except KeyError:
+            pass
+
+        record = self.__phase_record_map[name] = _PhaseRecord()
+
+        return record
+
+    def __get_current_memory(self):
+        if not self.__is_profile_memory:
+            return None
+
+        current_memory, _peak_memory = tracemalloc.get_traced_memory()
+
+        return current_memory
+
+    def __start(self):
+        self.__is_recording = True
+        self.__phase_record_map = OrderedDict()
+        self.__preprocess_time = 0.0
+        self.__is_profile_memory = tracemalloc is not None and bool(
+            getattr(self.__writer, "is_profile_memory", False)
+        )
+        self.__is_stop_tracemalloc = False
+
+        if self.__is_profile_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__is_stop_tracemalloc = True
+
+        if self.__is_profile_memory and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        self.__start_memory = self.__get_current_memory()
+        self.__start_time = default_timer()
+
+    def __complete(self):
+        elapsed_time = default_timer() - self.__start_time
+        self.__is_recording = False
+
+        if self.__is_profile_memory:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            peak_memory -= self.__start_memory
+            write_allocated_memory = (
+                current_memory
+                - self.__start_memory
+                - sum([record.allocated_memory or 0 for record in self.__phase_record_map.values()])
+            )
+        else:
+            peak_memory = None
+            write_allocated_memory = None
+
+        if self.__is_stop_tracemalloc:
+            tracemalloc.stop()
+
+        write_record = self.__phase_record_map.pop(WriteProfile.WRITE_PHASE_NAME, _PhaseRecord())
+        phase_list = []
+        for name, record in self.__phase_record_map.items():
+            phase_list.append(
+                PhaseProfile(name, record.elapsed_time, record.row_count, record.allocated_memory)
+            )
+
+        # rows are counted by writers as they are written
+        row_count = write_record.row_count or 0
+        phase_list.append(
+            PhaseProfile(
+                WriteProfile.WRITE_PHASE_NAME,
+                max(elapsed_time - self.__preprocess_time, 0.0),
+                row_count,
+                write_allocated_memory,
+            )
+        )
+
+        writer = self.__writer
+        self.__profile = WriteProfile(
+            format_name=writer.format_name,
+            table_name=writer.table_name,
+            elapsed_time=elapsed_time,
+            row_count=row_count,
+            peak_memory=peak_memory,
+            phase_list=phase_list,
+        )
+
+        callback = getattr(writer, "profile_callback", None)
+        if callback is not None:
+            callback(self.__profile)
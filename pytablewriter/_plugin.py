@@ -0,0 +1,175 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import importlib
+
+import six
+
+from ._table_format import FormatAttr
+
+
+#: Entry point group to discover writer plugins.
+PLUGIN_ENTRY_POINT_GROUP = "pytablewriter.writers"
+
+
+class WriterPlugin(object):
+    """
+    Definition of a table format provided by a third-party writer class.
+    The plugin has the same properties as |TableFormat|,
+    and can be registered to |TableWriterFactory| with
+    :py:meth:`~pytablewriter.TableWriterFactory.register` or an entry point of the
+    ``pytablewriter.writers`` group that refers to a plugin instance:
+
+    .. code-block:: python
+
+        # setup.py of a plugin package
+        setup(
+            ...
+            entry_points={
+                "pytablewriter.writers": ["parquet = ptw_parquet.plugin:PLUGIN"],
+            },
+        )
+
+        # ptw_parquet/plugin.py: keep the module lightweight
+        from pytablewriter import FormatAttr, WriterPlugin
+
+        PLUGIN = WriterPlugin(
+            name_list=["parquet"],
+            writer_class="ptw_parquet.writer:ParquetTableWriter",
+            format_attribute=FormatAttr.FILE | FormatAttr.BIN,
+            file_extension_list=["parquet"],
+        )
+
+    :param list name_list: Format names of the writer.
+    :param writer_class:
+        Table writer class, or an import path of the class in ``"module:attribute"`` format.
+        The module of an import path is not imported until the writer is created.
+    :param int format_attribute: Bitmap of |FormatAttr| of the format.
+    :param list file_extension_list: File extensions of the format.
+    """
+
+    @property
+    def name(self):
+        return self.__name_list[0]
+
+    @property
+    def name_list(self):
+        return self.__name_list
+
+    @property
+    def writer_class(self):
+        if self.__writer_class is None:
+            self.__writer_class = self.__import_writer_class()
+
+        return self.__writer_class
+
+    @property
+    def format_attribute(self):
+        return self.__format_attribute
+
+    @property
+    def file_extension_list(self):
+        return self.__file_extension_list
+
+    def __init__(
+        self,
+        name_list,
+        writer_class,
+        format_attribute=FormatAttr.FILE | FormatAttr.TEXT,
+        file_extension_list=None,
+    ):
+        if isinstance(name_list, six.string_types):
+            name_list = [name_list]
+        if not name_list:
+            raise ValueError("name_list must not be empty")
+
+        self.__name_list = [name.strip().lower() for name in name_list]
+        self.__format_attribute = format_attribute
+        self.__file_extension_list = [
+            file_extension.strip().lstrip(".").lower()
+            for file_extension in (file_extension_list or [])
+        ]
+
+        if isinstance(writer_class, six.string_types):
+            self.__writer_class = None
+            self.__writer_class_path = writer_class
+        else:
+            self.__writer_class = writer_class
+            self.__writer_class_path = None
+
+    def __repr__(self):
+        return "WriterPlugin(name_list={}, writer_class={}, file_extension_list={})".format(
+            self.name_list,
+            self.__writer_class_path or self.__writer_class.__name__,
+            self.file_extension_list,
+        )
+
+    def __import_writer_class(self):
+        module_name, _sep, attr_path = self.__writer_class_path.partition(":")
+        if not attr_path:
+            module_name, _sep, attr_path = self.__writer_class_path.rpartition(".")
+        if not module_name or not attr_path:
+            raise ValueError(
+                "invalid writer class path: expected='module:attribute', actual={}".format(
+                    self.__writer_class_path
+                )
+            )
+
+        writer_class = importlib.import_module(module_name)
+        for attr_name in attr_path.split("."):
+            writer_class = getattr(writer_class, attr_name)
+
+        return writer_class
+
+
+def _iter_entry_points(group):
+    try:
+        from importlib import metadata
+    except ImportError:
+        import pkg_resources
+
+        return pkg_resources.iter_entry_points(group)
+
+    try:
+        return metadata.entry_points(group=group)
+    except TypeError:
+        # Python 3.8/3.9 do not support selection by the group
+        return metadata.entry_points().get(group, [])
+
+
+def load_entry_point_plugins(group=PLUGIN_ENTRY_POINT_GROUP):
+    """
+    Load |WriterPlugin| instances that registered as entry points.
+    Invalid entry points are logged and ignored.
+
+    :return: Loaded plugins.
+    :rtype: list
+    """
+
+    from ._logger import logger
+
+    plugin_list = []
+
+    for entry_point in _iter_entry_points(group):
+        try:
+            plugin = entry_point.load()
+        except Exception as e:
+            logger.error("failed to load a writer plugin: {}: {}".format(entry_point.name, e))
+            continue
+
+        if not isinstance(plugin, WriterPlugin):
+            logger.error(
+                "invalid writer plugin: {}: expected=WriterPlugin, actual={}".format(
+                    entry_point.name, type(plugin).__name__
+                )
+            )
+            continue
+
+        plugin_list.append(plugin)
+
+    return plugin_list
@@ -7,33 +7,7 @@
 from __future__ import absolute_import, unicode_literals
 
 import enum
-
-from .writer import (
-    CsvTableWriter,
-    ElasticsearchWriter,
-    ExcelXlsTableWriter,
-    ExcelXlsxTableWriter,
-    HtmlTableWriter,
-    JavaScriptTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    NullTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    SqliteTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-)
+import importlib
 
 
 class FormatAttr(object):
@@ -59,6 +33,17 @@ class FormatAttr(object):
     #: Can call API for external service.
     API = 1 << 6
 
+    #: Writer can write a table in chunks (``write_table_iter``).
+    SPLIT_WRITE = 1 << 7
+
+    #: Writer pads cells to the column widths:
+    #: requires scanning all of the values of a table before writing.
+    WIDTH_SCAN = 1 << 8
+
+    #: Writer can write rows as they arrive from an iterable
+    #: (``write_table_stream``).
+    STREAM_WRITE = 1 << 9
+
     SECONDARY_EXT = 1 << 10
     SECONDARY_NAME = 1 << 11
 
@@ -69,130 +54,157 @@ class TableFormat(enum.Enum):
     Enum to represent table format attributes.
     """
 
-    CSV = ([CsvTableWriter.FORMAT_NAME], CsvTableWriter, FormatAttr.FILE | FormatAttr.TEXT, ["csv"])
-    ELASTICSEARCH = ([ElasticsearchWriter.FORMAT_NAME], ElasticsearchWriter, FormatAttr.API, [])
+    CSV = (
+        ["csv"],
+        "CsvTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.STREAM_WRITE,
+        ["csv"],
+    )
+    ELASTICSEARCH = (
+        ["elasticsearch"],
+        "ElasticsearchWriter",
+        FormatAttr.API | FormatAttr.SPLIT_WRITE,
+        [],
+    )
     EXCEL_XLS = (
-        [ExcelXlsTableWriter.FORMAT_NAME],
-        ExcelXlsTableWriter,
-        FormatAttr.FILE | FormatAttr.BIN | FormatAttr.SECONDARY_NAME,
+        ["excel"],
+        "ExcelXlsTableWriter",
+        FormatAttr.FILE | FormatAttr.BIN | FormatAttr.SECONDARY_NAME | FormatAttr.SPLIT_WRITE,
         ["xls"],
     )
     EXCEL_XLSX = (
-        [ExcelXlsxTableWriter.FORMAT_NAME],
-        ExcelXlsxTableWriter,
-        FormatAttr.FILE | FormatAttr.BIN,
+        ["excel"],
+        "ExcelXlsxTableWriter",
+        FormatAttr.FILE | FormatAttr.BIN | FormatAttr.SPLIT_WRITE,
         ["xlsx"],
     )
-    HTML = (
-        [HtmlTableWriter.FORMAT_NAME, "htm"],
-        HtmlTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
-        ["html", "htm"],
-    )
+    HTML = (["html", "htm"], "HtmlTableWriter", FormatAttr.FILE | FormatAttr.TEXT, ["html", "htm"])
     JAVASCRIPT = (
-        [JavaScriptTableWriter.FORMAT_NAME, "js"],
-        JavaScriptTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE,
+        ["javascript", "js"],
+        "JavaScriptTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SPLIT_WRITE,
         ["js"],
     )
     JSON = (
-        [JsonTableWriter.FORMAT_NAME],
-        JsonTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["json"],
+        "JsonTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE,
         ["json"],
     )
     JSON_LINES = (
-        [JsonLinesTableWriter.FORMAT_NAME, "jsonl", "ldjson", "ndjson"],
-        JsonLinesTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["json_lines", "jsonl", "ldjson", "ndjson"],
+        "JsonLinesTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.STREAM_WRITE,
         ["jsonl", "ldjson", "ndjson"],
     )
     LATEX_MATRIX = (
-        [LatexMatrixWriter.FORMAT_NAME],
-        LatexMatrixWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["latex_matrix"],
+        "LatexMatrixWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.WIDTH_SCAN,
         ["tex"],
     )
     LATEX_TABLE = (
-        [LatexTableWriter.FORMAT_NAME],
-        LatexTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
+        ["latex_table"],
+        "LatexTableWriter",
+        FormatAttr.FILE
+        | FormatAttr.TEXT
+        | FormatAttr.SECONDARY_EXT
+        | FormatAttr.SPLIT_WRITE
+        | FormatAttr.WIDTH_SCAN,
         ["tex"],
     )
     LTSV = (
-        [LtsvTableWriter.FORMAT_NAME],
-        LtsvTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["ltsv"],
+        "LtsvTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.STREAM_WRITE,
         ["ltsv"],
     )
     MARKDOWN = (
-        [MarkdownTableWriter.FORMAT_NAME, "md"],
-        MarkdownTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["markdown", "md"],
+        "MarkdownTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.WIDTH_SCAN,
         ["md"],
     )
     MEDIAWIKI = (
-        [MediaWikiTableWriter.FORMAT_NAME],
-        MediaWikiTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["mediawiki"],
+        "MediaWikiTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE,
+        [],
+    )
+    NULL = (
+        ["null"],
+        "NullTableWriter",
+        FormatAttr.NONE | FormatAttr.SPLIT_WRITE | FormatAttr.STREAM_WRITE,
         [],
     )
-    NULL = ([NullTableWriter.FORMAT_NAME], NullTableWriter, FormatAttr.NONE, [])
     NUMPY = (
-        [NumpyTableWriter.FORMAT_NAME],
-        NumpyTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SECONDARY_EXT,
+        ["numpy"],
+        "NumpyTableWriter",
+        FormatAttr.FILE
+        | FormatAttr.TEXT
+        | FormatAttr.SOURCECODE
+        | FormatAttr.SECONDARY_EXT
+        | FormatAttr.SPLIT_WRITE,
         ["py"],
     )
     PANDAS = (
-        [PandasDataFrameWriter.FORMAT_NAME],
-        PandasDataFrameWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SECONDARY_EXT,
+        ["pandas"],
+        "PandasDataFrameWriter",
+        FormatAttr.FILE
+        | FormatAttr.TEXT
+        | FormatAttr.SOURCECODE
+        | FormatAttr.SECONDARY_EXT
+        | FormatAttr.SPLIT_WRITE,
         ["py"],
     )
     PYTHON = (
-        [PythonCodeTableWriter.FORMAT_NAME, "py"],
-        PythonCodeTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE,
+        ["python", "py"],
+        "PythonCodeTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SOURCECODE | FormatAttr.SPLIT_WRITE,
         ["py"],
     )
     RST_CSV_TABLE = (
-        [RstCsvTableWriter.FORMAT_NAME, "rst_csv"],
-        RstCsvTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
+        ["rst_csv_table", "rst_csv"],
+        "RstCsvTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT | FormatAttr.SPLIT_WRITE,
         ["rst"],
     )
     RST_GRID_TABLE = (
-        [RstGridTableWriter.FORMAT_NAME, "rst_grid", "rst"],
-        RstGridTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["rst_grid_table", "rst_grid", "rst"],
+        "RstGridTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.WIDTH_SCAN,
         ["rst"],
     )
     RST_SIMPLE_TABLE = (
-        [RstSimpleTableWriter.FORMAT_NAME, "rst_simple"],
-        RstSimpleTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT,
+        ["rst_simple_table", "rst_simple"],
+        "RstSimpleTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SECONDARY_EXT | FormatAttr.WIDTH_SCAN,
         ["rst"],
     )
     SPACE_ALIGNED = (
-        [SpaceAlignedTableWriter.FORMAT_NAME],
-        SpaceAlignedTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
+        ["space_aligned"],
+        "SpaceAlignedTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.WIDTH_SCAN,
         [],
     )
     SQLITE = (
-        [SqliteTableWriter.FORMAT_NAME],
-        SqliteTableWriter,
-        FormatAttr.FILE | FormatAttr.BIN,
+        ["sqlite"],
+        "SqliteTableWriter",
+        FormatAttr.FILE | FormatAttr.BIN | FormatAttr.SPLIT_WRITE,
         ["sqlite", "sqlite3"],
     )
     TOML = (
-        [TomlTableWriter.FORMAT_NAME],
-        TomlTableWriter,
-        FormatAttr.FILE | FormatAttr.TEXT,
         ["toml"],
+        "TomlTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE,
+        ["toml"],
+    )
+    TSV = (
+        ["tsv"],
+        "TsvTableWriter",
+        FormatAttr.FILE | FormatAttr.TEXT | FormatAttr.SPLIT_WRITE | FormatAttr.STREAM_WRITE,
+        ["tsv"],
     )
-    TSV = ([TsvTableWriter.FORMAT_NAME], TsvTableWriter, FormatAttr.FILE | FormatAttr.TEXT, ["tsv"])
 
     @property
     def name_list(self):
@@ -211,7 +223,8 @@ class TableFormat(enum.Enum):
             :py:class:`~pytablewriter.writer._table_writer.TableWriterInterface`
         """
 
-        return self.__writer_class
+        # writer classes are imported at the first access to reduce the import time
+        return getattr(importlib.import_module(".writer", __package__), self.__writer_class_name)
 
     @property
     def format_attribute(self):
@@ -231,9 +244,9 @@ class TableFormat(enum.Enum):
 
         return self.__file_extension_list
 
-    def __init__(self, name_list, writer_class, format_attribute, file_extension_list):
+    def __init__(self, name_list, writer_class_name, format_attribute, file_extension_list):
         self.__name_list = name_list
-        self.__writer_class = writer_class
+        self.__writer_class_name = writer_class_name
         self.__format_attribute = format_attribute
         self.__file_extension_list = file_extension_list
 
@@ -2,29 +2,40 @@
 
 from __future__ import absolute_import
 
-from ._elasticsearch import ElasticsearchWriter
-from ._null import NullTableWriter
-from .binary import ExcelXlsTableWriter, ExcelXlsxTableWriter, SqliteTableWriter
-from .text import (
-    CsvTableWriter,
-    HtmlTableWriter,
-    JsonLinesTableWriter,
-    JsonTableWriter,
-    LatexMatrixWriter,
-    LatexTableWriter,
-    LtsvTableWriter,
-    MarkdownTableWriter,
-    MediaWikiTableWriter,
-    RstCsvTableWriter,
-    RstGridTableWriter,
-    RstSimpleTableWriter,
-    SpaceAlignedTableWriter,
-    TomlTableWriter,
-    TsvTableWriter,
-)
-from .text.sourcecode import (
-    JavaScriptTableWriter,
-    NumpyTableWriter,
-    PandasDataFrameWriter,
-    PythonCodeTableWriter,
+from .._lazy import create_lazy_attr_loader as _create_lazy_attr_loader
+
+
+_LAZY_MODULE_ATTR_MAP = {
+    "._elasticsearch": ["ElasticsearchWriter"],
+    "._null": ["NullTableWriter"],
+    ".binary": ["ExcelXlsTableWriter", "ExcelXlsxTableWriter", "SqliteTableWriter"],
+    ".text": [
+        "CsvTableWriter",
+        "HtmlTableWriter",
+        "JsonLinesTableWriter",
+        "JsonTableWriter",
+        "LatexMatrixWriter",
+        "LatexTableWriter",
+        "LtsvTableWriter",
+        "MarkdownTableWriter",
+        "MediaWikiTableWriter",
+        "RstCsvTableWriter",
+        "RstGridTableWriter",
+        "RstSimpleTableWriter",
+        "SpaceAlignedTableWriter",
+        "TomlTableWriter",
+        "TsvTableWriter",
+    ],
+    ".text.sourcecode": [
+        "JavaScriptTableWriter",
+        "NumpyTableWriter",
+        "PandasDataFrameWriter",
+        "PythonCodeTableWriter",
+    ],
+}
+
+__all__ = tuple(
+    attr_name for attr_name_list in _LAZY_MODULE_ATTR_MAP.values() for attr_name in attr_name_list
 )
+
+__getattr__, __dir__ = _create_lazy_attr_loader(__name__, globals(), _LAZY_MODULE_ATTR_MAP)
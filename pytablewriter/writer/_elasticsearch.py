@@ -16,6 +16,10 @@ from typepy import Typecode
 from ._table_writer import AbstractTableWriter
 
 
+# index settings applied while loading documents: disable periodic refresh and replicas
+BULK_LOAD_INDEX_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+
+
 class ElasticsearchWriter(AbstractTableWriter):
     """
     A table writer class for Elasticsearch.
@@ -31,9 +35,44 @@ class ElasticsearchWriter(AbstractTableWriter):
 
         Specify document type for indices. Defaults to ``"table"``.
 
+    .. py:attribute:: bulk_chunk_size
+
+        The maximum number of documents sent to Elasticsearch
+        in a bulk API request. Defaults to ``500``.
+
+    .. py:attribute:: bulk_max_chunk_bytes
+
+        The maximum size of a bulk API request in bytes.
+        Defaults to ``104857600`` (100 MiB).
+
+    .. py:attribute:: bulk_thread_count
+
+        The number of threads that send bulk API requests in parallel.
+        Requests are sent one by one from the calling thread if the value is ``1``.
+        Defaults to ``1``.
+
+    .. py:attribute:: bulk_error_list
+
+        Documents that failed to be indexed by the latest write.
+        Each item is a result item of the bulk API for a document
+        (e.g. ``{"index": {"_index": ..., "status": 400, "error": {...}}}``).
+
+    .. py:attribute:: is_optimize_bulk_load
+
+        If |True|, disable refresh and replicas of the index
+        (``refresh_interval: -1``, ``number_of_replicas: 0``) while loading documents.
+        The settings are restored and the index is refreshed when the load completes:
+        settings of an index created by the writer are reset to the defaults of
+        the cluster, and settings of an existing index are set back to the values
+        before the load. Defaults to |True|.
+
     .. py:method:: write_table()
 
-        Create an index and put documents for each row to Elasticsearch.
+        Create an index and put documents for each row to Elasticsearch
+        with the bulk API.
+        The index is created once for
+        :py:meth:`~pytablewriter.writer._table_writer.AbstractTableWriter.write_table_iter`
+        from the mappings of the first chunk.
 
         You need to pass an
         `elasticsearch.Elasticsearch <https://elasticsearch-py.rtfd.io/en/master/api.html#elasticsearch>`__
@@ -96,6 +135,13 @@ class ElasticsearchWriter(AbstractTableWriter):
         self._dp_extractor.type_value_map = copy.deepcopy(dataproperty.DefaultValue.TYPE_VALUE_MAP)
 
         self.document_type = "table"
+        self.bulk_chunk_size = 500
+        self.bulk_max_chunk_bytes = 100 * 1024 * 1024
+        self.bulk_thread_count = 1
+        self.bulk_error_list = []
+        self.is_optimize_bulk_load = True
+
+        self.__restore_settings = None
 
     def write_null_line(self):
         pass
@@ -162,6 +208,16 @@ class ElasticsearchWriter(AbstractTableWriter):
 
             yield dict(zip(self.header_list, value_list))
 
+    def _get_actions(self):
+        for body in self._get_body():
+            yield {"_index": self.index_name, "_type": self.document_type, "_source": body}
+
+    def _write_table_iter(self, chunk_size=None):
+        try:
+            super(ElasticsearchWriter, self)._write_table_iter(chunk_size)
+        finally:
+            self.__finish_load()
+
     def _write_table(self):
         import elasticsearch as es
 
@@ -171,23 +227,108 @@ class ElasticsearchWriter(AbstractTableWriter):
         self._verify_value_matrix()
         self._preprocess()
 
-        mappings = self._get_mappings()
+        if self.__restore_settings is None:
+            # the index is created once from the first chunk for write_table_iter.
+            self.bulk_error_list = []
+            self.__restore_settings = self.__create_index()
+
+        if self._iter_count is not None:
+            self.__bulk()
+            return
+
+        try:
+            self.__bulk()
+        finally:
+            self.__finish_load()
+
+    def __create_index(self):
+        import elasticsearch as es
+
+        body = self._get_mappings()
+        if self.is_optimize_bulk_load:
+            body["settings"] = {"index": dict(BULK_LOAD_INDEX_SETTINGS)}
 
         try:
-            result = self.stream.indices.create(index=self.index_name, body=mappings)
+            result = self.stream.indices.create(index=self.index_name, body=body)
             self._logger.logger.debug(result)
         except es.TransportError as e:
-            if e.error == "index_already_exists_exception":
-                # ignore already existing index
-                self._logger.logger.debug(msgfy.to_error_message(e))
-            else:
+            if e.error not in (
+                "index_already_exists_exception",
+                "resource_already_exists_exception",
+            ):
                 raise
 
-        for body in self._get_body():
-            try:
-                self.stream.index(index=self.index_name, body=body, doc_type=self.document_type)
-            except es.exceptions.RequestError as e:
-                self._logger.logger.error("{}, body={}".format(msgfy.to_error_message(e), body))
+            # ignore already existing index
+            self._logger.logger.debug(msgfy.to_error_message(e))
+
+            if not self.is_optimize_bulk_load:
+                return {}
+
+            restore_settings = self.__get_current_settings()
+            self.stream.indices.put_settings(
+                index=self.index_name, body={"index": dict(BULK_LOAD_INDEX_SETTINGS)}
+            )
+
+            return restore_settings
+
+        if not self.is_optimize_bulk_load:
+            return {}
+
+        # null values reset the settings to the defaults
+        return {key: None for key in BULK_LOAD_INDEX_SETTINGS}
+
+    def __get_current_settings(self):
+        result = self.stream.indices.get_settings(index=self.index_name)
+
+        settings = {}
+        for index_settings in result.values():
+            settings.update(index_settings.get("settings", {}).get("index", {}))
+
+        return {key: settings.get(key) for key in BULK_LOAD_INDEX_SETTINGS}
+
+    def __finish_load(self):
+        restore_settings = self.__restore_settings
+        self.__restore_settings = None
+
+        if not restore_settings:
+            return
+
+        self.stream.indices.put_settings(index=self.index_name, body={"index": restore_settings})
+        self.stream.indices.refresh(index=self.index_name)
+
+    def __bulk(self):
+        from elasticsearch import helpers
+
+        if self.bulk_thread_count > 1:
+            result_iter = helpers.parallel_bulk(
+                self.stream,
+                self._get_actions(),
+                thread_count=self.bulk_thread_count,
+                chunk_size=self.bulk_chunk_size,
+                max_chunk_bytes=self.bulk_max_chunk_bytes,
+                raise_on_error=False,
+            )
+        else:
+            result_iter = helpers.streaming_bulk(
+                self.stream,
+                self._get_actions(),
+                chunk_size=self.bulk_chunk_size,
+                max_chunk_bytes=self.bulk_max_chunk_bytes,
+                raise_on_error=False,
+            )
+
+        error_count = 0
+        for is_success, item in result_iter:
+            if not is_success:
+                self.bulk_error_list.append(item)
+                error_count += 1
+
+        if error_count > 0:
+            self._logger.logger.error(
+                "failed to index {:d} documents to {}: refer to bulk_error_list".format(
+                    error_count, self.index_name
+                )
+            )
 
     def _write_value_row_separator(self):
         pass
@@ -36,6 +36,17 @@ class TableWriterInterface(object):
 
         pass
 
+    @property
+    def support_stream_write(self):
+        """
+        :return:
+            |True| if the writer supported streaming table writing
+            (``write_table_stream`` method).
+        :rtype: bool
+        """
+
+        return False
+
     @abc.abstractmethod
     def write_table(self):  # pragma: no cover
         """
@@ -50,7 +61,7 @@ class TableWriterInterface(object):
     def dumps(self):  # pragma: no cover
         raise NotImplementedError("{} writer did not support dumps method".format(self.format_name))
 
-    def write_table_iter(self):  # pragma: no cover
+    def write_table_iter(self, chunk_size=None):  # pragma: no cover
         """
         Write a table with iteration. "Iteration" means that divide the table
         writing into multiple processes.
@@ -60,6 +71,17 @@ class TableWriterInterface(object):
         - set iterator to the |value_matrix|
         - set the number of iterations to the |iteration_length| attribute
 
+        If ``chunk_size`` is specified, the |value_matrix| is treated as
+        an iterable of rows (e.g. a DB cursor) instead of an iterator of matrices.
+        The rows are divided into chunks that have ``chunk_size`` rows at most,
+        and each chunk written as an iteration.
+        The last iteration is detected automatically in that case,
+        thus |iteration_length| is not required.
+
+        :param int chunk_size:
+            The number of rows to write for each iteration.
+            Defaults to |None| (the |value_matrix| is an iterator of matrices).
+
         Call back function (Optional):
         Callback function is called when for each of the iteration of writing
         a table is completed. To set call back function,
@@ -75,10 +97,43 @@ class TableWriterInterface(object):
             is supporting this method.
         """
 
-        self._write_table_iter()
+        self._write_table_iter(chunk_size)
+
+    @abc.abstractmethod
+    def _write_table_iter(self, chunk_size=None):  # pragma: no cover
+        pass
+
+    def write_table_stream(self):  # pragma: no cover
+        """
+        Write a table with streaming. Each row is converted and written
+        to the |stream| one by one, so the memory usage does not depend on
+        the number of rows in the table.
+        The following are premises to execute this method:
+
+        - set an iterable of rows (e.g. a generator or a DB cursor) to the |value_matrix|
+
+        Column data types are detected from the leading rows of the table.
+        The number of the rows used for the detection can be configured by
+        the ``stream_sample_size`` attribute.
+        Column data types and the number of decimal places are widened when
+        the subsequent rows include other types or more decimal places.
+        Rows already written are not reformatted, so the output may differ
+        from :py:meth:`.write_table` for the rows before the widening.
+
+        :raises pytablewriter.NotSupportedError:
+            If the class does not support this method.
+
+        .. note::
+            Following classes support this method:
+            |CsvTableWriter|, |TsvTableWriter|, |LtsvTableWriter|, |JsonLinesTableWriter|.
+            ``support_stream_write`` attribute return |True| if the class
+            is supporting this method.
+        """
+
+        self._write_table_stream()
 
     @abc.abstractmethod
-    def _write_table_iter(self):  # pragma: no cover
+    def _write_table_stream(self):  # pragma: no cover
         pass
 
     @abc.abstractmethod
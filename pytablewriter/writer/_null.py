@@ -21,6 +21,10 @@ class NullTableWriter(IndentationInterface, TextWriterInterface, TableWriterInte
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return True
+
     def set_indent_level(self, indent_level):
         pass
 
@@ -42,7 +46,10 @@ class NullTableWriter(IndentationInterface, TextWriterInterface, TableWriterInte
     def dumps(self):
         return ""
 
-    def _write_table_iter(self):
+    def _write_table_iter(self, chunk_size=None):
+        pass
+
+    def _write_table_stream(self):
         pass
 
     def close(self):
@@ -0,0 +1,96 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from typepy import Typecode
+
+
+# width of values of the other types are the same as the length of the string representation
+_VARIABLE_WIDTH_TYPECODE_SET = frozenset([Typecode.STRING, Typecode.LIST, Typecode.DICTIONARY])
+_NUMBER_TYPECODE_SET = frozenset([Typecode.INTEGER, Typecode.REAL_NUMBER])
+
+
+class RowItemFormatter(object):
+    """
+    Convert value data properties of a column to row items.
+    Settings that are common to the cells of the column (alignment and styler)
+    are resolved once at the creation of the formatter.
+
+    :param dataproperty.ColumnDataProperty col_dp: Column data property.
+    :param styler: Styler of the column.
+    :param align_to_char:
+        Function that converts a default alignment to the alignment character of the column.
+    :param bool is_padding: Padding cells to the column width if the value is |True|.
+    """
+
+    def __init__(self, col_dp, styler, align_to_char, is_padding):
+        self.__col_dp = col_dp
+        self.__styler = styler
+        self.__align_to_char = align_to_char
+        self.__is_padding = is_padding
+        self.__is_string_column = col_dp.typecode == Typecode.STRING
+        self.__col_align_char = align_to_char(col_dp.align)
+        self.__value_align_char_map = {}
+
+        # format strings of the column: bounded by the alignments and the widths of the column
+        self.__align_format_map = {}
+
+    def to_row_item(self, value_dp):
+        col_dp = self.__col_dp
+
+        return self.__get_align_format(
+            self.__get_align_char(value_dp), self.__get_padding_len(value_dp)
+        ).format(self.__styler.apply(col_dp.dp_to_str(value_dp)))
+
+    def __get_align_format(self, align_char, padding_len):
+        key = (align_char, padding_len)
+
+        try:
+            return self.__align_format_map[key]
+        except KeyError:
+            pass
+
+        if padding_len > 0:
+            align_format = "{:" + align_char + str(padding_len) + "s}"
+        else:
+            align_format = "{:" + align_char + "s}"
+
+        self.__align_format_map[key] = align_format
+
+        return align_format
+
+    def __get_align_char(self, value_dp):
+        if not self.__is_string_column:
+            return self.__col_align_char
+
+        typecode = value_dp.typecode
+        if typecode not in _NUMBER_TYPECODE_SET and not (
+            typecode == Typecode.STRING and value_dp.is_include_ansi_escape
+        ):
+            return self.__col_align_char
+
+        align = value_dp.align
+        try:
+            return self.__value_align_char_map[align]
+        except KeyError:
+            pass
+
+        align_char = self.__align_to_char(align)
+        self.__value_align_char_map[align] = align_char
+
+        return align_char
+
+    def __get_padding_len(self, value_dp):
+        if not self.__is_padding:
+            return 0
+
+        # read the width for each cell: column widths may be extended after the creation
+        col_width = self.__col_dp.ascii_char_width
+        if value_dp.typecode in _VARIABLE_WIDTH_TYPECODE_SET:
+            return value_dp.get_padding_len(col_width)
+
+        return col_width
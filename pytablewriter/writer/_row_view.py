@@ -0,0 +1,179 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import abc
+import re
+
+import six
+from six.moves import range, zip
+
+
+@six.add_metaclass(abc.ABCMeta)
+class AbstractColumnarRowView(object):
+    """
+    Read-only sequence of rows of a columnar data source.
+    Rows are converted from each column on demand by blocks,
+    so the view does not hold an object copy of the whole data source.
+
+    :param int block_size: Number of rows to convert at once.
+    """
+
+    def __init__(self, block_size):
+        self.__block_size = block_size
+
+    @abc.abstractmethod
+    def __len__(self):  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def _to_column_list(self, start, stop):  # pragma: no cover
+        pass
+
+    def __iter__(self):
+        row_count = len(self)
+
+        for start in range(0, row_count, self.__block_size):
+            for row in self.__to_row_list(start, min(start + self.__block_size, row_count)):
+                yield row
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self.__to_row_list(start, max(start, stop))
+
+            return [self[idx] for idx in range(start, stop, step)]
+
+        row_idx = key + len(self) if key < 0 else key
+        if not 0 <= row_idx < len(self):
+            raise IndexError("row index out of range: {}".format(key))
+
+        return self.__to_row_list(row_idx, row_idx + 1)[0]
+
+    def __to_row_list(self, start, stop):
+        column_list = self._to_column_list(start, stop)
+
+        if not column_list:
+            return [[] for _ in range(start, stop)]
+
+        return [list(row) for row in zip(*column_list)]
+
+
+class DataFrameRowView(AbstractColumnarRowView):
+    """
+    Read-only sequence of rows of a :py:class:`pandas.DataFrame`.
+
+    :param pandas.DataFrame dataframe: Source data frame.
+    :param int block_size: Number of rows to convert at once.
+    """
+
+    # dtypes that represent missing values by themselves (e.g. NaN of float columns)
+    __RE_KEEP_MISSING_DTYPE = re.compile("^(float|object)")
+    __RE_DATETIME_DTYPE = re.compile("^datetime64")
+
+    def __init__(self, dataframe, block_size=1024):
+        super(DataFrameRowView, self).__init__(block_size)
+
+        self.__row_count = len(dataframe)
+        self.__series_list = [
+            dataframe.iloc[:, col_idx] for col_idx in range(len(dataframe.columns))
+        ]
+
+    def __len__(self):
+        return self.__row_count
+
+    def _to_column_list(self, start, stop):
+        return [self.__to_value_list(series.iloc[start:stop]) for series in self.__series_list]
+
+    def __to_value_list(self, series):
+        dtype = str(series.dtype)
+
+        if self.__RE_DATETIME_DTYPE.search(dtype):
+            # pandas.Timestamp is not compatible with datetime.datetime at some methods
+            value_list = series.array.to_pydatetime().tolist()
+        else:
+            value_list = series.tolist()
+
+        if self.__RE_KEEP_MISSING_DTYPE.search(dtype):
+            return value_list
+
+        # NaT, pandas.NA, and NaN of categorical/nullable columns
+        for idx, is_missing in enumerate(series.isna().tolist()):
+            if is_missing:
+                value_list[idx] = None
+
+        return value_list
+
+
+class ArrowTableRowView(AbstractColumnarRowView):
+    """
+    Read-only sequence of rows of a :py:class:`pyarrow.Table`.
+
+    :param pyarrow.Table table: Source table.
+    :param int block_size: Number of rows to convert at once.
+    """
+
+    def __init__(self, table, block_size=1024):
+        super(ArrowTableRowView, self).__init__(block_size)
+
+        self.__table = table
+
+    def __len__(self):
+        return self.__table.num_rows
+
+    def _to_column_list(self, start, stop):
+        return [column.to_pylist() for column in self.__table.slice(start, stop - start).columns]
+
+
+class NumpyArrayRowView(AbstractColumnarRowView):
+    """
+    Read-only sequence of rows of a :py:class:`numpy.ndarray`.
+
+    :param numpy.ndarray array: Source two-dimensional array or structured array.
+    :param int block_size: Number of rows to convert at once.
+    """
+
+    def __init__(self, array, block_size=1024):
+        super(NumpyArrayRowView, self).__init__(block_size)
+
+        if array.dtype.names:
+            self.__column_list = [array[name] for name in array.dtype.names]
+        else:
+            self.__column_list = list(array.T)
+
+        self.__row_count = len(array)
+
+    def __len__(self):
+        return self.__row_count
+
+    def _to_column_list(self, start, stop):
+        return [self.__to_value_list(column[start:stop]) for column in self.__column_list]
+
+    @staticmethod
+    def __to_value_list(column):
+        if column.dtype.kind == "M":
+            # tolist of datetime64 with a unit finer than microseconds returns integers
+            column = column.astype("datetime64[us]")
+
+        return column.tolist()
+
+
+def iter_record_batch_rows(record_batch_iter):
+    """
+    Yield rows of record batches one batch at a time.
+
+    :param record_batch_iter:
+        Iterable of :py:class:`pyarrow.RecordBatch`
+        (e.g. :py:class:`pyarrow.RecordBatchReader`).
+    """
+
+    for record_batch in record_batch_iter:
+        column_list = [column.to_pylist() for column in record_batch.columns]
+
+        for row in zip(*column_list):
+            yield list(row)
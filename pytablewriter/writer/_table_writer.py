@@ -7,8 +7,11 @@
 from __future__ import absolute_import, unicode_literals
 
 import abc
+import functools
+import itertools
 import math
 import re
+from decimal import Decimal
 
 import msgfy
 import six
@@ -18,8 +21,8 @@ from six.moves import zip
 from tabledata import TableData, convert_idx_to_alphabet, to_value_matrix
 from typepy import String, Typecode
 
-from .._function import normalize_enum
-from .._logger import WriterLogger
+from .._function import iter_chunk, normalize_enum
+from .._logger import WriterLogger, logger
 from ..error import (
     EmptyHeaderError,
     EmptyTableDataError,
@@ -28,7 +31,16 @@ from ..error import (
     NotSupportedError,
 )
 from ..style import Align, NullStyler, Style, ThousandSeparator
+from ._common import import_error_msg_template
 from ._interface import TableWriterInterface
+from ._row_item_formatter import RowItemFormatter
+from ._row_view import (
+    ArrowTableRowView,
+    DataFrameRowView,
+    NumpyArrayRowView,
+    iter_record_batch_rows,
+)
+from ._vectorized_extractor import VectorizedDataPropertyExtractor
 
 
 _ts_to_flag = {
@@ -38,6 +50,29 @@ _ts_to_flag = {
 }
 
 
+def to_table_dp(dp_extractor, value_matrix, column_dp_list, is_vectorized_type_inference):
+    """
+    :return:
+        A tuple of a |DataProperty| matrix and a |ColumnDataProperty| list
+        of the ``value_matrix``.
+    """
+
+    if is_vectorized_type_inference:
+        extract_result = VectorizedDataPropertyExtractor(dp_extractor).extract(
+            value_matrix, column_dp_list
+        )
+        if extract_result is not None:
+            return extract_result
+
+    try:
+        value_dp_matrix = dp_extractor.to_dp_matrix(value_matrix)
+    except TypeError as e:
+        logger.debug(msgfy.to_error_message(e))
+        value_dp_matrix = []
+
+    return (value_dp_matrix, dp_extractor.to_column_dp_list(value_dp_matrix, column_dp_list))
+
+
 class AbstractTableWriter(TableWriterInterface):
     """
     An abstract base class of table writer classes.
@@ -86,8 +121,77 @@ class AbstractTableWriter(TableWriterInterface):
 
         - first argument: current iteration number (start from ``1``)
         - second argument: a total number of iteration
+
+    .. py:attribute:: is_reuse_inferred_type_hint
+
+        Reuse column data types that detected at the first iteration as type hints
+        for the following iterations if the value is |True|.
+        The columns that detected as integer or real number are the subject of the reuse.
+        This value used in :py:meth:`.write_table_iter` method.
+        (defaults to |False|)
+
+    .. py:attribute:: is_widen_inferred_type_hint
+
+        Detect column data type again for an iteration if the column includes
+        values that cannot be converted to the reused type hint without loss,
+        and update the type hint to the widened column data type.
+        This value is effective only when
+        :py:attr:`.is_reuse_inferred_type_hint` is |True|.
+        (defaults to |True|)
+
+    .. py:attribute:: is_vectorized_type_inference
+
+        Detect data types of columns that consist of numbers (``int``/``float``)
+        with NumPy for the whole column at once instead of value by value
+        if the value is |True|.
+        Other columns are processed as usual.
+        The attribute has no effect if NumPy is not installed.
+        (defaults to |False|)
+
+    .. py:attribute:: stream_sample_size
+
+        The number of leading rows used to detect column data types.
+        This value used in :py:meth:`.write_table_stream` method.
+        (defaults to ``1000``)
+
+    .. py:attribute:: is_profiling
+
+        Record wall time, row counts, and allocated memory for each phase of writing
+        (preprocesses of the table data and emitting to the stream)
+        if the value is |True|.
+        The result is available from :py:attr:`.write_profile` after writing.
+        (defaults to |False|)
+
+    .. py:attribute:: is_profile_memory
+
+        Record memory blocks allocated by Python during each phase with
+        :py:mod:`tracemalloc` when :py:attr:`.is_profiling` is |True|.
+        Tracing memory allocations slows down writing.
+        The attribute has no effect if :py:mod:`tracemalloc` is not available.
+        (defaults to |False|)
+
+    .. py:attribute:: profile_callback
+
+        The value expected to a function that called with a
+        :py:class:`~pytablewriter.WriteProfile` instance
+        for each write completed when :py:attr:`.is_profiling` is |True|.
+        (defaults to |None|)
+        Example, callback function definition is as follows:
+
+        .. code:: python
+
+            def callback_example(profile):
+                if profile.elapsed_time > 1:
+                    print(profile.as_dict())
     """
 
+    # column data types that can be reused as type hints at write_table_iter:
+    # {typecode: types of acceptable values for the type hint}
+    __INFERABLE_TYPECODE_MAP = {
+        Typecode.INTEGER: (typepy.Integer,),
+        Typecode.REAL_NUMBER: (typepy.RealNumber, typepy.Integer),
+    }
+
     @property
     def is_formatting_float(self):
         return self._dp_extractor.is_formatting_float
@@ -100,6 +204,17 @@ class AbstractTableWriter(TableWriterInterface):
         self._dp_extractor.is_formatting_float = value
         self.__clear_preprocess()
 
+    @property
+    def write_profile(self):
+        """
+        :return:
+            Profile of the latest write.
+            |None| if no profile recorded (:py:attr:`.is_profiling` is |False|).
+        :rtype: :py:class:`~pytablewriter.WriteProfile`
+        """
+
+        return self._logger.profiler.profile
+
     @property
     def table_name(self):
         """
@@ -392,6 +507,15 @@ class AbstractTableWriter(TableWriterInterface):
         self.iteration_length = -1
         self.write_callback = lambda _iter_count, _iter_length: None  # NOP
         self._iter_count = None
+        self.is_reuse_inferred_type_hint = False
+        self.is_widen_inferred_type_hint = True
+        self.is_vectorized_type_inference = False
+
+        self.stream_sample_size = 1000
+
+        self.is_profiling = False
+        self.is_profile_memory = False
+        self.profile_callback = None
 
         self.__align_list = []
         self.__align_char_mapping = {
@@ -582,6 +706,15 @@ class AbstractTableWriter(TableWriterInterface):
         - :py:attr:`~.value_matrix`.
         - :py:attr:`~.type_hint_list`.
 
+        Rows of the dataframe are converted from each column on demand.
+        Column type hints are set from the dtypes of the columns
+        (integer, float, bool, datetime64, string, and category).
+        Data types of string/category columns that include missing values
+        are detected from the values.
+        Write with :py:meth:`~.write_table_iter` (``chunk_size`` argument) or
+        :py:meth:`~.write_table_stream` to avoid converting
+        the whole dataframe at once.
+
         :param pandas.DataFrame dataframe: Input dataframe.
 
         :Example:
@@ -589,8 +722,106 @@ class AbstractTableWriter(TableWriterInterface):
         """
 
         self.header_list = list(dataframe.columns.values)
-        self.value_matrix = dataframe.values.tolist()
-        self.type_hint_list = [self.__get_typehint_from_dtype(dtype) for dtype in dataframe.dtypes]
+        self.value_matrix = DataFrameRowView(dataframe)
+
+        type_hint_list = []
+        for col_idx, dtype in enumerate(dataframe.dtypes):
+            type_hint = self.__get_typehint_from_dtype(dtype)
+
+            if type_hint == typepy.String and dataframe.iloc[:, col_idx].hasnans:
+                # string type hint converts missing values to strings
+                type_hint = None
+
+            type_hint_list.append(type_hint)
+
+        self.type_hint_list = type_hint_list
+
+    def from_arrow(self, arrow_source):
+        """
+        Set tabular attributes to the writer from Apache Arrow data.
+        Following attributes are set to the writer by the method:
+
+        - :py:attr:`~.header_list`.
+        - :py:attr:`~.value_matrix`.
+        - :py:attr:`~.type_hint_list`.
+
+        Column type hints are set from the schema of the data
+        (integer, floating point, decimal, boolean, timestamp, and string).
+        Rows are converted from record batches on demand.
+        Write with :py:meth:`~.write_table_iter` (``chunk_size`` argument) or
+        :py:meth:`~.write_table_stream` to avoid converting
+        the whole data at once.
+
+        :param arrow_source:
+            Input data. :py:class:`pyarrow.Table` or
+            :py:class:`pyarrow.RecordBatchReader`.
+            Rows of a ``RecordBatchReader`` are read while writing,
+            and can be written only once.
+        """
+
+        try:
+            import pyarrow  # noqa: W0611
+        except ImportError:
+            raise ImportError(import_error_msg_template.format("arrow"))
+
+        schema = arrow_source.schema
+        if hasattr(arrow_source, "read_next_batch"):
+            self.value_matrix = iter_record_batch_rows(arrow_source)
+            null_count_list = [None] * len(schema)
+        else:
+            self.value_matrix = ArrowTableRowView(arrow_source)
+            null_count_list = [column.null_count for column in arrow_source.columns]
+
+        self.header_list = list(schema.names)
+        self.type_hint_list = [
+            self.__get_typehint_from_arrow_type(field.type, null_count)
+            for field, null_count in zip(schema, null_count_list)
+        ]
+
+    def from_numpy(self, array):
+        """
+        Set tabular attributes to the writer from :py:class:`numpy.ndarray`.
+        Following attributes are set to the writer by the method:
+
+        - :py:attr:`~.header_list` (only for structured arrays).
+        - :py:attr:`~.value_matrix`.
+        - :py:attr:`~.type_hint_list`.
+
+        Headers are set from the field names of a structured array.
+        Column type hints are set from the dtypes of the columns
+        (integer, floating point, bool, datetime64, and unicode string).
+        Rows of the array are converted from each column on demand.
+        Write with :py:meth:`~.write_table_iter` (``chunk_size`` argument) or
+        :py:meth:`~.write_table_stream` to avoid converting
+        the whole array at once.
+
+        :param numpy.ndarray array:
+            Input data. A two-dimensional array or a one-dimensional structured array.
+        :raises ValueError: If the shape of the array is not supported.
+        """
+
+        try:
+            import numpy  # noqa: W0611
+        except ImportError:
+            raise ImportError(import_error_msg_template.format("numpy"))
+
+        field_name_list = array.dtype.names
+        if field_name_list:
+            if array.ndim != 1:
+                raise ValueError(
+                    "structured array must be one-dimensional: ndim={}".format(array.ndim)
+                )
+
+            self.header_list = list(field_name_list)
+            dtype_list = [array.dtype.fields[name][0] for name in field_name_list]
+        else:
+            if array.ndim != 2:
+                raise ValueError("array must be two-dimensional: ndim={}".format(array.ndim))
+
+            dtype_list = [array.dtype] * array.shape[1]
+
+        self.value_matrix = NumpyArrayRowView(array)
+        self.type_hint_list = [self.__get_typehint_from_numpy_dtype(dtype) for dtype in dtype_list]
 
     def from_tablib(self, tablib_dataset):
         """
@@ -608,8 +839,9 @@ class AbstractTableWriter(TableWriterInterface):
         with self._logger:
             self._verify_property()
             self._write_table()
+            self._logger.profiler.add_row_count("write", len(self._table_value_dp_matrix))
 
-    def _write_table_iter(self):
+    def _write_table_iter(self, chunk_size=None):
         if not self.support_split_write:
             raise NotSupportedError("the class not supported the write_table_iter method")
 
@@ -627,56 +859,306 @@ class AbstractTableWriter(TableWriterInterface):
         self._verify_header()
 
         self._logger.logger.debug(
-            "_write_table_iter: iteration-length={:d}".format(self.iteration_length)
+            "_write_table_iter: iteration-length={:d}, chunk-size={}".format(
+                self.iteration_length, chunk_size
+            )
         )
 
+        if chunk_size is None:
+            work_matrix_iter = ((work_matrix, False) for work_matrix in self.value_matrix)
+        elif self.value_matrix is None:
+            work_matrix_iter = iter_chunk([], chunk_size)
+        else:
+            work_matrix_iter = iter_chunk(self.value_matrix, chunk_size)
+
         stash_is_write_header = self.is_write_header
         stach_is_write_opening_row = self.is_write_opening_row
         stash_is_write_closing_row = self.is_write_closing_row
+        stash_type_hint_list = self.type_hint_list
+        inferred_type_hint_list = None
 
         try:
             self.is_write_closing_row = False
             self._iter_count = 1
 
-            for work_matrix in self.value_matrix:
-                is_final_iter = all(
-                    [self.iteration_length > 0, self._iter_count >= self.iteration_length]
+            # profile the iterations as a write
+            with self._logger.profiler:
+                for work_matrix, is_last_chunk in work_matrix_iter:
+                    if chunk_size is None:
+                        is_final_iter = all(
+                            [self.iteration_length > 0, self._iter_count >= self.iteration_length]
+                        )
+                    else:
+                        is_final_iter = is_last_chunk
+
+                    if is_final_iter:
+                        self.is_write_closing_row = True
+
+                    if inferred_type_hint_list is not None:
+                        if self.is_widen_inferred_type_hint:
+                            work_matrix = list(work_matrix)
+                            self.__set_type_hint_list(
+                                self.__widen_type_hint_list(
+                                    inferred_type_hint_list, stash_type_hint_list, work_matrix
+                                )
+                            )
+                        else:
+                            self.__set_type_hint_list(inferred_type_hint_list)
+
+                    self.__set_value_matrix(work_matrix)
+                    self.__clear_preprocess_status()
+
+                    with self._logger:
+                        self._write_table()
+                        self._logger.profiler.add_row_count(
+                            "write", len(self._table_value_dp_matrix)
+                        )
+
+                        if not is_final_iter:
+                            self._write_value_row_separator()
+
+                    self.is_write_opening_row = False
+                    self.is_write_header = False
+
+                    self.write_callback(self._iter_count, self.iteration_length)
+
+                    # update typehint for the next iteration
+                    if self.is_reuse_inferred_type_hint and (
+                        inferred_type_hint_list is None or self.is_widen_inferred_type_hint
+                    ):
+                        inferred_type_hint_list = self.__to_inferred_type_hint_list(
+                            stash_type_hint_list
+                        )
+
+                    if is_final_iter:
+                        break
+
+                    self._iter_count += 1
+        finally:
+            self.is_write_header = stash_is_write_header
+            self.is_write_opening_row = stach_is_write_opening_row
+            self.is_write_closing_row = stash_is_write_closing_row
+            self.__set_type_hint_list(stash_type_hint_list)
+            self._iter_count = None
+
+    @staticmethod
+    def __get_type_hint(type_hint_list, col_idx):
+        try:
+            return type_hint_list[col_idx]
+        except (TypeError, IndexError):
+            return None
+
+    def __to_inferred_type_hint_list(self, base_type_hint_list):
+        type_hint_list = []
+
+        for col_dp in self._column_dp_list:
+            type_hint = self.__get_type_hint(base_type_hint_list, col_dp.column_index)
+
+            if type_hint is None and col_dp.typecode in self.__INFERABLE_TYPECODE_MAP:
+                type_hint = col_dp.type_class
+
+            type_hint_list.append(type_hint)
+
+        return type_hint_list
+
+    def __widen_type_hint_list(self, type_hint_list, base_type_hint_list, value_matrix):
+        widen_type_hint_list = list(type_hint_list)
+
+        for col_idx, type_hint in enumerate(type_hint_list):
+            if self.__get_type_hint(base_type_hint_list, col_idx) is not None:
+                # type hints that specified by users are not the subject of widening
+                continue
+
+            try:
+                typecode = type_hint(None).typecode
+                acceptable_type_list = self.__INFERABLE_TYPECODE_MAP[typecode]
+            except (TypeError, KeyError):
+                continue
+
+            for value_list in value_matrix:
+                try:
+                    value = value_list[col_idx]
+                except (TypeError, IndexError):
+                    continue
+
+                if value is None:
+                    continue
+
+                # check values with typepy only if the built-in conversions are failed
+                if self.__is_builtin_convertible(value, typecode):
+                    continue
+
+                if any(
+                    [
+                        type_class(value, strict_level=1).is_type()
+                        for type_class in acceptable_type_list
+                    ]
+                ):
+                    continue
+
+                self._logger.logger.debug(
+                    "widen type hint: column={}, type-hint={}, value={}".format(
+                        col_idx, type_hint.__name__, value
+                    )
                 )
+                widen_type_hint_list[col_idx] = None
+                break
 
-                if is_final_iter:
-                    self.is_write_closing_row = True
+        return widen_type_hint_list
 
-                self.__set_value_matrix(work_matrix)
-                self.__clear_preprocess_status()
+    @staticmethod
+    def __is_builtin_convertible(value, typecode):
+        if typecode == Typecode.INTEGER:
+            if type(value) in six.integer_types:
+                return True
 
-                with self._logger:
-                    self._write_table()
+            if not isinstance(value, six.string_types):
+                return False
 
-                    if not is_final_iter:
-                        self._write_value_row_separator()
+            try:
+                int(value)
+            except ValueError:
+                return False
 
-                self.is_write_opening_row = False
-                self.is_write_header = False
+            return True
 
-                self.write_callback(self._iter_count, self.iteration_length)
+        if type(value) not in six.integer_types + (float, Decimal) and not isinstance(
+            value, six.string_types
+        ):
+            return False
 
-                # update typehint for the next iteration
-                """
-                if self.type_hint_list is None:
-                    self.__set_type_hint_list([
-                        column_dp.type_class for column_dp in self._column_dp_list
-                    ])
-                """
+        try:
+            value = float(value)
+        except (ValueError, OverflowError):
+            return False
+
+        return not (math.isinf(value) or math.isnan(value))
 
-                if is_final_iter:
-                    break
+    def _write_table_stream(self):
+        if not self.support_stream_write:
+            raise NotSupportedError("the class not supported the write_table_stream method")
 
-                self._iter_count += 1
+        self._verify_table_name()
+        self._verify_stream()
+
+        if self.value_matrix is None:
+            row_iter = iter([])
+        else:
+            row_iter = iter(self.value_matrix)
+
+        # detect column data types from a bounded number of leading rows
+        sample_matrix = list(itertools.islice(row_iter, self.stream_sample_size))
+
+        if all(
+            [typepy.is_empty_sequence(self.header_list), typepy.is_empty_sequence(sample_matrix)]
+        ):
+            raise EmptyTableDataError()
+
+        self._verify_header()
+
+        self._logger.logger.debug(
+            "_write_table_stream: sample-size={:d}".format(self.stream_sample_size)
+        )
+
+        stash_value_matrix = self.value_matrix
+        stash_max_workers = self._dp_extractor.max_workers
+
+        try:
+            self.__set_value_matrix(sample_matrix)
+            self.__clear_preprocess()
+
+            with self._logger:
+                self._preprocess_table_dp()
+                self._preprocess_styler()
+                self._preprocess_table_property()
+                self._preprocess_header()
+
+                self._write_table_head()
+
+                typecode_set_list = [set() for _col_dp in self._column_dp_list]
+                for value_dp_list in self._table_value_dp_matrix:
+                    self.__update_typecode_set_list(typecode_set_list, value_dp_list)
+                    self._write_stream_row(value_dp_list)
+
+                decimal_places_list = [
+                    col_dp.minmax_decimal_places.max_value for col_dp in self._column_dp_list
+                ]
+
+                # avoid to spawn worker processes for each row
+                self._dp_extractor.max_workers = 1
+
+                stream_row_count = 0
+                for value_list in row_iter:
+                    stream_row_count += 1
+                    value_dp_list = self._to_value_dp_list(value_list)
+
+                    if self.__widen_column_dp_list(
+                        typecode_set_list, decimal_places_list, value_dp_list
+                    ):
+                        self.__compile_row_item_formatter_list()
+
+                    self._write_stream_row(value_dp_list)
+
+                self._write_table_tail()
+                self._logger.profiler.add_row_count(
+                    "write", len(self._table_value_dp_matrix) + stream_row_count
+                )
         finally:
-            self.is_write_header = stash_is_write_header
-            self.is_write_opening_row = stach_is_write_opening_row
-            self.is_write_closing_row = stash_is_write_closing_row
-            self._iter_count = None
+            self._dp_extractor.max_workers = stash_max_workers
+            self.__set_value_matrix(stash_value_matrix)
+            self.__clear_preprocess()
+
+    @staticmethod
+    def __update_typecode_set_list(typecode_set_list, value_dp_list):
+        is_updated = False
+
+        for typecode_set, value_dp in zip(typecode_set_list, value_dp_list):
+            if value_dp.typecode in typecode_set:
+                continue
+
+            typecode_set.add(value_dp.typecode)
+            is_updated = True
+
+        return is_updated
+
+    def __widen_column_dp_list(self, typecode_set_list, decimal_places_list, value_dp_list):
+        # widen column data types and the number of decimal places that detected from
+        # the leading rows when a row includes a new type or more decimal places
+        is_updated = False
+
+        for col_idx, (col_dp, typecode_set, value_dp) in enumerate(
+            zip(self._column_dp_list, typecode_set_list, value_dp_list)
+        ):
+            max_decimal_places = decimal_places_list[col_idx]
+            is_new_typecode = value_dp.typecode not in typecode_set
+            is_more_decimal_places = (
+                value_dp.typecode in (Typecode.REAL_NUMBER, Typecode.INTEGER)
+                and value_dp.decimal_places is not None
+                and (max_decimal_places is None or value_dp.decimal_places > max_decimal_places)
+            )
+
+            if not (is_new_typecode or is_more_decimal_places):
+                continue
+
+            typecode_set.add(value_dp.typecode)
+            col_dp.update_body(value_dp)
+            decimal_places_list[col_idx] = col_dp.minmax_decimal_places.max_value
+            is_updated = True
+
+        return is_updated
+
+    def _write_table_head(self):
+        pass
+
+    def _write_table_tail(self):
+        pass
+
+    def _write_stream_row(self, value_dp_list):  # pragma: no cover
+        raise NotImplementedError()
+
+    def _to_value_dp_list(self, value_list):
+        # raise the same errors as write_table for invalid rows
+        return self._dp_extractor.to_dp_matrix(to_value_matrix(self.header_list, [value_list]))[0]
 
     def _get_padding_len(self, column_dp, value_dp=None):
         if not self.is_padding:
@@ -698,11 +1180,7 @@ class AbstractTableWriter(TableWriterInterface):
         return "{:s}"
 
     def _to_row_item(self, col_dp, value_dp):
-        styler = self._styler_list[col_dp.column_index]
-
-        return self.__get_align_format(col_dp, value_dp).format(
-            styler.apply(col_dp.dp_to_str(value_dp))
-        )
+        return self.__row_item_formatter_list[col_dp.column_index].to_row_item(value_dp)
 
     def __get_style(self, col_idx):
         try:
@@ -742,33 +1220,77 @@ class AbstractTableWriter(TableWriterInterface):
     def _get_align_char(self, align):
         return self.__align_char_mapping[align]
 
-    def __get_align_format(self, col_dp, value_dp):
-        if col_dp.typecode == Typecode.STRING and (
-            value_dp.typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER)
-            or value_dp.typecode == Typecode.STRING
-            and value_dp.is_include_ansi_escape
-        ):
-            align_char = self._get_align_char(self._get_align(col_dp.column_index, value_dp.align))
-        else:
-            align_char = self._get_align_char(self._get_align(col_dp.column_index, col_dp.align))
-        format_list = ["{:" + align_char]
-        col_padding_len = self._get_padding_len(col_dp, value_dp)
-        if col_padding_len > 0:
-            format_list.append(str(col_padding_len))
-        format_list.append("s}")
-
-        return "".join(format_list)
+    def __to_align_char(self, col_idx, default_align):
+        return self._get_align_char(self._get_align(col_idx, default_align))
 
     @staticmethod
     def __get_typehint_from_dtype(col_dtype):
+        categories = getattr(col_dtype, "categories", None)
+        if categories is not None:
+            if str(categories.dtype) == "object":
+                return typepy.String
+
+            return AbstractTableWriter.__get_typehint_from_dtype(categories.dtype)
+
         col_dtype = str(col_dtype)
 
-        if re.search("^float", col_dtype):
+        if re.search("^float", col_dtype, re.IGNORECASE):
             return typepy.RealNumber
 
-        if re.search("^int", col_dtype):
+        if re.search("^u?int", col_dtype, re.IGNORECASE):
+            return typepy.Integer
+
+        if re.search("^bool", col_dtype):
+            return typepy.Bool
+
+        if re.search("^datetime64", col_dtype):
+            return typepy.DateTime
+
+        if col_dtype == "string":
+            return typepy.String
+
+        return None
+
+    @staticmethod
+    def __get_typehint_from_numpy_dtype(dtype):
+        if dtype.subdtype is not None:
+            # sub-array fields are written as lists
+            return None
+
+        return {
+            "b": typepy.Bool,
+            "i": typepy.Integer,
+            "u": typepy.Integer,
+            "f": typepy.RealNumber,
+            "M": typepy.DateTime,
+            "U": typepy.String,
+        }.get(dtype.kind)
+
+    @staticmethod
+    def __get_typehint_from_arrow_type(arrow_type, null_count):
+        import pyarrow.types
+
+        if pyarrow.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+
+        if pyarrow.types.is_integer(arrow_type):
             return typepy.Integer
 
+        if pyarrow.types.is_floating(arrow_type) or pyarrow.types.is_decimal(arrow_type):
+            return typepy.RealNumber
+
+        if pyarrow.types.is_boolean(arrow_type):
+            return typepy.Bool
+
+        if pyarrow.types.is_timestamp(arrow_type):
+            return typepy.DateTime
+
+        if pyarrow.types.is_string(arrow_type) or pyarrow.types.is_large_string(arrow_type):
+            # string type hint converts null values to strings:
+            # unknown null count (streaming source) is treated as nullable
+            if null_count == 0:
+                return typepy.String
+
         return None
 
     def _verify_property(self):
@@ -825,12 +1347,7 @@ class AbstractTableWriter(TableWriterInterface):
     def _create_styler(self, style, writer):
         return NullStyler(style, writer)
 
-    def _preprocess_table_dp(self):
-        if self._is_complete_table_dp_preprocess:
-            return
-
-        self._logger.logger.debug("_preprocess_table_dp")
-
+    def _to_value_matrix(self):
         if typepy.is_empty_sequence(self.header_list) and self._use_default_header:
             self.header_list = [
                 convert_idx_to_alphabet(col_idx)
@@ -838,51 +1355,75 @@ class AbstractTableWriter(TableWriterInterface):
             ]
 
         try:
-            self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
-                to_value_matrix(self.header_list, self.__value_matrix_org)
-            )
+            return to_value_matrix(self.header_list, self.__value_matrix_org)
         except TypeError as e:
             self._logger.logger.debug(msgfy.to_error_message(e))
-            self._table_value_dp_matrix = []
+            return []
 
-        self._column_dp_list = self._dp_extractor.to_column_dp_list(
-            self._table_value_dp_matrix, self._column_dp_list
-        )
+    def _preprocess_table_dp(self):
+        if self._is_complete_table_dp_preprocess:
+            return
 
+        with self._logger.profile_phase("preprocess_table_dp"):
+            self._logger.logger.debug("_preprocess_table_dp")
+
+            self._table_value_dp_matrix, self._column_dp_list = to_table_dp(
+                self._dp_extractor,
+                self._to_value_matrix(),
+                self._column_dp_list,
+                self.is_vectorized_type_inference,
+            )
+
+        self._logger.profiler.add_row_count("preprocess_table_dp", len(self._table_value_dp_matrix))
         self._is_complete_table_dp_preprocess = True
 
     def _preprocess_styler(self):
         if self._is_complete_styler_proprocess:
             return
 
-        self._styler_list = []
+        with self._logger.profile_phase("preprocess_styler"):
+            self._styler_list = []
 
-        for col_dp in self._column_dp_list:
-            style = self.__get_style(col_dp.column_index)
+            for col_dp in self._column_dp_list:
+                style = self.__get_style(col_dp.column_index)
 
-            if style is None:
-                style = Style()
+                if style is None:
+                    style = Style()
 
-            self._styler_list.append(self._create_styler(style, self))
+                self._styler_list.append(self._create_styler(style, self))
+
+            self.__compile_row_item_formatter_list()
 
         self._is_complete_styler_proprocess = True
 
+    def __compile_row_item_formatter_list(self):
+        self.__row_item_formatter_list = [
+            RowItemFormatter(
+                col_dp,
+                styler,
+                functools.partial(self.__to_align_char, col_dp.column_index),
+                self.is_padding,
+            )
+            for col_dp, styler in zip(self._column_dp_list, self._styler_list)
+        ]
+
     def _preprocess_table_property(self):
         if self._is_complete_table_property_preprocess:
             return
 
-        self._logger.logger.debug("_preprocess_table_property")
+        with self._logger.profile_phase("preprocess_table_property"):
+            self._logger.logger.debug("_preprocess_table_property")
 
-        if self._iter_count == 1:
-            for column_dp in self._column_dp_list:
-                column_dp.extend_width(int(math.ceil(column_dp.ascii_char_width * 0.25)))
+            if self._iter_count == 1:
+                for column_dp in self._column_dp_list:
+                    column_dp.extend_width(int(math.ceil(column_dp.ascii_char_width * 0.25)))
 
-        for column_dp in self._column_dp_list:
-            try:
-                styler = self._styler_list[column_dp.column_index]
-                column_dp.extend_body_width(styler.additional_char_width)
-            except IndexError:
-                pass
+            for column_dp in self._column_dp_list:
+                try:
+                    styler = self._styler_list[column_dp.column_index]
+                    column_dp.extend_body_width(styler.additional_char_width)
+                except IndexError:
+                    pass
 
         self._is_complete_table_property_preprocess = True
 
@@ -890,14 +1431,15 @@ class AbstractTableWriter(TableWriterInterface):
         if self._is_complete_header_preprocess:
             return
 
-        self._logger.logger.debug("_preprocess_header")
+        with self._logger.profile_phase("preprocess_header"):
+            self._logger.logger.debug("_preprocess_header")
 
-        self._table_header_list = [
-            self._to_header_item(col_dp, header_dp)
-            for col_dp, header_dp in zip(
-                self._column_dp_list, self._dp_extractor.to_header_dp_list()
-            )
-        ]
+            self._table_header_list = [
+                self._to_header_item(col_dp, header_dp)
+                for col_dp, header_dp in zip(
+                    self._column_dp_list, self._dp_extractor.to_header_dp_list()
+                )
+            ]
 
         self._is_complete_header_preprocess = True
 
@@ -905,18 +1447,22 @@ class AbstractTableWriter(TableWriterInterface):
         if self._is_complete_value_matrix_preprocess:
             return
 
-        self._logger.logger.debug(
-            "_preprocess_value_matrix: value-rows={}".format(len(self._table_value_dp_matrix))
-        )
+        with self._logger.profile_phase("preprocess_value_matrix"):
+            self._logger.logger.debug(
+                "_preprocess_value_matrix: value-rows={}".format(len(self._table_value_dp_matrix))
+            )
 
-        self._table_value_matrix = [
-            [
-                self._to_row_item(col_dp, value_dp)
-                for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+            self._table_value_matrix = [
+                [
+                    self._to_row_item(col_dp, value_dp)
+                    for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+                ]
+                for value_dp_list in self._table_value_dp_matrix
             ]
-            for value_dp_list in self._table_value_dp_matrix
-        ]
 
+        self._logger.profiler.add_row_count(
+            "preprocess_value_matrix", len(self._table_value_dp_matrix)
+        )
         self._is_complete_value_matrix_preprocess = True
 
     def _preprocess(self):
@@ -964,6 +1510,7 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._column_dp_list = []
         self._styler_list = []
+        self.__row_item_formatter_list = []
         self._table_header_list = []
         self._table_value_matrix = []
         self._table_value_dp_matrix = []
@@ -0,0 +1,321 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import math
+from decimal import Decimal
+
+from dataproperty import ColumnDataProperty, DataProperty, Format
+from six import text_type
+from six.moves import range, zip
+from typepy import Integer, RealNumber, Typecode
+
+from .._logger import logger
+
+
+# NumPy is imported at the first extraction to reduce the import time of the package
+np = None
+
+
+# integer part of values that exceed the range can not be represented by float without loss
+_MAX_ABS_VALUE = 2 ** 53
+
+# the same thresholds as the decimal places calculation of DataProperty
+_DECIMAL_PLACES_THRESHOLD_LIST = [math.pow(10, exp) for exp in range(-2, 4)]
+_DECIMAL_PLACES_LIST = [6, 5, 4, 3, 2, 1, 1]
+_DECIMAL_PLACES_VALUE_LIST = [Decimal(value) for value in range(max(_DECIMAL_PLACES_LIST) + 1)]
+
+_NUMERIC_TYPE_SET = frozenset([int, float, type(None)])
+_NUMERIC_TYPECODE_LIST = (Typecode.INTEGER, Typecode.REAL_NUMBER)
+
+
+def _import_numpy():
+    global np
+
+    if np is None:
+        try:
+            import numpy
+
+            np = numpy
+        except ImportError:
+            return False
+
+    return True
+
+
+class VectorizedDataPropertyExtractor(object):
+    """
+    Detect data types of numeric columns with NumPy for the whole column at once,
+    and create the same column data properties as ``DataPropertyExtractor``.
+    Columns that can not be processed by the class
+    (non-numeric values, type hints, or custom conversions) are passed through
+    to the ``DataPropertyExtractor``.
+
+    :param dataproperty.DataPropertyExtractor dp_extractor:
+        Extractor that has the settings of a writer.
+    """
+
+    def __init__(self, dp_extractor):
+        self.__dp_extractor = dp_extractor
+
+    def extract(self, value_matrix, previous_column_dp_list=None):
+        """
+        :return:
+            A tuple of a |DataProperty| matrix and a
+            |ColumnDataProperty| list.
+            |None| if the table is not suitable for the vectorized type inference.
+        """
+
+        if not value_matrix or not _import_numpy():
+            return None
+
+        if not self.__is_extractable():
+            return None
+
+        header_dp_list = self.__dp_extractor.to_header_dp_list()
+        col_size = len(value_matrix[0])
+        if header_dp_list and len(header_dp_list) != col_size:
+            return None
+        if any([len(value_list) != col_size for value_list in value_matrix]):
+            return None
+
+        trans_func = self.__dp_extractor.trans_func
+        none_dp = self.__dp_extractor.to_dp(None)
+        column_list = list(zip(*value_matrix))
+        col_dp_source_list = [None] * col_size
+        fallback_col_idx_list = []
+        dp_column_list = [None] * col_size
+
+        for col_idx, data_list in enumerate(column_list):
+            if self.__get_col_type_hint(col_idx) is None:
+                result = self.__to_numeric_column([trans_func(data) for data in data_list], none_dp)
+            else:
+                result = None
+
+            if result is None:
+                fallback_col_idx_list.append(col_idx)
+                continue
+
+            dp_column_list[col_idx] = result[0]
+            col_dp_source_list[col_idx] = result[1:]
+
+        if len(fallback_col_idx_list) == col_size:
+            return None
+
+        logger.debug(
+            "vectorized type inference: columns={}, fallback-columns={}".format(
+                col_size, fallback_col_idx_list
+            )
+        )
+
+        fallback_dp_column_list = self.__to_fallback_dp_column_list(
+            column_list, fallback_col_idx_list
+        )
+        for col_idx, dp_list in zip(fallback_col_idx_list, fallback_dp_column_list):
+            dp_column_list[col_idx] = dp_list
+            col_dp_source_list[col_idx] = (dp_list, None)
+
+        col_dp_list = [
+            self.__to_column_dp(
+                col_idx,
+                header_dp_list[col_idx] if header_dp_list else None,
+                dp_list,
+                decimal_places_list,
+                previous_column_dp_list,
+            )
+            for col_idx, (dp_list, decimal_places_list) in enumerate(col_dp_source_list)
+        ]
+
+        return (list(zip(*dp_column_list)), col_dp_list)
+
+    def __is_extractable(self):
+        extractor = self.__dp_extractor
+
+        if extractor.default_type_hint is not None or extractor.is_escape_html_tag:
+            return False
+
+        for typecode in _NUMERIC_TYPECODE_LIST:
+            if extractor.strict_level_map.get(typecode) != 1:
+                return False
+            if typecode in extractor.type_value_map:
+                return False
+            if extractor.quoting_flags.get(typecode):
+                return False
+
+        return True
+
+    def __get_col_type_hint(self, col_idx):
+        try:
+            return self.__dp_extractor.column_type_hints[col_idx]
+        except (TypeError, IndexError):
+            return None
+
+    def __get_format_flags(self, col_idx):
+        try:
+            return self.__dp_extractor.format_flags_list[col_idx]
+        except (TypeError, IndexError):
+            return Format.NONE
+
+    def __to_numeric_column(self, data_list, none_dp):
+        if not set(map(type, data_list)).issubset(_NUMERIC_TYPE_SET):
+            return None
+
+        value_idx_list = [idx for idx, data in enumerate(data_list) if data is not None]
+        if not value_idx_list:
+            return None
+
+        values = np.array([data_list[idx] for idx in value_idx_list], dtype=np.float64)
+        abs_values = np.abs(values)
+        if not np.all(np.isfinite(values)) or np.any(abs_values >= _MAX_ABS_VALUE):
+            return None
+
+        is_integer_array = np.floor(values) == values
+        integer_digits_array = np.maximum(
+            np.searchsorted(np.power(10.0, np.arange(16)), np.floor(abs_values), side="right"), 1
+        )
+        decimal_places_array = np.zeros(len(values), dtype=np.int64)
+        real_idx_array = np.flatnonzero(~is_integer_array)
+        if real_idx_array.size:
+            decimal_places_array[real_idx_array] = self.__calc_decimal_places(
+                abs_values[real_idx_array]
+            )
+        additional_format_len_array = (values < 0).astype(np.int64)
+        ascii_char_width_array = (
+            integer_digits_array
+            + decimal_places_array
+            + (decimal_places_array > 0)
+            + additional_format_len_array
+        )
+
+        dp_list = [none_dp] * len(data_list)
+        dp_cache = {}
+        for idx, is_integer in zip(value_idx_list, is_integer_array.tolist()):
+            data = data_list[idx]
+            cache_key = (type(data), data)
+
+            try:
+                dp_list[idx] = dp_cache[cache_key]
+            except KeyError:
+                dp_list[idx] = dp_cache[cache_key] = self.__to_dp(
+                    data, Integer if is_integer else RealNumber
+                )
+
+        # feed ColumnDataProperty only the values that determine the column properties
+        sample_idx_set = set()
+        for mask in (is_integer_array, ~is_integer_array):
+            group_idx_array = np.flatnonzero(mask)
+            if not group_idx_array.size:
+                continue
+
+            for metric_array in (values, abs_values, ascii_char_width_array):
+                group_metric_array = metric_array[group_idx_array]
+                sample_idx_set.add(group_idx_array[np.argmax(group_metric_array)])
+                sample_idx_set.add(group_idx_array[np.argmin(group_metric_array)])
+
+        sample_dp_list = [dp_list[value_idx_list[idx]] for idx in sorted(sample_idx_set)]
+        if not self.__dp_extractor.is_formatting_float:
+            # width of real numbers without formatting are not monotonic to the values
+            sample_dp_list.append(
+                max(dp_cache.values(), key=lambda value_dp: len(text_type(value_dp.data)))
+            )
+        if len(value_idx_list) < len(data_list):
+            sample_dp_list.append(none_dp)
+
+        return (
+            dp_list,
+            sample_dp_list,
+            [_DECIMAL_PLACES_VALUE_LIST[value] for value in decimal_places_array.tolist()],
+        )
+
+    @staticmethod
+    def __calc_decimal_places(abs_values):
+        # same as the calculation of DataProperty:
+        # min(the limit depends on the magnitude, number of digits after the decimal point)
+        limit_array = np.array(_DECIMAL_PLACES_LIST)[
+            np.searchsorted(_DECIMAL_PLACES_THRESHOLD_LIST, abs_values, side="right")
+        ]
+
+        text_array = abs_values.astype(np.str_)
+        dot_idx_array = np.char.find(text_array, ".")
+        float_digits_array = np.where(
+            dot_idx_array >= 0, np.char.str_len(text_array) - dot_idx_array - 1, 0
+        )
+        for idx in np.flatnonzero((dot_idx_array < 0) & (np.char.find(text_array, "e-") >= 0)):
+            float_digits_array[idx] = int(text_array[idx].split("e-")[1]) - 1
+
+        return np.minimum(limit_array, float_digits_array)
+
+    def __to_dp(self, data, type_hint):
+        extractor = self.__dp_extractor
+
+        return DataProperty(
+            data,
+            type_hint=type_hint,
+            line_break_handling=extractor.line_break_handling,
+            strip_str=extractor.strip_str_value,
+            float_type=extractor.float_type,
+            datetime_format_str=extractor.datetime_format_str,
+            east_asian_ambiguous_width=extractor.east_asian_ambiguous_width,
+        )
+
+    def __to_fallback_dp_column_list(self, column_list, col_idx_list):
+        if not col_idx_list:
+            return []
+
+        extractor = self.__dp_extractor
+        stash_header_list = extractor.header_list
+        stash_type_hint_list = extractor.column_type_hints
+
+        try:
+            extractor.header_list = []
+            extractor.column_type_hints = [
+                self.__get_col_type_hint(col_idx) for col_idx in col_idx_list
+            ]
+
+            return list(
+                zip(
+                    *extractor.to_dp_matrix(
+                        list(zip(*[column_list[col_idx] for col_idx in col_idx_list]))
+                    )
+                )
+            )
+        finally:
+            extractor.header_list = stash_header_list
+            extractor.column_type_hints = stash_type_hint_list
+
+    def __to_column_dp(
+        self, col_idx, header_dp, dp_list, decimal_places_list, previous_column_dp_list
+    ):
+        extractor = self.__dp_extractor
+        col_dp = ColumnDataProperty(
+            column_index=col_idx,
+            min_width=extractor.min_column_width,
+            format_flags=self.__get_format_flags(col_idx),
+            is_formatting_float=extractor.is_formatting_float,
+            datetime_format_str=extractor.datetime_format_str,
+            east_asian_ambiguous_width=extractor.east_asian_ambiguous_width,
+        )
+        if header_dp is not None:
+            col_dp.update_header(header_dp)
+
+        col_dp.begin_update()
+
+        try:
+            col_dp.merge(previous_column_dp_list[col_idx])
+        except (TypeError, IndexError):
+            pass
+
+        for value_dp in dp_list:
+            col_dp.update_body(value_dp)
+
+        if decimal_places_list is not None:
+            # the mean of decimal places requires the values of all of the cells
+            col_dp.minmax_decimal_places.value_list[:] = decimal_places_list
+
+        col_dp.end_update()
+
+        return col_dp
@@ -2,5 +2,16 @@
 
 from __future__ import absolute_import
 
-from ._excel import ExcelXlsTableWriter, ExcelXlsxTableWriter
-from ._sqlite import SqliteTableWriter
+from ..._lazy import create_lazy_attr_loader as _create_lazy_attr_loader
+
+
+_LAZY_MODULE_ATTR_MAP = {
+    "._excel": ["ExcelXlsTableWriter", "ExcelXlsxTableWriter"],
+    "._sqlite": ["SqliteTableWriter"],
+}
+
+__all__ = tuple(
+    attr_name for attr_name_list in _LAZY_MODULE_ATTR_MAP.values() for attr_name in attr_name_list
+)
+
+__getattr__, __dir__ = _create_lazy_attr_loader(__name__, globals(), _LAZY_MODULE_ATTR_MAP)
@@ -4,23 +4,37 @@ from __future__ import absolute_import, unicode_literals
 
 import abc
 import copy
+import multiprocessing
+import pickle
 
 import dataproperty
+import msgfy
 import typepy
-from six.moves import range
+from six.moves import range, zip
 from typepy import Integer
 
 from .._common import import_error_msg_template
+from .._table_writer import to_table_dp
 from ._excel_workbook import ExcelWorkbookXls, ExcelWorkbookXlsx
 from ._interface import AbstractBinaryTableWriter
 
 
+def _to_table_dp_helper(dp_extractor_pickle, value_matrix, is_vectorized_type_inference):
+    # executed in worker processes: unpickle a snapshot of the writer's extractor
+    dp_extractor = pickle.loads(dp_extractor_pickle)
+    dp_extractor.max_workers = 1
+
+    return to_table_dp(dp_extractor, value_matrix, [], is_vectorized_type_inference)
+
+
 class ExcelTableWriter(AbstractBinaryTableWriter):
     """
     An abstract class of a table writer for Excel file format.
     """
 
     FORMAT_NAME = "excel"
+    MAX_SHEET_NAME_LEN = 31
+    MAX_ROW = None
 
     @property
     def format_name(self):
@@ -100,6 +114,36 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         return self._last_data_col
 
+    @property
+    def max_row(self):
+        """
+        Maximum number of rows (including the header rows) in a worksheet.
+        When a table exceeds the limit, the following rows are written to
+        a new worksheet (named like ``<sheet name>_2``, ``<sheet name>_3``, ...)
+        with the header.
+        Defaults to the row limit of the file format.
+
+        :rtype: int
+        :raises ValueError:
+            If the value is not larger than
+            :py:attr:`~.first_data_row` or exceeds the limit of the file format.
+
+        .. note:: |excel_attr|
+        """
+
+        return self._max_row
+
+    @max_row.setter
+    def max_row(self, value):
+        if value <= self.first_data_row or value > self.MAX_ROW:
+            raise ValueError(
+                "max_row must be in the range of {:d} to {:d}: actual={}".format(
+                    self.first_data_row + 1, self.MAX_ROW, value
+                )
+            )
+
+        self._max_row = value
+
     def __init__(self):
         super(ExcelTableWriter, self).__init__()
 
@@ -118,6 +162,11 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         self._last_data_col = None
 
         self._current_data_row = self._first_data_row
+        self._max_row = self.MAX_ROW
+
+        self.__worksheet_name = None
+        self.__worksheet_count = 0
+        self.__is_repeat_header = False
 
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
         self._quoting_flags[typepy.Typecode.DATETIME] = True
@@ -198,6 +247,9 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         self._stream = self.workbook.add_worksheet(sheet_name)
         self._current_data_row = self._first_data_row
 
+        self.__worksheet_name = self._stream.name
+        self.__worksheet_count = 1
+
     def dump(self, output, close_after_write=True):
         """Write a worksheet to the current workbook.
 
@@ -217,7 +269,84 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
             if close_after_write:
                 self.close()
 
+    def dump_tabledata_list(self, output, tabledata_list, max_workers=None, close_after_write=True):
+        """Write tables to worksheets of a workbook.
+        A worksheet is created for each table, named from the table name.
+
+        Type inference and width computation of the tables are executed in parallel
+        with worker processes, and the worksheets are written in the order of
+        the ``tabledata_list`` as the results arrive.
+
+        Args:
+            output (str):
+                Path to the workbook file to write.
+            tabledata_list (list):
+                List of |TableData| to write.
+            max_workers (int, optional):
+                Maximum number of worker processes.
+                Defaults to the number of CPUs.
+                Tables are processed in the current process if the value is ``1``,
+                or the writer settings can not be pickled (e.g. a lambda ``trans_func``).
+            close_after_write (bool, optional):
+                Close the workbook after write.
+                Defaults to |True|.
+        """
+
+        from concurrent import futures
+
+        if not max_workers:
+            max_workers = multiprocessing.cpu_count()
+
+        if max_workers > 1 and len(tabledata_list) > 1:
+            try:
+                pickle.dumps(self._dp_extractor)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                # settings such as lambda functions can not be sent to worker processes
+                self._logger.logger.debug(
+                    "fallback to serial processing: {}".format(msgfy.to_error_message(e))
+                )
+                max_workers = 1
+        else:
+            max_workers = 1
+
+        self.open(output)
+        try:
+            if max_workers <= 1:
+                for table_data in tabledata_list:
+                    self.from_tabledata(table_data)
+                    self.write_table()
+
+                return
+
+            with futures.ProcessPoolExecutor(max_workers) as executor:
+                future_list = []
+                for table_data in tabledata_list:
+                    # worksheets are created when the results are written
+                    super(ExcelTableWriter, self).from_tabledata(table_data)
+                    value_matrix = self._to_value_matrix()
+                    future_list.append(
+                        executor.submit(
+                            _to_table_dp_helper,
+                            pickle.dumps(self._dp_extractor),
+                            value_matrix,
+                            self.is_vectorized_type_inference,
+                        )
+                    )
+
+                for table_data, future in zip(tabledata_list, future_list):
+                    self.from_tabledata(table_data)
+                    self._table_value_dp_matrix, self._column_dp_list = future.result()
+                    self._is_complete_table_dp_preprocess = True
+                    self.write_table()
+        finally:
+            if close_after_write:
+                self.close()
+
     def _write_table(self):
+        if self._iter_count is None or self._iter_count == 1:
+            # the header is not written for the following chunks of write_table_iter
+            self.__is_repeat_header = self.is_write_header
+
         self._preprocess_table_dp()
         self._preprocess_styler()
         self._preprocess_table_property()
@@ -230,11 +359,16 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
     def _write_value_matrix(self):
         for value_dp_list in self._table_value_dp_matrix:
-            for col_idx, value_dp in enumerate(value_dp_list):
-                self._write_cell(self._current_data_row, col_idx, value_dp)
+            if self._current_data_row >= self.max_row:
+                self.__make_next_worksheet()
 
+            self._write_value_row(self._current_data_row, value_dp_list)
             self._current_data_row += 1
 
+    @abc.abstractmethod
+    def _write_value_row(self, row, value_dp_list):  # pragma: no cover
+        pass
+
     def _get_last_column(self):
         if typepy.is_not_empty_sequence(self.header_list):
             return len(self.header_list) - 1
@@ -244,10 +378,39 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         raise ValueError("data not found")
 
-    def _postprocess(self):
+    def _preprocess_worksheet(self):
+        pass
+
+    def _postprocess_worksheet(self):
         self._last_data_row = self._current_data_row
         self._last_data_col = self._get_last_column()
 
+    def _postprocess(self):
+        self._postprocess_worksheet()
+
+    def __make_next_worksheet(self):
+        self._postprocess_worksheet()
+
+        self.__worksheet_count += 1
+        suffix = "_{:d}".format(self.__worksheet_count)
+        sheet_name = self.__worksheet_name[: self.MAX_SHEET_NAME_LEN - len(suffix)] + suffix
+        self._logger.logger.debug(
+            "exceeded the max row ({:d}) of the worksheet: continue to {}".format(
+                self.max_row, sheet_name
+            )
+        )
+
+        self._stream = self.workbook.add_worksheet(sheet_name)
+        self._current_data_row = self._first_data_row
+        self._preprocess_worksheet()
+
+        stash_is_write_header = self.is_write_header
+        self.is_write_header = self.__is_repeat_header
+        try:
+            self._write_header()
+        finally:
+            self.is_write_header = stash_is_write_header
+
 
 class ExcelXlsTableWriter(ExcelTableWriter):
     """
@@ -269,10 +432,12 @@ class ExcelXlsTableWriter(ExcelTableWriter):
             - |nan|: written as ``NaN``
     """
 
+    MAX_ROW = 65536
+
     def __init__(self):
         super(ExcelXlsTableWriter, self).__init__()
 
-        self.__col_style_table = {}
+        self.__col_style_list = []
 
     def _open(self, workbook_path):
         self._workbook = ExcelWorkbookXls(workbook_path)
@@ -284,58 +449,70 @@ class ExcelXlsTableWriter(ExcelTableWriter):
         for col, value in enumerate(self.header_list):
             self.stream.write(self.first_header_row, col, value)
 
-    def _write_cell(self, row, col, value_dp):
-        if value_dp.typecode in [typepy.Typecode.REAL_NUMBER]:
-            try:
-                cell_style = self.__get_cell_style(col)
-            except ValueError:
-                pass
-            else:
-                self.stream.write(row, col, value_dp.data, cell_style)
-                return
+    def _write_value_row(self, row, value_dp_list):
+        write = self.stream.write
+        col_style_list = self.__col_style_list
+
+        for col, value_dp in enumerate(value_dp_list):
+            if value_dp.typecode is typepy.Typecode.REAL_NUMBER:
+                cell_style = col_style_list[col]
+                if cell_style is not None:
+                    write(row, col, value_dp.data, cell_style)
+                    continue
+
+            write(row, col, value_dp.data)
+
+    def _preprocess_table_property(self):
+        super(ExcelXlsTableWriter, self)._preprocess_table_property()
 
-        self.stream.write(row, col, value_dp.data)
+        self.__col_style_list = [self.__get_cell_style(col_dp) for col_dp in self._column_dp_list]
 
     def _postprocess(self):
         super(ExcelXlsTableWriter, self)._postprocess()
 
-        self.__col_style_table = {}
+        self.__col_style_list = []
 
-    def __get_cell_style(self, col):
+    @staticmethod
+    def __get_cell_style(col_dp):
         try:
             import xlwt
         except ImportError:
             raise ImportError(import_error_msg_template.format("excel"))
 
-        if col in self.__col_style_table:
-            return self.__col_style_table.get(col)
-
-        try:
-            col_dp = self._column_dp_list[col]
-        except KeyError:
-            return {}
-
         if col_dp.typecode not in [typepy.Typecode.REAL_NUMBER]:
-            raise ValueError()
+            return None
 
         if not Integer(col_dp.minmax_decimal_places.max_value).is_type():
-            raise ValueError()
+            return None
 
         float_digit = col_dp.minmax_decimal_places.max_value
         if float_digit <= 0:
-            raise ValueError()
+            return None
 
         num_format_str = "#,{:s}0.{:s}".format("#" * int(float_digit), "0" * int(float_digit))
-        cell_style = xlwt.easyxf(num_format_str=num_format_str)
-        self.__col_style_table[col] = cell_style
 
-        return cell_style
+        return xlwt.easyxf(num_format_str=num_format_str)
 
 
 class ExcelXlsxTableWriter(ExcelTableWriter):
     """
     A table writer class for Excel file format: ``.xlsx`` (newer or equal to Office 2007).
 
+    .. py:attribute:: is_constant_memory
+
+        If |True|, open workbooks in the constant memory mode of ``xlsxwriter``:
+        each row is flushed to a temporary file when a following row is written,
+        so that the memory usage does not grow with the number of rows.
+        Rows must be written in order in the mode.
+        Use with
+        :py:meth:`~pytablewriter.writer._table_writer.AbstractTableWriter.write_table_iter`
+        to write large tables.
+        The workbooks are also opened with the ``use_zip64`` option
+        to allow files larger than 4GB.
+        Set the attribute before calling
+        :py:meth:`~pytablewriter.ExcelXlsxTableWriter.open`.
+        Defaults to |False|.
+
     .. py:method:: write_table()
 
         Write a table to the current opened worksheet.
@@ -353,6 +530,7 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
     """
 
     MAX_CELL_WIDTH = 60
+    MAX_ROW = 1048576
 
     class TableFormat(object):
         HEADER = "header"
@@ -409,11 +587,18 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             self.TableFormat.NAN: self.Default.NAN_FORMAT,
         }
 
-        self.__col_cell_format_cache = {}
-        self.__col_numprops_table = {}
+        self.is_constant_memory = False
+
+        self.__cell_format = None
+        self.__nan_format = None
+        self.__col_number_format_list = []
 
     def _open(self, workbook_path):
-        self._workbook = ExcelWorkbookXlsx(workbook_path)
+        options = {}
+        if self.is_constant_memory:
+            options = {"constant_memory": True, "use_zip64": True}
+
+        self._workbook = ExcelWorkbookXlsx(workbook_path, options)
 
     def _write_header(self):
         if not self.is_write_header or typepy.is_empty_sequence(self.header_list):
@@ -430,59 +615,67 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
                 row=row, col=0, data=[""] * len(self.header_list), cell_format=header_format
             )
 
-    def _write_cell(self, row, col, value_dp):
-        base_props = dict(self.__cell_format_property)
-        format_key = "{:d}_{:s}".format(col, value_dp.typecode.name)
+    def _write_value_row(self, row, value_dp_list):
+        write = self.stream.write
+        write_number = self.stream.write_number
+        cell_format = self.__cell_format
+        nan_format = self.__nan_format
+        col_number_format_list = self.__col_number_format_list
 
-        if value_dp.typecode in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
-            num_props = self.__get_number_property(col)
-            base_props.update(num_props)
-            cell_format = self.__get_cell_format(format_key, base_props)
+        for col, value_dp in enumerate(value_dp_list):
+            typecode = value_dp.typecode
 
-            try:
-                self.stream.write_number(row, col, float(value_dp.data), cell_format)
-                return
-            except TypeError:
-                pass
+            if typecode in (typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER):
+                number_format = col_number_format_list[col]
 
-        if value_dp.typecode is typepy.Typecode.NAN:
-            base_props = dict(self.__nan_format_property)
+                try:
+                    write_number(row, col, float(value_dp.data), number_format)
+                    continue
+                except TypeError:
+                    pass
 
-        cell_format = self.__get_cell_format(format_key, base_props)
-        self.stream.write(row, col, value_dp.data, cell_format)
+                write(row, col, value_dp.data, number_format)
+                continue
 
-    def __get_number_property(self, col):
-        if col in self.__col_numprops_table:
-            return self.__col_numprops_table.get(col)
+            if typecode is typepy.Typecode.NAN:
+                write(row, col, value_dp.data, nan_format)
+                continue
 
-        try:
-            col_dp = self._column_dp_list[col]
-        except KeyError:
-            return {}
+            write(row, col, value_dp.data, cell_format)
 
+    @staticmethod
+    def __get_number_property(col_dp):
         if col_dp.typecode not in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
             return {}
 
-        num_props = {}
         if Integer(col_dp.minmax_decimal_places.max_value).is_type():
             float_digit = col_dp.minmax_decimal_places.max_value
             if float_digit > 0:
-                num_props = {"num_format": "0.{:s}".format("0" * int(float_digit))}
+                return {"num_format": "0.{:s}".format("0" * int(float_digit))}
+
+        return {}
 
-        self.__col_numprops_table[col] = num_props
+    def __preprocess_cell_format(self):
+        # formats of each column are added to the workbook once per table
+        # instead of being looked up for each cell
+        cell_props = self.__cell_format_property
+        number_format_table = {}
+        col_number_format_list = []
 
-        return num_props
+        for col_dp in self._column_dp_list:
+            num_props = self.__get_number_property(col_dp)
+            format_key = tuple(sorted(num_props.items()))
 
-    def __get_cell_format(self, format_key, cell_props):
-        cell_format = self.__col_cell_format_cache.get(format_key)
-        if cell_format is not None:
-            return cell_format
+            if format_key not in number_format_table:
+                number_props = dict(cell_props)
+                number_props.update(num_props)
+                number_format_table[format_key] = self.__add_format(number_props)
 
-        # cache miss
-        cell_format = self.__add_format(cell_props)
-        self.__col_cell_format_cache[format_key] = cell_format
+            col_number_format_list.append(number_format_table[format_key])
 
-        return cell_format
+        self.__cell_format = self.__add_format(cell_props)
+        self.__nan_format = self.__add_format(self.__nan_format_property)
+        self.__col_number_format_list = col_number_format_list
 
     def __add_format(self, dict_property):
         return self.workbook.workbook.add_format(dict_property)
@@ -501,14 +694,27 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
         super(ExcelXlsxTableWriter, self)._preprocess_table_property()
 
         self.__set_cell_width()
+        self.__preprocess_cell_format()
 
-    def _postprocess(self):
-        super(ExcelXlsxTableWriter, self)._postprocess()
+    def _preprocess_worksheet(self):
+        super(ExcelXlsxTableWriter, self)._preprocess_worksheet()
+
+        self.__set_cell_width()
+
+    def _postprocess_worksheet(self):
+        super(ExcelXlsxTableWriter, self)._postprocess_worksheet()
 
         self.stream.autofilter(
-            self.last_header_row, self.first_data_col, self.last_data_row, self.last_data_col
+            self.last_header_row,
+            self.first_data_col,
+            min(self.last_data_row, self.max_row - 1),
+            self.last_data_col,
         )
         self.stream.freeze_panes(self.first_data_row, self.first_data_col)
 
-        self.__col_cell_format_cache = {}
-        self.__col_numprops_table = {}
+    def _postprocess(self):
+        super(ExcelXlsxTableWriter, self)._postprocess()
+
+        self.__cell_format = None
+        self.__nan_format = None
+        self.__col_number_format_list = []
@@ -105,9 +105,10 @@ class ExcelWorkbookXls(ExcelWorkbook):
 
 
 class ExcelWorkbookXlsx(ExcelWorkbook):
-    def __init__(self, file_path):
+    def __init__(self, file_path, options=None):
         super(ExcelWorkbookXlsx, self).__init__(file_path)
 
+        self.__options = options if options else {}
         self.open(file_path)
 
     def open(self, file_path):
@@ -116,7 +117,7 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
         except ImportError:
             raise ImportError(import_error_msg_template.format("excel"))
 
-        self._workbook = xlsxwriter.Workbook(file_path)
+        self._workbook = xlsxwriter.Workbook(file_path, self.__options)
 
     def close(self):
         if self.workbook is None:
@@ -2,13 +2,35 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import re
+from decimal import Decimal
 from os.path import abspath
 
+import six
 import tabledata
+from typepy import Typecode
 
+from ..._function import iter_chunk
 from ._interface import AbstractBinaryTableWriter
 
 
+re_index_name_invalid_chars = re.compile(r"\W+", re.UNICODE)
+
+# SQLite data types of columns for each column data type (others are TEXT)
+SQLITE_TYPE_MAP = {Typecode.INTEGER: "INTEGER", Typecode.REAL_NUMBER: "REAL"}
+
+SQLITE_PRAGMA_PROFILE_MAP = {
+    # trade the durability of the database for the loading speed:
+    # the database file may be corrupted if the process or the OS crashes while writing
+    "fast_load": [
+        ("journal_mode", "MEMORY"),
+        ("synchronous", "OFF"),
+        ("cache_size", -64 * 1024),
+        ("temp_store", "MEMORY"),
+    ]
+}
+
+
 class SqliteTableWriter(AbstractBinaryTableWriter):
     """
     A table writer class for SQLite database.
@@ -25,6 +47,59 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
             If the |value_matrix| is empty.
         :Example:
             :ref:`example-sqlite-table-writer`
+
+    :py:meth:`~.write_table_iter` creates the table once from the column data types
+    of the first iteration, and appends the following iterations to the table.
+
+    .. py:attribute:: batch_size
+        :type: int
+        :value: 10000
+
+        The number of records that inserted into the database at once
+        by a ``executemany`` call.
+        Inserted records are committed every time the number of the records
+        reached the value.
+
+    .. py:attribute:: pragma_profile
+        :type: str
+        :value: None
+
+        Name of a set of ``PRAGMA`` statements that executed before writing tables.
+        ``"fast_load"`` profile speeds up one-shot loading by keeping
+        the rollback journal in memory (``journal_mode=MEMORY``),
+        not waiting for disk writes (``synchronous=OFF``),
+        and enlarging the page cache (``cache_size``).
+        The database file may be corrupted if the process or the OS crashes
+        while writing with the profile.
+        The database settings are not changed if the value is |None|.
+
+    .. py:attribute:: index_list
+        :type: list
+        :value: []
+
+        Indexes to create after writing all of the records of a table.
+        Each item is a column name, or a list of column names for a composite index.
+        Creating indexes after loading the records is faster than
+        inserting records into an indexed table.
+        Index names are generated from the table and column names,
+        with a numeric suffix (e.g. ``_2``) when different indexes get the same name.
+
+    .. py:attribute:: primary_key
+        :type: str
+        :value: None
+
+        A column name, or a list of column names, of the primary key of the tables.
+        SQLite cannot add primary keys to existing tables:
+        the primary key is created as a unique index after writing all of the records.
+        :py:class:`sqlite3.IntegrityError` is raised after writing the records
+        if the records have duplicated primary key values.
+
+    .. py:attribute:: is_analyze
+        :type: bool
+        :value: False
+
+        Execute ``ANALYZE`` for a table after creating indexes of the table
+        if the value is |True|.
     """
 
     FORMAT_NAME = "sqlite"
@@ -37,6 +112,21 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def pragma_profile(self):
+        return self.__pragma_profile
+
+    @pragma_profile.setter
+    def pragma_profile(self, value):
+        if value is not None and value not in SQLITE_PRAGMA_PROFILE_MAP:
+            raise ValueError(
+                "unknown pragma profile: expected={}, actual={}".format(
+                    ", ".join(sorted(SQLITE_PRAGMA_PROFILE_MAP)), value
+                )
+            )
+
+        self.__pragma_profile = value
+
     def __init__(self):
         import copy
         import dataproperty
@@ -52,6 +142,16 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
 
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
 
+        self.batch_size = 10000
+        self.pragma_profile = None
+        self.index_list = []
+        self.primary_key = None
+        self.is_analyze = False
+
+        self.__insert_query = None
+        self.__post_load_query_list = []
+        self.__uncommitted_record_count = 0
+
     def __del__(self):
         self.close()
 
@@ -95,19 +195,160 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
             if close_after_write:
                 self.close()
 
+    def _write_table_iter(self, chunk_size=None):
+        try:
+            super(SqliteTableWriter, self)._write_table_iter(chunk_size)
+            self.__commit()
+            self.__execute_post_load_query()
+        finally:
+            self.__insert_query = None
+            self.__post_load_query_list = []
+
     def _write_table(self):
         self._verify_value_matrix()
-        self._preprocess()
+        self._preprocess_table_dp()
+
+        if self.__insert_query is None:
+            # the table is created once from the first chunk for write_table_iter.
+            # the following chunks are appended to the table.
+            self.__insert_query, self.__post_load_query_list = self.__create_table()
+
+        connection = self.stream.connection
+        record_iter = (
+            [self.__to_sqlite_value(value_dp.data) for value_dp in value_dp_list]
+            for value_dp_list in self._table_value_dp_matrix
+        )
+
+        try:
+            for record_list, _is_last_chunk in iter_chunk(record_iter, self.batch_size):
+                if not record_list:
+                    continue
 
-        table_data = tabledata.TableData(
-            self.table_name,
-            self.header_list,
+                connection.executemany(self.__insert_query, record_list)
+
+                # commit every time inserted records reached the batch size
+                # (across chunks of write_table_iter)
+                self.__uncommitted_record_count += len(record_list)
+                if self.__uncommitted_record_count >= self.batch_size:
+                    self.__commit()
+        except Exception:
+            connection.rollback()
+            self.__uncommitted_record_count = 0
+            raise
+
+        if self._iter_count is None:
+            self.__commit()
+            self.__execute_post_load_query()
+            self.__insert_query = None
+
+    def __create_table(self):
+        from simplesqlite.query import AttrList, Insert
+
+        table_name, attr_name_list = self.__sanitize_names()
+        post_load_query_list = self.__make_post_load_query_list(table_name, attr_name_list)
+        self.__execute_pragma()
+
+        # create the table from column data types that already detected by the writer,
+        # instead of detecting types of the whole data again
+        self.stream.create_table(
+            table_name,
             [
-                [value_dp.data for value_dp in value_dp_list]
-                for value_dp_list in self._table_value_dp_matrix
+                "{} {:s}".format(attr_name, SQLITE_TYPE_MAP.get(col_dp.typecode, "TEXT"))
+                for attr_name, col_dp in zip(AttrList(attr_name_list), self._column_dp_list)
             ],
         )
-        self.stream.create_table_from_tabledata(table_data)
+
+        return (Insert(table_name, AttrList(attr_name_list)).to_query(), post_load_query_list)
+
+    def __make_post_load_query_list(self, table_name, attr_name_list):
+        from simplesqlite.query import Attr, AttrList, Table
+
+        # columns can be specified by either headers or sanitized attribute names
+        attr_name_map = dict(zip(attr_name_list, attr_name_list))
+        attr_name_map.update(zip(self.header_list, attr_name_list))
+
+        index_def_list = [(index, False) for index in self.index_list]
+        if self.primary_key:
+            index_def_list.insert(0, (self.primary_key, True))
+
+        query_list = []
+        index_name_map = {}
+        for index, is_unique in index_def_list:
+            if isinstance(index, six.string_types):
+                index = [index]
+
+            try:
+                index_attr_name_list = [attr_name_map[column] for column in index]
+            except KeyError as e:
+                raise ValueError(
+                    "index column not found in the table: table={}, column={}".format(table_name, e)
+                )
+
+            index_name = re_index_name_invalid_chars.sub(
+                "_",
+                "_".join([table_name] + index_attr_name_list + ["pkey" if is_unique else "index"]),
+            )
+
+            # different definitions may be sanitized to the same name
+            # (e.g. ["a", "b"] and "a_b"): IF NOT EXISTS would skip the latter one
+            index_key = (tuple(index_attr_name_list), is_unique)
+            base_index_name = index_name
+            suffix = 1
+            while index_name_map.setdefault(index_name, index_key) != index_key:
+                suffix += 1
+                index_name = "{}_{:d}".format(base_index_name, suffix)
+
+            query_list.append(
+                "CREATE {unique:s}INDEX IF NOT EXISTS {index} ON {table}({attrs})".format(
+                    unique="UNIQUE " if is_unique else "",
+                    index=Attr(index_name),
+                    table=Table(table_name),
+                    attrs=AttrList(index_attr_name_list),
+                )
+            )
+
+        if self.is_analyze:
+            query_list.append("ANALYZE {}".format(Attr(table_name)))
+
+        return query_list
+
+    def __execute_post_load_query(self):
+        connection = self.stream.connection
+
+        with connection:
+            for query in self.__post_load_query_list:
+                self._logger.logger.debug(query)
+                connection.execute(query)
+
+        self.__post_load_query_list = []
+
+    def __commit(self):
+        self.stream.connection.commit()
+        self.__uncommitted_record_count = 0
+
+    def __sanitize_names(self):
+        from simplesqlite import SQLiteTableDataSanitizer
+
+        table_data = SQLiteTableDataSanitizer(
+            tabledata.TableData(self.table_name, self.header_list, [])
+        ).normalize()
+
+        return (table_data.table_name, table_data.headers)
+
+    def __execute_pragma(self):
+        if self.pragma_profile is None:
+            return
+
+        connection = self.stream.connection
+        for name, value in SQLITE_PRAGMA_PROFILE_MAP[self.pragma_profile]:
+            connection.execute("PRAGMA {:s} = {}".format(name, value))
+
+    @staticmethod
+    def __to_sqlite_value(value):
+        if isinstance(value, Decimal):
+            return float(value)
+
+        return value
 
     def _write_value_row_separator(self):
         pass
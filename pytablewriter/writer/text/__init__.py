@@ -2,15 +2,26 @@
 
 from __future__ import absolute_import
 
-from ._csv import CsvTableWriter
-from ._html import HtmlTableWriter
-from ._json import JsonTableWriter
-from ._jsonlines import JsonLinesTableWriter
-from ._latex import LatexMatrixWriter, LatexTableWriter
-from ._ltsv import LtsvTableWriter
-from ._markdown import MarkdownTableWriter
-from ._mediawiki import MediaWikiTableWriter
-from ._rst import RstCsvTableWriter, RstGridTableWriter, RstSimpleTableWriter
-from ._spacealigned import SpaceAlignedTableWriter
-from ._toml import TomlTableWriter
-from ._tsv import TsvTableWriter
+from ..._lazy import create_lazy_attr_loader as _create_lazy_attr_loader
+
+
+_LAZY_MODULE_ATTR_MAP = {
+    "._csv": ["CsvTableWriter"],
+    "._html": ["HtmlTableWriter"],
+    "._json": ["JsonTableWriter"],
+    "._jsonlines": ["JsonLinesTableWriter"],
+    "._latex": ["LatexMatrixWriter", "LatexTableWriter"],
+    "._ltsv": ["LtsvTableWriter"],
+    "._markdown": ["MarkdownTableWriter"],
+    "._mediawiki": ["MediaWikiTableWriter"],
+    "._rst": ["RstCsvTableWriter", "RstGridTableWriter", "RstSimpleTableWriter"],
+    "._spacealigned": ["SpaceAlignedTableWriter"],
+    "._toml": ["TomlTableWriter"],
+    "._tsv": ["TsvTableWriter"],
+}
+
+__all__ = tuple(
+    attr_name for attr_name_list in _LAZY_MODULE_ATTR_MAP.values() for attr_name in attr_name_list
+)
+
+__getattr__, __dir__ = _create_lazy_attr_loader(__name__, globals(), _LAZY_MODULE_ATTR_MAP)
@@ -26,6 +26,10 @@ class CsvTableWriter(TextTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return True
+
     def __init__(self):
         super(CsvTableWriter, self).__init__()
 
@@ -81,6 +81,7 @@ class HtmlTableWriter(TextTableWriter):
                 pass
 
             self._write_body()
+            self._logger.profiler.add_row_count("write", len(self._table_value_matrix))
 
     def _write_header(self):
         tags = _get_tags_module()
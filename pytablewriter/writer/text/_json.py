@@ -9,19 +9,14 @@ import dataproperty
 import typepy
 from mbstrdecoder import MultiByteStrDecoder
 from six.moves import zip
+from tabledata import to_value_matrix
 from typepy import Typecode
 
-from ..._converter import strip_quote
-from ._common import bool_to_str
+from ._json_backend import create_json_backend
+from ._json_encoder import JsonRowEncoder
 from ._text_writer import IndentationTextTableWriter
 
 
-try:
-    import simplejson as json
-except ImportError:
-    import json
-
-
 class JsonTableWriter(IndentationTextTableWriter):
     """
     A table writer class for JSON format.
@@ -43,6 +38,19 @@ class JsonTableWriter(IndentationTextTableWriter):
             - |None|: written as ``null``
             - |inf|: written as ``Infinity``
             - |nan|: written as ``NaN``
+
+    .. py:attribute:: json_backend
+        :type: str
+        :value: "json"
+
+        Name of the JSON encoder backend:
+        ``"json"`` (``simplejson`` if installed, otherwise the standard library),
+        ``"orjson"``, ``"ujson"``, ``"rapidjson"``, or
+        ``"auto"`` (the first installed one in the order of
+        ``"orjson"``, ``"ujson"``, ``"rapidjson"``, and ``"json"``).
+        Backends other than ``"json"`` fall back to ``"json"`` for values
+        that they cannot encode in the same way.
+        Whitespaces and escaping of non-ASCII characters may differ between backends.
     """
 
     FORMAT_NAME = "json"
@@ -55,6 +63,14 @@ class JsonTableWriter(IndentationTextTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def json_backend(self):
+        return self._json_backend.name
+
+    @json_backend.setter
+    def json_backend(self, value):
+        self._json_backend = create_json_backend(value)
+
     def __init__(self):
         super(JsonTableWriter, self).__init__()
 
@@ -64,65 +80,76 @@ class JsonTableWriter(IndentationTextTableWriter):
         self.char_right_side_row = ","
 
         self._is_require_header = True
-        self._dp_extractor.type_value_map = {
-            Typecode.NONE: "null",
-            Typecode.INFINITY: "Infinity",
-            Typecode.NAN: "NaN",
-        }
+        self._dp_extractor.type_value_map = {Typecode.INFINITY: "Infinity", Typecode.NAN: "NaN"}
         self._dp_extractor.strict_level_map[Typecode.BOOL] = typepy.StrictLevel.MAX
-        self.trans_func = bool_to_str
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
+        self.json_backend = "json"
 
     def write_null_line(self):
         self._verify_stream()
         self.stream.write("\n")
 
     def _write_table(self):
-        self._preprocess_value_matrix()
+        self._preprocess_value_dp_matrix()
 
         with self._logger:
             self._write_opening_row()
             self.inc_indent_level()
 
-            json_text_list = []
-            for json_data in self._table_value_matrix:
-                json_text = json.dumps(json_data, sort_keys=True, indent=4 * self._indent_level)
-                json_text = strip_quote(
-                    json_text, self._dp_extractor.type_value_map.get(Typecode.NONE)
-                )
-                json_text = strip_quote(json_text, "true")
-                json_text = strip_quote(json_text, "false")
-                json_text_list.append(json_text)
-
+            # write rows one by one instead of building the whole JSON text
+            row_encoder = JsonRowEncoder(
+                self.header_list, indent=4 * self._indent_level, json_backend=self._json_backend
+            )
             joint_text = self.char_right_side_row + "\n"
-            json_text = joint_text.join(json_text_list)
-            if all([not self.is_write_closing_row, typepy.is_not_null_string(json_text)]):
-                json_text += joint_text
+            is_first_row = True
+            for value_dp_list in self._table_value_dp_matrix:
+                if is_first_row:
+                    is_first_row = False
+                else:
+                    self.stream.write(joint_text)
 
-            self.stream.write(json_text)
+                self.stream.write(row_encoder.encode(value_dp_list))
+
+            if not is_first_row and not self.is_write_closing_row:
+                self.stream.write(joint_text)
 
             self.dec_indent_level()
             self._write_closing_row()
 
+    def _preprocess_value_dp_matrix(self):
+        if self._is_complete_table_dp_preprocess:
+            return
+
+        with self._logger.profile_phase("preprocess_table_dp"):
+            try:
+                self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
+                    to_value_matrix(self.header_list, self.value_matrix)
+                )
+            except TypeError:
+                self._table_value_dp_matrix = []
+
+        self._logger.profiler.add_row_count("preprocess_table_dp", len(self._table_value_dp_matrix))
+        self._is_complete_table_dp_preprocess = True
+
     def _preprocess_value_matrix(self):
         if self._is_complete_value_matrix_preprocess:
             return
 
-        try:
-            dp_matrix = self._dp_extractor.to_dp_matrix(self.value_matrix)
-        except TypeError:
-            dp_matrix = []
-
-        value_matrix = [[self.__get_data_helper(dp) for dp in dp_list] for dp_list in dp_matrix]
+        self._preprocess_value_dp_matrix()
 
-        self._table_value_matrix = [
-            dict(zip(self.header_list, value_list)) for value_list in value_matrix
-        ]
+        with self._logger.profile_phase("preprocess_value_matrix"):
+            self._table_value_matrix = [
+                dict(zip(self.header_list, [self._get_data_helper(dp) for dp in dp_list]))
+                for dp_list in self._table_value_dp_matrix
+            ]
 
+        self._logger.profiler.add_row_count(
+            "preprocess_value_matrix", len(self._table_value_matrix)
+        )
         self._is_complete_value_matrix_preprocess = True
 
     @staticmethod
-    def __get_data_helper(dp):
+    def _get_data_helper(dp):
         if dp.typecode == Typecode.REAL_NUMBER and isinstance(dp.data, Decimal):
             return float(dp.data)
 
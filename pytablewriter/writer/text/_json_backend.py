@@ -0,0 +1,158 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import importlib
+import math
+
+
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
+
+def _has_non_finite_float(obj):
+    if isinstance(obj, float):
+        return math.isinf(obj) or math.isnan(obj)
+
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+
+    return False
+
+
+class JsonBackend(object):
+    """
+    JSON encoder backend that uses ``simplejson`` if installed,
+    otherwise the ``json`` module of the standard library.
+    Other backends fall back to this backend for values that
+    the backends cannot encode in the same way.
+    """
+
+    NAME = "json"
+    MODULE_NAME = None
+
+    @property
+    def name(self):
+        return self.NAME
+
+    def __init__(self):
+        self._module = importlib.import_module(self.MODULE_NAME) if self.MODULE_NAME else None
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    JSON encoder backend that uses ``orjson``.
+    Compact output has no whitespace between separators,
+    and non-ASCII characters are not escaped.
+    The backend falls back to the ``json`` backend for indents other than two,
+    and for values that ``orjson`` does not support (e.g. |Decimal|),
+    or encodes differently (|nan|/|inf| are encoded as ``null`` by ``orjson``).
+    """
+
+    NAME = "orjson"
+    MODULE_NAME = "orjson"
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        if indent not in (None, 2) or _has_non_finite_float(obj):
+            return super(OrjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+        option = 0
+        if indent:
+            option |= self._module.OPT_INDENT_2
+        if sort_keys:
+            option |= self._module.OPT_SORT_KEYS
+
+        try:
+            return self._module.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError is a subclass of TypeError
+            return super(OrjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+class UjsonBackend(JsonBackend):
+    """
+    JSON encoder backend that uses ``ujson``.
+    The backend falls back to the ``json`` backend for values that
+    ``ujson`` cannot encode (e.g. arbitrary objects),
+    and for |nan|/|inf| to encode them in the same way as the ``json`` backend.
+    """
+
+    NAME = "ujson"
+    MODULE_NAME = "ujson"
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        if _has_non_finite_float(obj):
+            return super(UjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+        try:
+            return self._module.dumps(
+                obj, indent=indent or 0, sort_keys=sort_keys, escape_forward_slashes=False
+            )
+        except (TypeError, ValueError, OverflowError):
+            return super(UjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+class RapidjsonBackend(JsonBackend):
+    """
+    JSON encoder backend that uses ``python-rapidjson``.
+    The backend falls back to the ``json`` backend for values that
+    ``rapidjson`` cannot encode (e.g. |Decimal| and |datetime|),
+    and for |nan|/|inf| to encode them in the same way as the ``json`` backend.
+    """
+
+    NAME = "rapidjson"
+    MODULE_NAME = "rapidjson"
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        if _has_non_finite_float(obj):
+            return super(RapidjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+        try:
+            return self._module.dumps(obj, indent=indent, sort_keys=sort_keys)
+        except (TypeError, ValueError, OverflowError):
+            return super(RapidjsonBackend, self).dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+# in order of preference for the "auto" backend
+JSON_BACKEND_CLASS_LIST = [OrjsonBackend, UjsonBackend, RapidjsonBackend, JsonBackend]
+JSON_BACKEND_NAME_LIST = [backend_class.NAME for backend_class in JSON_BACKEND_CLASS_LIST]
+AUTO_JSON_BACKEND_NAME = "auto"
+
+
+def create_json_backend(name):
+    """
+    :param str name:
+        Name of a JSON backend: ``"orjson"``, ``"ujson"``, ``"rapidjson"``, or ``"json"``.
+        ``"auto"`` selects the first installed backend in the order.
+    :raises ValueError: If the ``name`` is not a valid backend name.
+    :raises ImportError: If the package of the backend is not installed.
+    """
+
+    if name == AUTO_JSON_BACKEND_NAME:
+        for backend_class in JSON_BACKEND_CLASS_LIST:
+            try:
+                return backend_class()
+            except ImportError:
+                continue
+
+    for backend_class in JSON_BACKEND_CLASS_LIST:
+        if name == backend_class.NAME:
+            return backend_class()
+
+    raise ValueError(
+        "unknown JSON backend: expected={}, actual={}".format(
+            ", ".join(JSON_BACKEND_NAME_LIST + [AUTO_JSON_BACKEND_NAME]), name
+        )
+    )
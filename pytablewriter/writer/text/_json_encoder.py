@@ -0,0 +1,133 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+from decimal import Decimal
+
+import six
+from typepy import Typecode
+
+
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
+
+_NON_FINITE_FLOAT_REPR_SET = frozenset(["inf", "-inf", "nan"])
+
+
+class JsonRowEncoder(object):
+    """
+    Encode value data properties of a row to a JSON object text.
+    The output is the same as ``json.dumps(row_dict, sort_keys=True, indent=indent)``:
+    key prefixes are created once at the creation of the encoder,
+    and values are converted to JSON literals according to their typecodes.
+
+    :param list header_list: Keys of JSON objects.
+    :param int indent: Indent width of the object members.
+    :param json_backend: JSON encoder backend for values other than scalar values.
+    """
+
+    def __init__(self, header_list, indent, json_backend):
+        self.__indent = indent
+        self.__json_backend = json_backend
+        self.__nested_line_break = "\n" + " " * indent
+        self.__encode_string = json.encoder.encode_basestring_ascii
+
+        # later columns take precedence for duplicated keys like dict(zip(keys, values))
+        key_col_idx_map = {}
+        for col_idx, key in enumerate(header_list):
+            key_col_idx_map[key] = col_idx
+
+        self.__member_list = [
+            (col_idx, " " * indent + self.__encode_key(key) + ": ")
+            for key, col_idx in sorted(key_col_idx_map.items())
+        ]
+
+        self.__encode_func_map = {
+            Typecode.NONE: self.__encode_none,
+            Typecode.BOOL: self.__encode_bool,
+            Typecode.INTEGER: self.__encode_integer,
+            Typecode.REAL_NUMBER: self.__encode_real_number,
+            Typecode.DATETIME: self.__encode_datetime,
+            Typecode.STRING: self.__encode_str,
+            Typecode.NULL_STRING: self.__encode_str,
+        }
+
+    def encode(self, value_dp_list):
+        encode_func_map = self.__encode_func_map
+        encode_other = self.__encode_other
+
+        return (
+            "{\n"
+            + ",\n".join(
+                [
+                    prefix
+                    + encode_func_map.get(value_dp_list[col_idx].typecode, encode_other)(
+                        value_dp_list[col_idx]
+                    )
+                    for col_idx, prefix in self.__member_list
+                ]
+            )
+            + "\n}"
+        )
+
+    def __encode_key(self, key):
+        if isinstance(key, six.string_types):
+            return self.__encode_string(key)
+
+        return self.__encode_string(six.text_type(key))
+
+    @staticmethod
+    def __encode_none(_value_dp):
+        return "null"
+
+    def __encode_bool(self, value_dp):
+        if value_dp.data is True:
+            return "true"
+        if value_dp.data is False:
+            return "false"
+
+        return self.__encode_other(value_dp)
+
+    def __encode_integer(self, value_dp):
+        if isinstance(value_dp.data, six.integer_types) and not isinstance(value_dp.data, bool):
+            return six.text_type(value_dp.data)
+
+        return self.__encode_other(value_dp)
+
+    def __encode_real_number(self, value_dp):
+        value = value_dp.data
+        if isinstance(value, Decimal):
+            value = float(value)
+
+        if not isinstance(value, float):
+            return self.__encode_other(value_dp)
+
+        text = repr(value)
+        if text in _NON_FINITE_FLOAT_REPR_SET:
+            return json.dumps(value)
+
+        return text
+
+    def __encode_datetime(self, value_dp):
+        return self.__encode_string(value_dp.to_str())
+
+    def __encode_str(self, value_dp):
+        if isinstance(value_dp.data, six.string_types):
+            return self.__encode_string(value_dp.data)
+
+        return self.__encode_other(value_dp)
+
+    def __encode_other(self, value_dp):
+        try:
+            text = self.__json_backend.dumps(value_dp.data, indent=self.__indent, sort_keys=True)
+        except TypeError:
+            return self.__encode_string(value_dp.to_str())
+
+        return text.replace("\n", self.__nested_line_break)
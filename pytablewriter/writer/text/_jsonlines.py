@@ -2,13 +2,11 @@
 
 from __future__ import absolute_import, unicode_literals
 
-from ._json import JsonTableWriter
-
+import typepy
+from six.moves import zip
 
-try:
-    import simplejson as json
-except ImportError:
-    import json
+from ...error import EmptyTableDataError
+from ._json import JsonTableWriter
 
 
 class JsonLinesTableWriter(JsonTableWriter):
@@ -17,6 +15,26 @@ class JsonLinesTableWriter(JsonTableWriter):
 
         :Example:
             :ref:`example-jsonl-writer`
+
+    :py:meth:`~.write_table_stream` of the class converts and writes each row
+    as soon as the row is read from the |value_matrix|:
+    rows are not sampled to detect column data types
+    (``stream_sample_size`` attribute is not used).
+
+    .. py:attribute:: json_backend
+        :type: str
+        :value: "json"
+
+        Name of the JSON encoder backend to encode each line.
+        Refer to :py:attr:`.JsonTableWriter.json_backend` for the available backends.
+
+    .. py:attribute:: stream_flush_interval
+        :type: int
+        :value: None
+
+        Flush the |stream| every time the number of rows written by
+        :py:meth:`~.write_table_stream` reaches the value.
+        Rows are left to the buffering of the |stream| if the value is |None|.
     """
 
     FORMAT_NAME = "json_lines"
@@ -29,6 +47,15 @@ class JsonLinesTableWriter(JsonTableWriter):
     def support_split_write(self):
         return True
 
+    @property
+    def support_stream_write(self):
+        return True
+
+    def __init__(self):
+        super(JsonLinesTableWriter, self).__init__()
+
+        self.stream_flush_interval = None
+
     def write_table(self):
         """
         |write_table| with
@@ -45,4 +72,67 @@ class JsonLinesTableWriter(JsonTableWriter):
             self._preprocess()
 
             for value_list in self._table_value_matrix:
-                self._write_line(json.dumps(value_list))
+                self._write_line(self._json_backend.dumps(value_list))
+
+            self._logger.profiler.add_row_count("write", len(self._table_value_matrix))
+
+    def _write_table_stream(self):
+        # each line is independent of the other rows: write every row as soon as
+        # the row converted, without detecting column data types from leading rows
+        self._verify_table_name()
+        self._verify_stream()
+
+        if all(
+            [
+                typepy.is_empty_sequence(self.header_list),
+                typepy.is_empty_sequence(self.value_matrix),
+            ]
+        ):
+            raise EmptyTableDataError()
+
+        self._verify_header()
+
+        if self.value_matrix is None:
+            row_iter = iter([])
+        else:
+            row_iter = iter(self.value_matrix)
+
+        flush_interval = self.stream_flush_interval
+        flush = getattr(self.stream, "flush", None) if flush_interval else None
+        stash_max_workers = self._dp_extractor.max_workers
+
+        try:
+            # avoid to spawn worker processes for each row
+            self._dp_extractor.max_workers = 1
+
+            with self._logger:
+                stream_row_count = 0
+                for value_list in row_iter:
+                    stream_row_count += 1
+                    self._write_stream_row(self._to_value_dp_list(value_list))
+
+                    if flush is not None and stream_row_count % flush_interval == 0:
+                        flush()
+
+                if flush is not None:
+                    flush()
+
+                self._logger.profiler.add_row_count("write", stream_row_count)
+        finally:
+            self._dp_extractor.max_workers = stash_max_workers
+
+        if self.is_write_null_line_after_table:
+            self.write_null_line()
+
+    def _write_table_head(self):
+        pass
+
+    def _write_table_tail(self):
+        pass
+
+    def _write_stream_row(self, value_dp_list):
+        self._write_line(
+            self._json_backend.dumps(
+                dict(zip(self.header_list, [self._get_data_helper(dp) for dp in value_dp_list]))
+            )
+        )
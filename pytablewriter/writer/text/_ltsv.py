@@ -51,13 +51,18 @@ class LtsvTableWriter(CsvTableWriter):
             self._preprocess()
 
             for value_list in self._table_value_matrix:
-                ltsv_item_list = [
-                    "{:s}:{}".format(pathvalidate.sanitize_ltsv_label(header_name), value)
-                    for header_name, value in zip(self.header_list, value_list)
-                    if typepy.is_not_null_string(value)
-                ]
+                self._write_value_row(value_list, None)
 
-                if typepy.is_empty_sequence(ltsv_item_list):
-                    continue
+            self._logger.profiler.add_row_count("write", len(self._table_value_matrix))
 
-                self._write_line("\t".join(ltsv_item_list))
+    def _write_value_row(self, value_list, value_dp_list):
+        ltsv_item_list = [
+            "{:s}:{}".format(pathvalidate.sanitize_ltsv_label(header_name), value)
+            for header_name, value in zip(self.header_list, value_list)
+            if typepy.is_not_null_string(value)
+        ]
+
+        if typepy.is_empty_sequence(ltsv_item_list):
+            return
+
+        self._write_line("\t".join(ltsv_item_list))
@@ -98,12 +98,13 @@ class MarkdownTableWriter(IndentationTextTableWriter):
             self._verify_property()
             self.__write_chapter()
             self._write_table()
+            self._logger.profiler.add_row_count("write", len(self._table_value_dp_matrix))
             if self.is_write_null_line_after_table:
                 self.write_null_line()
 
-    def _write_table_iter(self):
+    def _write_table_iter(self, chunk_size=None):
         self.__write_chapter()
-        super(MarkdownTableWriter, self)._write_table_iter()
+        super(MarkdownTableWriter, self)._write_table_iter(chunk_size)
 
     def __write_chapter(self):
         if typepy.is_null_string(self.table_name):
@@ -36,6 +36,7 @@ class RstTableWriter(IndentationTextTableWriter):
             self._write_line(self._get_table_directive())
             self._verify_property()
             self._write_table()
+            self._logger.profiler.add_row_count("write", len(self._table_value_dp_matrix))
             if self.is_write_null_line_after_table:
                 self.write_null_line()
 
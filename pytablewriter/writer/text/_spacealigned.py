@@ -30,6 +30,11 @@ class SpaceAlignedTableWriter(CsvTableWriter):
     def format_name(self):
         return self.FORMAT_NAME
 
+    @property
+    def support_stream_write(self):
+        # column widths are not determined until all of the rows are read
+        return False
+
     def __init__(self):
         super(SpaceAlignedTableWriter, self).__init__()
 
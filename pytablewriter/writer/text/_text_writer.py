@@ -185,20 +185,19 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
     def _create_styler(self, style, writer):
         return TextStyler(style, writer)
 
-    def _write_table_iter(self):
-        super(TextTableWriter, self)._write_table_iter()
+    def _write_table_iter(self, chunk_size=None):
+        super(TextTableWriter, self)._write_table_iter(chunk_size)
+        if self.is_write_null_line_after_table:
+            self.write_null_line()
+
+    def _write_table_stream(self):
+        super(TextTableWriter, self)._write_table_stream()
         if self.is_write_null_line_after_table:
             self.write_null_line()
 
     def _write_table(self):
         self._preprocess()
-        self._write_opening_row()
-
-        try:
-            self._write_header()
-            self.__write_header_row_separator()
-        except EmptyHeaderError:
-            pass
+        self._write_table_head()
 
         is_first_value_row = True
         for value_list, value_dp_list in zip(self._table_value_matrix, self._table_value_dp_matrix):
@@ -213,8 +212,29 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             except TypeError:
                 continue
 
+        self._write_table_tail()
+
+    def _write_table_head(self):
+        self._write_opening_row()
+
+        try:
+            self._write_header()
+            self.__write_header_row_separator()
+        except EmptyHeaderError:
+            pass
+
+    def _write_table_tail(self):
         self._write_closing_row()
 
+    def _write_stream_row(self, value_dp_list):
+        self._write_value_row(
+            [
+                self._to_row_item(col_dp, value_dp)
+                for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+            ],
+            value_dp_list,
+        )
+
     def _get_opening_row_item_list(self):
         return self.__get_row_separator_item_list(
             self.__opening_row_cell_format, self.char_opening_row
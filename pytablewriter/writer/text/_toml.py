@@ -50,3 +50,4 @@ class TomlTableWriter(TextTableWriter):
         with self._logger:
             self._verify_property()
             self.stream.write(toml.dumps(self.tabledata.as_dict()))
+            self._logger.profiler.add_row_count("write", len(self.value_matrix))
@@ -1,6 +1,19 @@
 # encoding: utf-8
 
-from ._javascript import JavaScriptTableWriter
-from ._numpy import NumpyTableWriter
-from ._pandas import PandasDataFrameWriter
-from ._python import PythonCodeTableWriter
+from __future__ import absolute_import
+
+from ...._lazy import create_lazy_attr_loader as _create_lazy_attr_loader
+
+
+_LAZY_MODULE_ATTR_MAP = {
+    "._javascript": ["JavaScriptTableWriter"],
+    "._numpy": ["NumpyTableWriter"],
+    "._pandas": ["PandasDataFrameWriter"],
+    "._python": ["PythonCodeTableWriter"],
+}
+
+__all__ = tuple(
+    attr_name for attr_name_list in _LAZY_MODULE_ATTR_MAP.values() for attr_name in attr_name_list
+)
+
+__getattr__, __dir__ = _create_lazy_attr_loader(__name__, globals(), _LAZY_MODULE_ATTR_MAP)
@@ -55,20 +55,24 @@ with open(os.path.join(REQUIREMENT_DIR, "docs_requirements.txt")) as f:
 setuptools_require = ["setuptools>=38.3.0"]
 pytest_runner_require = ["pytest-runner"] if need_pytest() else []
 
+arrow_requires = ["pyarrow>=0.11.0"]
 excel_requires = ["xlwt", "XlsxWriter>=1.1.2,<2.0.0"]
 es6_requires = ["elasticsearch>=6.2.0,<7.0.0"]
 from_requires = ["pytablereader>=0.24.1,<1.0.0"]
 html_requires = ["dominate>=2.3.5,<3.0.0"]
 logging_requires = ["Logbook>=1.1.0,<2.0.0"]
+numpy_requires = ["numpy>=1.10.0"]
 sqlite_requires = ["SimpleSQLite>=0.38.0,<1.0.0"]
 toml_requires = ["toml>=0.9.4,<1.0.0"]
 optional_requires = ["simplejson>=3.16,<4.0"]
 all_requires = (
-    excel_requires
+    arrow_requires
+    + excel_requires
     + es6_requires
     + from_requires
     + html_requires
     + logging_requires
+    + numpy_requires
     + sqlite_requires
     + toml_requires
     + optional_requires
@@ -103,6 +107,7 @@ setuptools.setup(
     tests_require=tests_requires,
     extras_require={
         "all": all_requires,
+        "arrow": arrow_requires,
         "build": ["wheel"],
         "docs": docs_requires,
         "excel": excel_requires,
@@ -111,6 +116,7 @@ setuptools.setup(
         "html": html_requires,
         "from": from_requires,
         "logging": logging_requires,
+        "numpy": numpy_requires,
         "release": ["releasecmd>=0.0.14,<0.1.0"],
         "sqlite": sqlite_requires,
         "test": tests_requires,
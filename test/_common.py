@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import sys
 
+from pytablewriter.writer._vectorized_extractor import VectorizedDataPropertyExtractor
+
 
 def print_test_result(expected, actual, error=None):
     print("[expected]\n{}\n".format(expected))
@@ -17,3 +19,23 @@ def print_test_result(expected, actual, error=None):
         print(error, file=sys.stderr)
 
     print("----------------------------------------")
+
+
+def patch_vectorized_extract(monkeypatch):
+    """
+    :return: List of the results that the vectorized type inference extracted.
+    """
+
+    result_list = []
+    extract = VectorizedDataPropertyExtractor.extract
+
+    def extract_wrapper(self, *args, **kwargs):
+        result = extract(self, *args, **kwargs)
+        if result is not None:
+            result_list.append(result)
+
+        return result
+
+    monkeypatch.setattr(VectorizedDataPropertyExtractor, "extract", extract_wrapper)
+
+    return result_list
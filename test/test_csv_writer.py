@@ -13,6 +13,7 @@ from textwrap import dedent
 
 import pytablewriter as ptw
 import pytest
+from typepy import String
 
 from ._common import print_test_result
 from .data import (
@@ -27,6 +28,28 @@ from .data import (
 )
 
 
+try:
+    import pandas
+
+    SKIP_DATAFRAME_TEST = False
+except ImportError:
+    SKIP_DATAFRAME_TEST = True
+
+try:
+    import numpy
+
+    SKIP_NUMPY_TEST = False
+except ImportError:
+    SKIP_NUMPY_TEST = True
+
+try:
+    import pyarrow
+
+    SKIP_ARROW_TEST = False
+except ImportError:
+    SKIP_ARROW_TEST = True
+
+
 Data = collections.namedtuple("Data", "col_delim header value expected")
 
 normal_test_data_list = [
@@ -200,6 +223,207 @@ class Test_CsvTableWriter_from_csv(object):
         assert out == self.__CSV_EXPECTED
 
 
+@pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+class Test_CsvTableWriter_from_dataframe(object):
+    __EXPECTED = dedent(
+        """\
+        "i","f","bool","time","category","string","nullable_int","object"
+        1,1.5,True,"2017-01-01T00:00:00","a","1",1,"a"
+        2,NaN,False,,,"bb",,
+        3,3.25,True,"2017-01-02T03:04:05","b","ccc",3,1
+        """
+    )
+
+    @staticmethod
+    def __create_dataframe():
+        return pandas.DataFrame(
+            collections.OrderedDict(
+                [
+                    ("i", [1, 2, 3]),
+                    ("f", [1.5, float("nan"), 3.25]),
+                    ("bool", [True, False, True]),
+                    (
+                        "time",
+                        pandas.to_datetime(["2017-01-01 00:00:00", None, "2017-01-02 03:04:05"]),
+                    ),
+                    ("category", pandas.Categorical(["a", None, "b"])),
+                    ("string", pandas.Series(["1", "bb", "ccc"], dtype="string")),
+                    ("nullable_int", pandas.Series([1, None, 3], dtype="Int64")),
+                    ("object", ["a", None, 1]),
+                ]
+            )
+        )
+
+    def test_normal(self):
+        from typepy import Bool, DateTime, Integer, RealNumber
+
+        writer = table_writer_class()
+        writer.from_dataframe(self.__create_dataframe())
+
+        assert writer.type_hint_list == [
+            Integer,
+            RealNumber,
+            Bool,
+            DateTime,
+            None,
+            String,
+            Integer,
+            None,
+        ]
+        assert len(writer.value_matrix) == 3
+        assert writer.value_matrix[1][2:] == [False, None, None, "bb", None, None]
+
+        out = writer.dumps()
+        print_test_result(expected=self.__EXPECTED, actual=out)
+
+        assert out == self.__EXPECTED
+
+    def test_normal_stream(self):
+        writer = table_writer_class()
+        writer.from_dataframe(self.__create_dataframe())
+        writer.stream = io.StringIO()
+        writer.stream_sample_size = 1
+        writer.write_table_stream()
+
+        out = writer.stream.getvalue()
+        print_test_result(expected=self.__EXPECTED, actual=out)
+
+        assert out == self.__EXPECTED
+
+
+@pytest.mark.skipif("SKIP_NUMPY_TEST is True")
+class Test_CsvTableWriter_from_numpy(object):
+    def test_normal_structured_array(self):
+        from typepy import Bool, DateTime, Integer, RealNumber
+
+        array = numpy.array(
+            [
+                (1, 1.5, True, "1", numpy.datetime64("2017-01-01T00:00:00")),
+                (2, numpy.nan, False, "bb", numpy.datetime64("NaT")),
+                (3, 3.25, True, "ccc", numpy.datetime64("2017-01-02T03:04:05.123456789")),
+            ],
+            dtype=[("i", "i8"), ("f", "f8"), ("bool", "?"), ("string", "U3"), ("time", "M8[ns]")],
+        )
+        expected = dedent(
+            """\
+            "i","f","bool","string","time"
+            1,1.5,True,"1","2017-01-01T00:00:00"
+            2,NaN,False,"bb",
+            3,3.25,True,"ccc","2017-01-02T03:04:05"
+            """
+        )
+
+        writer = table_writer_class()
+        writer.from_numpy(array)
+
+        assert writer.header_list == ["i", "f", "bool", "string", "time"]
+        assert writer.type_hint_list == [Integer, RealNumber, Bool, String, DateTime]
+        assert len(writer.value_matrix) == 3
+
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(["chunk_size"], [[1], [2], [100]])
+    def test_normal_2d_array(self, capsys, chunk_size):
+        from typepy import Integer
+
+        expected = dedent(
+            """\
+            "a","b","c"
+            0,1,2
+            3,4,5
+            """
+        )
+
+        writer = table_writer_class()
+        writer.header_list = ["a", "b", "c"]
+        writer.from_numpy(numpy.arange(6, dtype="u2").reshape(2, 3))
+
+        assert writer.type_hint_list == [Integer, Integer, Integer]
+
+        writer.write_table_iter(chunk_size=chunk_size)
+
+        out, _err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(["shape", "expected"], [[(3,), ValueError], [(2, 2, 2), ValueError]])
+    def test_exception(self, shape, expected):
+        writer = table_writer_class()
+
+        with pytest.raises(expected):
+            writer.from_numpy(numpy.zeros(shape))
+
+
+@pytest.mark.skipif("SKIP_ARROW_TEST is True")
+class Test_CsvTableWriter_from_arrow(object):
+    __EXPECTED = dedent(
+        """\
+        "i","f","bool","time","string","nullable_string"
+        1,1.5,True,"2017-01-01T00:00:00","a","a"
+        2,,False,,"bb",
+        3,3.25,True,"2017-01-02T03:04:05","ccc","c"
+        """
+    )
+
+    @staticmethod
+    def __create_table():
+        import datetime
+
+        return pyarrow.Table.from_arrays(
+            [
+                pyarrow.array([1, 2, 3]),
+                pyarrow.array([1.5, None, 3.25]),
+                pyarrow.array([True, False, True]),
+                pyarrow.array(
+                    [datetime.datetime(2017, 1, 1), None, datetime.datetime(2017, 1, 2, 3, 4, 5)],
+                    type=pyarrow.timestamp("s"),
+                ),
+                pyarrow.array(["a", "bb", "ccc"]),
+                pyarrow.array(["a", None, "c"]),
+            ],
+            names=["i", "f", "bool", "time", "string", "nullable_string"],
+        )
+
+    def test_normal_table(self):
+        from typepy import Bool, DateTime, Integer, RealNumber
+
+        writer = table_writer_class()
+        writer.from_arrow(self.__create_table())
+
+        assert writer.header_list == ["i", "f", "bool", "time", "string", "nullable_string"]
+        assert writer.type_hint_list == [Integer, RealNumber, Bool, DateTime, String, None]
+        assert len(writer.value_matrix) == 3
+        assert writer.value_matrix[-1][0] == 3
+
+        out = writer.dumps()
+        print_test_result(expected=self.__EXPECTED, actual=out)
+
+        assert out == self.__EXPECTED
+
+    @pytest.mark.parametrize(["chunk_size"], [[1], [2], [100]])
+    def test_normal_record_batch_reader(self, capsys, chunk_size):
+        table = self.__create_table()
+        reader = pyarrow.RecordBatchReader.from_batches(
+            table.schema, table.to_batches(max_chunksize=2)
+        )
+
+        writer = table_writer_class()
+        writer.from_arrow(reader)
+
+        assert writer.type_hint_list[-2:] == [None, None]
+
+        writer.write_table_iter(chunk_size=chunk_size)
+
+        out, _err = capsys.readouterr()
+        print_test_result(expected=self.__EXPECTED, actual=out)
+
+        assert out == self.__EXPECTED
+
+
 class Test_CsvTableWriter_write_table(object):
     @pytest.mark.parametrize(
         ["col_delim", "header", "value", "expected"],
@@ -221,6 +445,28 @@ class Test_CsvTableWriter_write_table(object):
         assert out == expected
         assert writer.dumps() == expected
 
+    @pytest.mark.parametrize(
+        ["col_delim", "header", "value", "expected"],
+        [
+            [data.col_delim, data.header, data.value, data.expected]
+            for data in normal_test_data_list
+        ],
+    )
+    def test_normal_vectorized_type_inference(self, capsys, col_delim, header, value, expected):
+        pytest.importorskip("numpy")
+
+        writer = table_writer_class()
+        writer.column_delimiter = col_delim
+        writer.header_list = header
+        writer.value_matrix = value
+        writer.is_vectorized_type_inference = True
+        writer.write_table()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
     @pytest.mark.parametrize(
         ["header", "value", "expected"],
         [[data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -268,6 +514,139 @@ class Test_CsvTableWriter_write_table_iter(object):
 
         assert out == expected
 
+    @pytest.mark.parametrize(
+        ["header", "value", "chunk_size", "expected"],
+        [
+            [
+                ["ha", "hb", "hc"],
+                itertools.chain.from_iterable(value_matrix_iter),
+                chunk_size,
+                dedent(
+                    """\
+                "ha","hb","hc"
+                1,2,3
+                11,12,13
+                1,2,3
+                11,12,13
+                101,102,103
+                1001,1002,1003
+                """
+                ),
+            ]
+            for chunk_size in [1, 4, 6, 7]
+        ],
+    )
+    def test_normal_chunk_size(self, capsys, header, value, chunk_size, expected):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = value
+        writer.write_table_iter(chunk_size=chunk_size)
+
+        out, _err = capsys.readouterr()
+
+        assert out == expected
+
+    @pytest.mark.parametrize(["chunk_size", "expected"], [[0, ValueError], [-1, ValueError]])
+    def test_exception_chunk_size(self, chunk_size, expected):
+        writer = table_writer_class()
+        writer.header_list = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix
+
+        with pytest.raises(expected):
+            writer.write_table_iter(chunk_size=chunk_size)
+
+    @pytest.mark.parametrize(
+        ["type_hint", "is_widen", "expected"],
+        [
+            [
+                None,
+                True,
+                dedent(
+                    """\
+                    "i","f","s"
+                    1,1.5,"a"
+                    2,2.5,"b"
+                    3,3.5,"c"
+                    4.5,4,"d"
+                    True,"x",1
+                    """
+                ),
+            ],
+            [
+                None,
+                False,
+                dedent(
+                    """\
+                    "i","f","s"
+                    1,1.5,"a"
+                    2,2.5,"b"
+                    3,3.5,"c"
+                    4,4,"d"
+                    1,"x",1
+                    """
+                ),
+            ],
+            [
+                [None, None, String],
+                True,
+                dedent(
+                    """\
+                    "i","f","s"
+                    1,1.5,"a"
+                    2,2.5,"b"
+                    3,3.5,"c"
+                    4.5,4,"d"
+                    True,"x","1"
+                    """
+                ),
+            ],
+        ],
+    )
+    def test_normal_reuse_inferred_type_hint(self, capsys, type_hint, is_widen, expected):
+        writer = table_writer_class()
+        writer.header_list = ["i", "f", "s"]
+        writer.type_hint_list = type_hint
+        writer.value_matrix = iter(
+            [[1, 1.5, "a"], [2, 2.5, "b"], [3, 3.5, "c"], [4.5, 4, "d"], [True, "x", 1]]
+        )
+        writer.is_reuse_inferred_type_hint = True
+        writer.is_widen_inferred_type_hint = is_widen
+        writer.write_table_iter(chunk_size=2)
+
+        out, _err = capsys.readouterr()
+
+        assert out == expected
+        assert writer.type_hint_list == type_hint
+
+    def test_normal_reuse_inferred_type_hint_type_check_count(self, monkeypatch):
+        from typepy.type._base import AbstractType
+
+        is_type = AbstractType.is_type
+        value_matrix = [[i, i * 0.5, str(i * 3)] for i in range(300)]
+        type_check_count_map = {}
+
+        for is_reuse in [False, True]:
+            type_check_count = [0]
+
+            def count_is_type(self):
+                type_check_count[0] += 1
+                return is_type(self)
+
+            monkeypatch.setattr(AbstractType, "is_type", count_is_type)
+
+            writer = table_writer_class()
+            writer.stream = io.StringIO()
+            writer.header_list = ["i", "f", "s"]
+            writer.value_matrix = value_matrix
+            writer.is_reuse_inferred_type_hint = is_reuse
+            writer.write_table_iter(chunk_size=30)
+
+            monkeypatch.setattr(AbstractType, "is_type", is_type)
+            type_check_count_map[is_reuse] = type_check_count[0]
+
+        # widening checks must not cost more than the type detection that the reuse skips
+        assert type_check_count_map[True] < type_check_count_map[False]
+
     @pytest.mark.parametrize(
         ["header", "value", "expected"],
         [[data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -279,3 +658,74 @@ class Test_CsvTableWriter_write_table_iter(object):
 
         with pytest.raises(expected):
             writer.write_table_iter()
+
+
+class Test_CsvTableWriter_write_table_stream(object):
+    @pytest.mark.parametrize(
+        ["col_delim", "header", "value", "sample_size", "expected"],
+        [
+            [data.col_delim, data.header, data.value, sample_size, data.expected]
+            for data, sample_size in itertools.product(normal_test_data_list, [1, 1000])
+        ],
+    )
+    def test_normal(self, capsys, col_delim, header, value, sample_size, expected):
+        writer = table_writer_class()
+        writer.column_delimiter = col_delim
+        writer.header_list = header
+        writer.value_matrix = (row for row in value)
+        writer.stream_sample_size = sample_size
+        writer.write_table_stream()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    def test_normal_widen_decimal_places(self):
+        writer = table_writer_class()
+        writer.is_formatting_float = True
+        writer.header_list = ["i", "f", "s"]
+        writer.value_matrix = iter(
+            [[1, 1.1, "a"], [2, 2.123, "b"], [3, 3.12345, "c"], [4, 0.5, "d"]]
+        )
+        writer.stream = io.StringIO()
+        writer.stream_sample_size = 1
+        writer.write_table_stream()
+
+        expected = dedent(
+            """\
+            "i","f","s"
+            1,1.1,"a"
+            2,2.123,"b"
+            3,3.123,"c"
+            4,0.500,"d"
+            """
+        )
+        out = writer.stream.getvalue()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(
+        ["header", "value", "expected"],
+        [[data.header, data.value, data.expected] for data in exception_test_data_list],
+    )
+    def test_exception(self, header, value, expected):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = value
+
+        with pytest.raises(expected):
+            writer.write_table_stream()
+
+    @pytest.mark.parametrize(["sample_size"], [[1], [1000]])
+    def test_exception_invalid_row(self, sample_size):
+        from tabledata import DataError
+
+        writer = table_writer_class()
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = iter([[1, 2], 5, None, [3]])
+        writer.stream_sample_size = sample_size
+
+        with pytest.raises(DataError):
+            writer.write_table_stream()
@@ -192,3 +192,190 @@ class Test_ElasticsearchWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class BulkStubClient(object):
+    def __init__(self, failed_index_list=()):
+        self.failed_index_list = failed_index_list
+        self.request_list = []
+        self.doc_count = 0
+        self.index_request_list = []
+        self.existing_index_settings = None
+
+    def bulk(self, body, *args, **kwargs):
+        line_list = [json.loads(line) for line in body.splitlines() if line]
+        action_list = line_list[0::2]
+        source_list = line_list[1::2]
+        self.request_list.append(source_list)
+
+        item_list = []
+        for action in action_list:
+            status = 400 if self.doc_count in self.failed_index_list else 201
+            item = {"_index": action["index"]["_index"], "status": status}
+            if status >= 300:
+                item["error"] = {"type": "mapper_parsing_exception"}
+
+            item_list.append({"index": item})
+            self.doc_count += 1
+
+        return {"took": 1, "errors": len(self.failed_index_list) > 0, "items": item_list}
+
+    def create(self, index, body=None, *args, **kwargs):
+        import elasticsearch
+
+        self.index_request_list.append(("create", body))
+
+        if self.existing_index_settings is not None:
+            raise elasticsearch.RequestError(
+                400, "resource_already_exists_exception", {"error": {}}
+            )
+
+        return {"acknowledged": True}
+
+    def get_settings(self, index=None, *args, **kwargs):
+        self.index_request_list.append(("get_settings", None))
+
+        return {index: {"settings": {"index": self.existing_index_settings}}}
+
+    def put_settings(self, body, index=None, *args, **kwargs):
+        self.index_request_list.append(("put_settings", body))
+
+        return {"acknowledged": True}
+
+    def refresh(self, index=None, *args, **kwargs):
+        self.index_request_list.append(("refresh", None))
+
+        return {"_shards": {}}
+
+
+def make_bulk_stub_writer(monkeypatch, stub):
+    import elasticsearch
+
+    es = elasticsearch.Elasticsearch()
+    monkeypatch.setattr(es, "bulk", stub.bulk)
+    for method_name in ("create", "get_settings", "put_settings", "refresh"):
+        monkeypatch.setattr(es.indices, method_name, getattr(stub, method_name))
+
+    writer = table_writer_class()
+    writer.stream = es
+    writer.table_name = "bulk"
+    writer.header_list = ["a", "b"]
+    writer.value_matrix = [[i, "row{:d}".format(i)] for i in range(10)]
+
+    return writer
+
+
+class Test_ElasticsearchWriter_bulk(object):
+    @pytest.mark.parametrize(
+        ["chunk_size", "thread_count", "expected"],
+        [[500, 1, [10]], [3, 1, [3, 3, 3, 1]], [4, 2, [4, 4, 2]], [10, 4, [10]]],
+    )
+    def test_normal(self, monkeypatch, chunk_size, thread_count, expected):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.bulk_chunk_size = chunk_size
+        writer.bulk_thread_count = thread_count
+        writer.write_table()
+
+        assert sorted([len(source_list) for source_list in stub.request_list]) == sorted(expected)
+        assert sorted(
+            [source["a"] for source_list in stub.request_list for source in source_list]
+        ) == list(range(10))
+        assert writer.bulk_error_list == []
+
+    def test_normal_max_chunk_bytes(self, monkeypatch):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.bulk_max_chunk_bytes = 1
+        writer.write_table()
+
+        assert [len(source_list) for source_list in stub.request_list] == [1] * 10
+
+    def test_normal_error(self, monkeypatch):
+        stub = BulkStubClient(failed_index_list=[2, 7])
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.bulk_chunk_size = 4
+        writer.write_table()
+
+        assert len(writer.bulk_error_list) == 2
+        for item in writer.bulk_error_list:
+            assert item["index"]["status"] == 400
+            assert item["index"]["error"] == {"type": "mapper_parsing_exception"}
+
+        # errors of the previous write are not carried over
+        stub.failed_index_list = []
+        writer.write_table()
+        assert writer.bulk_error_list == []
+
+
+class Test_ElasticsearchWriter_index_lifecycle(object):
+    def test_normal_new_index(self, monkeypatch):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.write_table()
+
+        assert [request[0] for request in stub.index_request_list] == [
+            "create",
+            "put_settings",
+            "refresh",
+        ]
+        create_body = stub.index_request_list[0][1]
+        assert create_body["settings"] == {
+            "index": {"refresh_interval": "-1", "number_of_replicas": 0}
+        }
+        assert "properties" in create_body["mappings"]["table"]
+        assert stub.index_request_list[1][1] == {
+            "index": {"refresh_interval": None, "number_of_replicas": None}
+        }
+
+    def test_normal_existing_index(self, monkeypatch):
+        stub = BulkStubClient()
+        stub.existing_index_settings = {"refresh_interval": "30s", "number_of_replicas": "2"}
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.write_table()
+
+        assert stub.index_request_list[1:] == [
+            ("get_settings", None),
+            ("put_settings", {"index": {"refresh_interval": "-1", "number_of_replicas": 0}}),
+            ("put_settings", {"index": {"refresh_interval": "30s", "number_of_replicas": "2"}}),
+            ("refresh", None),
+        ]
+
+    def test_normal_write_table_iter(self, monkeypatch):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.write_table_iter(chunk_size=3)
+
+        assert [request[0] for request in stub.index_request_list] == [
+            "create",
+            "put_settings",
+            "refresh",
+        ]
+        assert sum([len(source_list) for source_list in stub.request_list]) == 10
+
+    def test_normal_not_optimize(self, monkeypatch):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+        writer.is_optimize_bulk_load = False
+        writer.write_table()
+
+        assert [request[0] for request in stub.index_request_list] == ["create"]
+        assert "settings" not in stub.index_request_list[0][1]
+
+    def test_normal_restore_on_error(self, monkeypatch):
+        stub = BulkStubClient()
+        writer = make_bulk_stub_writer(monkeypatch, stub)
+
+        def bulk(*args, **kwargs):
+            raise RuntimeError()
+
+        monkeypatch.setattr(writer.stream, "bulk", bulk)
+
+        with pytest.raises(RuntimeError):
+            writer.write_table()
+
+        assert [request[0] for request in stub.index_request_list] == [
+            "create",
+            "put_settings",
+            "refresh",
+        ]
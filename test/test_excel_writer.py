@@ -8,12 +8,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
 import itertools
+import pickle
 from decimal import Decimal
 
 import pytablewriter as ptw
 import pytest
 from pytablereader import ExcelTableFileLoader
+from pytablewriter.writer.binary._excel import _to_table_dp_helper
 from tabledata import TableData
+from typepy import Typecode
 
 from ._common import print_test_result
 from .data import header_list, mix_header_list, mix_value_matrix, value_matrix, value_matrix_iter
@@ -300,3 +303,199 @@ class Test_ExcelTableWriter_dumps(object):
 
             with pytest.raises(NotImplementedError):
                 writer.dumps()
+
+
+class Test_ExcelXlsxTableWriter_constant_memory(object):
+    @pytest.mark.parametrize(["is_constant_memory"], [[True], [False]])
+    def test_normal(self, tmpdir, is_constant_memory):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        value_matrix = [[i, i * 0.5, "row{:d}".format(i)] for i in range(1000)]
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.is_constant_memory = is_constant_memory
+        writer.open(test_file_path)
+
+        assert writer.workbook.workbook.constant_memory == is_constant_memory
+
+        writer.make_worksheet("large")
+        writer.header_list = ["a", "b", "c"]
+        writer.value_matrix = iter(value_matrix)
+        writer.write_table_iter(chunk_size=300)
+        writer.close()
+
+        assert writer.first_data_row == 1
+        assert writer.last_data_row == 1001
+
+        for table_data in ExcelTableFileLoader(test_file_path).load():
+            assert table_data == TableData("large", ["a", "b", "c"], value_matrix)
+
+
+class Test_ExcelTableWriter_max_row(object):
+    @pytest.mark.parametrize(
+        ["writer_class", "chunk_size"],
+        [
+            [writer_class, chunk_size]
+            for writer_class, chunk_size in itertools.product(table_writer_class_list, [None, 3])
+        ],
+    )
+    def test_normal(self, tmpdir, writer_class, chunk_size):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        value_matrix = [[i, "row{:d}".format(i)] for i in range(10)]
+
+        writer = writer_class()
+        writer.max_row = 5
+        writer.open(test_file_path)
+        writer.make_worksheet("split")
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = value_matrix
+        if chunk_size is None:
+            writer.write_table()
+        else:
+            writer.write_table_iter(chunk_size=chunk_size)
+        writer.close()
+
+        assert writer.last_data_row == 3
+
+        expected_list = [
+            TableData("split", ["a", "b"], value_matrix[0:4]),
+            TableData("split_2", ["a", "b"], value_matrix[4:8]),
+            TableData("split_3", ["a", "b"], value_matrix[8:10]),
+        ]
+        load_count = 0
+        for expected, table_data in zip(expected_list, ExcelTableFileLoader(test_file_path).load()):
+            assert table_data == expected
+            load_count += 1
+
+        assert load_count == len(expected_list)
+
+    def test_normal_long_sheet_name(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.max_row = 2
+        writer.open(test_file_path)
+        writer.make_worksheet("a" * 31)
+        writer.header_list = ["a"]
+        writer.value_matrix = [[1], [2]]
+        writer.write_table()
+        writer.close()
+
+        assert [
+            table_data.table_name for table_data in ExcelTableFileLoader(test_file_path).load()
+        ] == ["a" * 31, "a" * 29 + "_2"]
+
+    @pytest.mark.parametrize(
+        ["writer_class", "value", "expected"],
+        [
+            [ptw.ExcelXlsTableWriter, 1, ValueError],
+            [ptw.ExcelXlsTableWriter, 65537, ValueError],
+            [ptw.ExcelXlsxTableWriter, 1048577, ValueError],
+        ],
+    )
+    def test_exception(self, writer_class, value, expected):
+        writer = writer_class()
+
+        with pytest.raises(expected):
+            writer.max_row = value
+
+
+class Test_ExcelTableWriter_dump_tabledata_list(object):
+    @pytest.mark.parametrize(
+        ["writer_class", "max_workers"],
+        [
+            [writer_class, max_workers]
+            for writer_class, max_workers in itertools.product(table_writer_class_list, [1, 2])
+        ],
+    )
+    def test_normal(self, tmpdir, writer_class, max_workers):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        tabledata_list = [
+            TableData("first", ["ha1", "hb1", "hc1"], [[1.0, 2.0, 3.0], [11.0, 12.0, 13.0]]),
+            TableData("second", ["ha2", "hb2"], [["a", 1], ["bb", 2], ["ccc", 3]]),
+            TableData("third", ["ha3", "hb3"], [[0.25, "x"]]),
+        ]
+
+        writer = writer_class()
+        writer.dump_tabledata_list(test_file_path, tabledata_list, max_workers=max_workers)
+
+        load_count = 0
+        for expected, table_data in zip(
+            tabledata_list, ExcelTableFileLoader(test_file_path).load()
+        ):
+            assert table_data == expected
+            load_count += 1
+
+        assert load_count == len(tabledata_list)
+
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal_unpicklable_setting(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        tabledata_list = [
+            TableData("first", ["ha1", "hb1"], [[1, "a"], [2, "b"]]),
+            TableData("second", ["ha2", "hb2"], [[3, "c"]]),
+        ]
+
+        writer = writer_class()
+        writer.trans_func = lambda value: value
+        writer.dump_tabledata_list(test_file_path, tabledata_list, max_workers=2)
+
+        load_count = 0
+        for expected, table_data in zip(
+            tabledata_list, ExcelTableFileLoader(test_file_path).load()
+        ):
+            assert table_data == expected
+            load_count += 1
+
+        assert load_count == len(tabledata_list)
+
+    def test_normal_vectorized_type_inference(self, tmpdir, monkeypatch):
+        pytest.importorskip("numpy")
+
+        extract_count_list = []
+        extract = ptw.writer._vectorized_extractor.VectorizedDataPropertyExtractor.extract
+
+        def count_extract(self, *args, **kwargs):
+            extract_count_list.append(1)
+            return extract(self, *args, **kwargs)
+
+        monkeypatch.setattr(
+            ptw.writer._vectorized_extractor.VectorizedDataPropertyExtractor,
+            "extract",
+            count_extract,
+        )
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        tabledata_list = [
+            TableData("first", ["ha1", "hb1"], [[1, 0.5], [2, 1.25]]),
+            TableData("second", ["ha2", "hb2"], [[3, 2.5]]),
+        ]
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.is_vectorized_type_inference = True
+        writer.dump_tabledata_list(test_file_path, tabledata_list, max_workers=1)
+
+        assert len(extract_count_list) == len(tabledata_list)
+
+        # worker processes run the same extraction
+        writer.from_tabledata(tabledata_list[0])
+        value_dp_matrix, column_dp_list = _to_table_dp_helper(
+            pickle.dumps(writer._dp_extractor), writer._to_value_matrix(), True
+        )
+
+        assert len(extract_count_list) == len(tabledata_list) + 1
+        assert [col_dp.typecode for col_dp in column_dp_list] == [
+            Typecode.INTEGER,
+            Typecode.REAL_NUMBER,
+        ]
+        assert value_dp_matrix[1][1].data == Decimal("1.25")
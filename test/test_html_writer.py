@@ -370,3 +370,11 @@ class Test_HtmlTableWriter_write_table_iter(object):
 
         with pytest.raises(pytablewriter.NotSupportedError):
             writer.write_table_iter()
+
+
+class Test_HtmlTableWriter_write_table_stream(object):
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(pytablewriter.NotSupportedError):
+            writer.write_table_stream()
@@ -7,6 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import re
 
 import pytablewriter
 import pytest
@@ -313,6 +314,44 @@ class Test_JsonTableWriter_write_table_iter(object):
         out, _err = capsys.readouterr()
         assert json.loads(out) == expected
 
+    @pytest.mark.parametrize(
+        ["table", "header", "value", "chunk_size", "expected"],
+        [
+            [
+                "tablename",
+                ["ha", "hb"],
+                [[1, 2], [11, 12], [101, 102]],
+                chunk_size,
+                json.loads(
+                    """{ "tablename" : [
+                {
+                    "ha": 1,
+                    "hb": 2
+                },
+                {
+                    "ha": 11,
+                    "hb": 12
+                },
+                {
+                    "ha": 101,
+                    "hb": 102
+                }]}"""
+                ),
+            ]
+            for chunk_size in [1, 2, 3, 100]
+        ]
+        + [["tablename", ["ha", "hb"], [], 1, json.loads('{ "tablename" : []}')]],
+    )
+    def test_normal_chunk_size(self, capsys, table, header, value, chunk_size, expected):
+        writer = table_writer_class()
+        writer.table_name = table
+        writer.header_list = header
+        writer.value_matrix = iter(value)
+        writer.write_table_iter(chunk_size=chunk_size)
+
+        out, _err = capsys.readouterr()
+        assert json.loads(out) == expected
+
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
         [[data.table, data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -325,3 +364,73 @@ class Test_JsonTableWriter_write_table_iter(object):
 
         with pytest.raises(expected):
             writer.write_table_iter()
+
+
+class Test_JsonTableWriter_write_table_literal(object):
+    def test_normal(self):
+        writer = table_writer_class()
+        writer.header_list = ["bool", "none", "str_true", "str_null", "nested"]
+        writer.value_matrix = [[True, None, "true", "null", {"k": [1, None]}]]
+
+        out = writer.dumps()
+
+        assert json.loads(out) == [
+            {
+                "bool": True,
+                "none": None,
+                "str_true": "true",
+                "str_null": "null",
+                "nested": {"k": [1, None]},
+            }
+        ]
+        assert '"bool": true' in out
+        assert '"str_true": "true"' in out
+
+
+class Test_JsonTableWriter_json_backend(object):
+    @pytest.mark.parametrize(["backend"], [["json"], ["orjson"], ["ujson"], ["rapidjson"]])
+    def test_normal(self, backend):
+        if backend != "json":
+            pytest.importorskip(backend)
+
+        writer = table_writer_class()
+        writer.json_backend = backend
+        writer.header_list = ["int", "nested"]
+        writer.value_matrix = [[1, {"k": [1, None, "a"]}], [2, [True, 0.1]]]
+
+        assert json.loads(writer.dumps()) == [
+            {"int": 1, "nested": {"k": [1, None, "a"]}},
+            {"int": 2, "nested": [True, 0.1]},
+        ]
+
+    @pytest.mark.parametrize(["backend"], [["orjson"], ["ujson"], ["rapidjson"]])
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            [[[1, {"k": [float("nan"), float("inf"), 0.5]}], [2, [float("-inf")]]]],
+            [[[1, float("nan")], [2, float("inf")]]],
+        ],
+    )
+    def test_normal_non_finite_float(self, backend, value):
+        pytest.importorskip(backend)
+
+        def dumps(json_backend):
+            writer = table_writer_class()
+            writer.json_backend = json_backend
+            writer.table_name = "tablename"
+            writer.header_list = ["int", "nested"]
+            writer.value_matrix = value
+
+            try:
+                # compare regardless of whitespaces between separators
+                return re.sub(r"\s", "", writer.dumps())
+            except ValueError:
+                return ValueError
+
+        assert dumps(backend) == dumps("json")
+
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(ValueError):
+            writer.json_backend = "invalid"
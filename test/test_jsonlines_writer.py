@@ -8,10 +8,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
 import itertools
+import re
 
 import pytablewriter as ptw
 import pytest
 import simplejson as json
+import six
 
 from ._common import print_test_result
 from .data import float_header_list, float_value_matrix, header_list, value_matrix
@@ -39,11 +41,11 @@ normal_test_data_list = [
             [None, None, None, None, None],
         ],
         expected_list=[
-            {"a": 1, "b": "", "c": "a", "dd": 1, "e": "null"},
-            {"a": "null", "b": 2.2, "c": "null", "dd": 2.2, "e": 2.2},
-            {"a": "null", "b": "null", "c": "null", "dd": "null", "e": "null"},
-            {"a": 3, "b": 3.3, "c": "ccc", "dd": "null", "e": "cccc"},
-            {"a": "null", "b": "null", "c": "null", "dd": "null", "e": "null"},
+            {"a": 1, "b": "", "c": "a", "dd": 1, "e": None},
+            {"a": None, "b": 2.2, "c": None, "dd": 2.2, "e": 2.2},
+            {"a": None, "b": None, "c": None, "dd": None, "e": None},
+            {"a": 3, "b": 3.3, "c": "ccc", "dd": None, "e": "cccc"},
+            {"a": None, "b": None, "c": None, "dd": None, "e": None},
         ],
     ),
     Data(
@@ -99,3 +101,153 @@ class Test_JsonLinesTableWriter_write_table(object):
 
         with pytest.raises(expected_list):
             writer.write_table()
+
+
+class Test_JsonLinesTableWriter_write_table_stream(object):
+    @pytest.mark.parametrize(
+        ["header", "value", "expected_list"],
+        [[data.header, data.value, data.expected_list] for data in normal_test_data_list],
+    )
+    def test_normal(self, capsys, header, value, expected_list):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = iter(value)
+        writer.stream_sample_size = 1
+        writer.write_table_stream()
+
+        out, err = capsys.readouterr()
+        assert len(out.splitlines()) == len(expected_list)
+        for actual, expected in zip(out.splitlines(), expected_list):
+            print_test_result(expected=expected, actual=actual, error=err)
+            assert json.loads(actual) == expected
+
+    @pytest.mark.parametrize(
+        ["header", "value", "expected_list"],
+        [[data.header, data.value, data.expected_list] for data in exception_test_data_list],
+    )
+    def test_exception(self, header, value, expected_list):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = value
+
+        with pytest.raises(expected_list):
+            writer.write_table_stream()
+
+    def test_exception_invalid_row(self):
+        from tabledata import DataError
+
+        stream = six.StringIO()
+        writer = table_writer_class()
+        writer.stream = stream
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = iter([[1, 2], 5, None, [3]])
+
+        with pytest.raises(DataError):
+            writer.write_table_stream()
+
+        assert stream.getvalue() == '{"a": 1, "b": 2}\n'
+
+    def test_normal_write_before_read_all(self):
+        stream = six.StringIO()
+
+        def gen_rows():
+            for i in range(3):
+                # rows read so far are already written to the stream
+                assert len(stream.getvalue().splitlines()) == i
+                yield [i, "v{}".format(i)]
+
+        writer = table_writer_class()
+        writer.stream = stream
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = gen_rows()
+        writer.write_table_stream()
+
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == [
+            {"a": 0, "b": "v0"},
+            {"a": 1, "b": "v1"},
+            {"a": 2, "b": "v2"},
+        ]
+
+    @pytest.mark.parametrize(
+        ["flush_interval", "expected"], [[None, 0], [1, 6], [2, 3], [5, 2], [10, 1]]
+    )
+    def test_normal_flush_interval(self, flush_interval, expected):
+        class FlushCountIO(six.StringIO):
+            flush_count = 0
+
+            def flush(self):
+                self.flush_count += 1
+
+        stream = FlushCountIO()
+        writer = table_writer_class()
+        writer.stream = stream
+        writer.header_list = ["a"]
+        writer.value_matrix = iter([[i] for i in range(5)])
+        writer.stream_flush_interval = flush_interval
+        writer.write_table_stream()
+
+        assert len(stream.getvalue().splitlines()) == 5
+        assert stream.flush_count == expected
+
+
+class Test_JsonLinesTableWriter_json_backend(object):
+    @pytest.mark.parametrize(["backend"], [["json"], ["orjson"], ["ujson"], ["rapidjson"]])
+    @pytest.mark.parametrize(
+        ["header", "value", "expected_list"],
+        [[data.header, data.value, data.expected_list] for data in normal_test_data_list],
+    )
+    def test_normal(self, capsys, backend, header, value, expected_list):
+        if backend != "json":
+            pytest.importorskip(backend)
+
+        writer = table_writer_class()
+        writer.json_backend = backend
+        writer.header_list = header
+        writer.value_matrix = value
+        writer.write_table()
+
+        assert writer.json_backend == backend
+
+        out, err = capsys.readouterr()
+        assert len(out.splitlines()) == len(expected_list)
+        for actual, expected in zip(out.splitlines(), expected_list):
+            print_test_result(expected=expected, actual=actual, error=err)
+            assert json.loads(actual) == expected
+
+    def test_normal_auto(self):
+        writer = table_writer_class()
+        writer.json_backend = "auto"
+
+        assert writer.json_backend in ["orjson", "ujson", "rapidjson", "json"]
+
+    @pytest.mark.parametrize(["backend"], [["orjson"], ["ujson"], ["rapidjson"]])
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            [[[1, {"k": [float("nan"), float("inf"), 0.5]}], [2, [float("-inf")]]]],
+            [[[1, float("nan")], [2, float("inf")]]],
+        ],
+    )
+    def test_normal_non_finite_float(self, backend, value):
+        pytest.importorskip(backend)
+
+        def dumps(json_backend):
+            writer = table_writer_class()
+            writer.json_backend = json_backend
+            writer.table_name = "tablename"
+            writer.header_list = ["int", "nested"]
+            writer.value_matrix = value
+
+            try:
+                # compare regardless of whitespaces between separators
+                return re.sub(r"\s", "", writer.dumps())
+            except ValueError:
+                return ValueError
+
+        assert dumps(backend) == dumps("json")
+
+    def test_exception(self):
+        writer = table_writer_class()
+
+        with pytest.raises(ValueError):
+            writer.json_backend = "invalid"
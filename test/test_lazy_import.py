@@ -0,0 +1,75 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from __future__ import absolute_import
+
+import subprocess
+import sys
+
+import pytablewriter
+import pytest
+from pytablewriter._lazy import IS_LAZY_IMPORT_AVAILABLE
+
+
+class Test_lazy_import(object):
+    @pytest.mark.parametrize(
+        ["value"], [[attr_name] for attr_name in pytablewriter.__all__ if attr_name[0] != "_"]
+    )
+    def test_normal(self, value):
+        assert getattr(pytablewriter, value) is not None
+        assert value in dir(pytablewriter)
+
+    def test_normal_writer_class(self):
+        from pytablewriter.writer.text._csv import CsvTableWriter
+
+        assert pytablewriter.CsvTableWriter is CsvTableWriter
+        assert pytablewriter.TableFormat.CSV.writer_class is CsvTableWriter
+
+    @pytest.mark.parametrize(["value"], [["sanitizer"], ["style"], ["writer"]])
+    def test_normal_submodule(self, value):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pytablewriter; "
+                "print(pytablewriter.{0} is sys.modules['pytablewriter.{0}'])".format(value),
+            ]
+        )
+
+        assert output.strip() == b"True"
+        assert value in dir(pytablewriter)
+
+    def test_normal_dir(self):
+        import pytablewriter.writer.binary
+        import pytablewriter.writer.text
+        import pytablewriter.writer.text.sourcecode
+
+        for module in (
+            pytablewriter,
+            pytablewriter.writer,
+            pytablewriter.writer.binary,
+            pytablewriter.writer.text,
+            pytablewriter.writer.text.sourcecode,
+        ):
+            assert "create_lazy_attr_loader" not in dir(module)
+
+    def test_exception(self):
+        with pytest.raises(AttributeError):
+            pytablewriter.NotExistTableWriter
+
+    @pytest.mark.skipif(not IS_LAZY_IMPORT_AVAILABLE, reason="requires Python 3.7 or later")
+    def test_normal_not_imported(self):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pytablewriter; "
+                "pytablewriter.__version__; "
+                "print('pytablewriter.writer._table_writer' in sys.modules)",
+            ]
+        )
+
+        assert output.strip() == b"False"
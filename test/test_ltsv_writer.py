@@ -114,3 +114,33 @@ class Test_LtsvTableWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class Test_LtsvTableWriter_write_table_stream(object):
+    @pytest.mark.parametrize(
+        ["header", "value", "expected"],
+        [[data.header, data.value, data.expected] for data in normal_test_data_list],
+    )
+    def test_normal(self, capsys, header, value, expected):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = iter(value)
+        writer.stream_sample_size = 1
+        writer.write_table_stream()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(
+        ["header", "value", "expected"],
+        [[data.header, data.value, data.expected] for data in exception_test_data_list],
+    )
+    def test_exception(self, header, value, expected):
+        writer = table_writer_class()
+        writer.header_list = header
+        writer.value_matrix = value
+
+        with pytest.raises(expected):
+            writer.write_table_stream()
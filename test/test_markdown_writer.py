@@ -12,12 +12,12 @@ from textwrap import dedent
 
 import pytablewriter as ptw
 import pytest
-import six  # noqa: W0611
+import six
 from pytablewriter.style import Align, FontSize, Style, ThousandSeparator
 from tabledata import TableData
 from termcolor import colored
 
-from ._common import print_test_result
+from ._common import patch_vectorized_extract, print_test_result
 from .data import (
     float_header_list,
     float_value_matrix,
@@ -452,6 +452,39 @@ class Test_MarkdownTableWriter_write_table(object):
         assert out == expected
         assert writer.dumps() == expected
 
+    def test_normal_vectorized_type_inference(self, capsys, monkeypatch):
+        pytest.importorskip("numpy")
+
+        extract_result_list = patch_vectorized_extract(monkeypatch)
+        writer = table_writer_class()
+        writer.table_name = "vectorized"
+        writer.header_list = ["int", "float", "mix", "str"]
+        writer.value_matrix = [
+            [1, 0.5, 1, "a"],
+            [22, 1.25, None, "bb"],
+            [-333, 10.0, 2.5, "ccc"],
+            [4, float("inf"), 3, None],
+        ]
+        writer.is_vectorized_type_inference = True
+        writer.write_table()
+
+        expected = dedent(
+            """\
+            # vectorized
+            |int | float  |mix|str|
+            |---:|-------:|--:|---|
+            |   1|    0.50|1.0|a  |
+            |  22|    1.25|   |bb |
+            |-333|   10.00|2.5|ccc|
+            |   4|Infinity|3.0|   |
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+        assert len(extract_result_list) == 1
+
     def test_normal_single_tabledata(self, capsys):
         writer = table_writer_class()
         writer.from_tabledata(
@@ -919,6 +952,58 @@ class Test_MarkdownTableWriter_write_table(object):
             writer.write_table()
 
 
+class Test_MarkdownTableWriter_row_item_formatter(object):
+    # outputs of the formatting for each cell before the introduction of RowItemFormatter
+    @pytest.mark.parametrize(
+        ["margin", "expected"],
+        [
+            [
+                0,
+                "# formatter\n"
+                "|left|   int   |float |mix |colored|multibyte |\n"
+                "|----|--------:|:----:|----|------:|----------|\n"
+                "|a\\|b |1,234,567| 0.1  |   1|    \x1b[31mabc\x1b[0m|**あいう**|\n"
+                "|c   |       -1|1234.6|x\\|y |     \x1b[32m12\x1b[0m|**ab**    |\n"
+                "|    |       12|      |2.25|  plain|          |\n",
+            ],
+            [
+                1,
+                "# formatter\n"
+                "| left |    int    | float  | mix  | colored | multibyte  |\n"
+                "|------|----------:|:------:|------|--------:|------------|\n"
+                "| a\\|b  | 1,234,567 |  0.1   |    1 |     \x1b[31mabc\x1b[0m | **あいう** |\n"
+                "| c    |        -1 | 1234.6 | x\\|y  |      \x1b[32m12\x1b[0m | **ab**     |\n"
+                "|      |        12 |        | 2.25 |   plain |            |\n",
+            ],
+        ],
+    )
+    def test_normal(self, margin, expected):
+        writer = table_writer_class()
+        writer.table_name = "formatter"
+        writer.header_list = ["left", "int", "float", "mix", "colored", "multibyte"]
+        writer.value_matrix = [
+            ["a|b", 1234567, 0.1, 1, "\x1b[31mabc\x1b[0m", "あいう"],
+            ["c", -1, 1234.5678, "x|y", "\x1b[32m12\x1b[0m", "ab"],
+            [None, 12, None, 2.25, "plain", None],
+        ]
+        writer.style_list = [
+            Style(align=Align.LEFT),
+            Style(thousand_separator=ThousandSeparator.COMMA),
+            Style(align=Align.CENTER),
+            None,
+            Style(align=Align.RIGHT),
+            Style(font_weight="bold"),
+        ]
+        writer.margin = margin
+
+        output = writer.dumps()
+        print_test_result(expected=expected, actual=output)
+
+        assert output == expected
+        # formatters are compiled for each table: the second write is the same
+        assert writer.dumps() == expected
+
+
 class Test_MarkdownTableWriter_write_table_iter(object):
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
@@ -974,6 +1059,37 @@ class Test_MarkdownTableWriter_write_table_iter(object):
 
         assert out == expected
 
+    def test_normal_vectorized_type_inference(self, capsys, monkeypatch):
+        pytest.importorskip("numpy")
+
+        extract_result_list = patch_vectorized_extract(monkeypatch)
+        writer = table_writer_class()
+        writer.table_name = "mix length"
+        writer.header_list = ["string", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter_1
+        writer.iteration_length = len(value_matrix_iter_1)
+        writer.is_vectorized_type_inference = True
+        writer.write_table_iter()
+
+        expected = dedent(
+            """\
+            # mix length
+            |           string            | hb  | hc |
+            |-----------------------------|----:|---:|
+            |a b c d e f g h i jklmn      |  2.1|   3|
+            |aaaaa                        | 12.1|  13|
+            |bbb                          |    2|   3|
+            |cc                           |   12|  13|
+            |a                            |  102| 103|
+            |                             | 1002|1003|
+            """
+        )
+        out, err = capsys.readouterr()
+        print_test_result(expected=expected, actual=out, error=err)
+
+        assert out == expected
+        assert len(extract_result_list) == writer.iteration_length
+
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
         [[data.table, data.header, data.value, data.expected] for data in exception_test_data_list],
@@ -1012,6 +1128,103 @@ class Test_MarkdownTableWriter_dump(object):
         assert output == expected
 
 
+class Test_MarkdownTableWriter_write_profile(object):
+    PREPROCESS_PHASE_NAME_LIST = [
+        "preprocess_table_dp",
+        "preprocess_styler",
+        "preprocess_table_property",
+        "preprocess_header",
+        "preprocess_value_matrix",
+    ]
+
+    def test_normal(self):
+        writer = table_writer_class()
+        writer.header_list = header_list
+        writer.value_matrix = value_matrix
+        writer.is_profiling = True
+        writer.dumps()
+
+        profile = writer.write_profile
+
+        assert profile.format_name == "markdown"
+        assert profile.row_count == len(value_matrix)
+        assert profile.peak_memory is None
+        assert [phase.name for phase in profile.phase_list] == (
+            self.PREPROCESS_PHASE_NAME_LIST + ["write"]
+        )
+        assert profile.get_phase("preprocess_table_dp").row_count == len(value_matrix)
+        assert profile.get_phase("preprocess_styler").row_count is None
+        assert profile.get_phase("not_exist") is None
+        assert sum([phase.elapsed_time for phase in profile.phase_list]) == pytest.approx(
+            profile.elapsed_time
+        )
+        assert profile.as_dict()["phases"][0]["name"] == "preprocess_table_dp"
+
+    def test_normal_second_write(self):
+        writer = table_writer_class()
+        writer.header_list = header_list
+        writer.value_matrix = value_matrix
+        writer.stream = six.StringIO()
+        writer.is_profiling = True
+        writer.write_table()
+
+        assert writer.write_profile.row_count == len(value_matrix)
+
+        # preprocessed results are reused for the second write
+        writer.dumps()
+
+        profile = writer.write_profile
+
+        assert profile.row_count == len(value_matrix)
+        assert profile.get_phase("preprocess_table_dp") is None
+        assert profile.get_phase("write").row_count == len(value_matrix)
+
+    def test_normal_memory(self):
+        writer = table_writer_class()
+        writer.header_list = header_list
+        writer.value_matrix = value_matrix
+        writer.is_profiling = True
+        writer.is_profile_memory = True
+        writer.dumps()
+
+        profile = writer.write_profile
+
+        if six.PY2:
+            assert profile.peak_memory is None
+        else:
+            assert profile.peak_memory > 0
+            assert profile.get_phase("preprocess_table_dp").allocated_memory is not None
+
+    def test_normal_iter_callback(self):
+        profile_list = []
+
+        writer = table_writer_class()
+        writer.header_list = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.stream = six.StringIO()
+        writer.is_profiling = True
+        writer.profile_callback = profile_list.append
+        writer.write_table_iter()
+
+        assert len(profile_list) == 1
+        assert profile_list[0] is writer.write_profile
+        assert profile_list[0].row_count == 6
+        assert profile_list[0].get_phase("preprocess_value_matrix").row_count == 6
+
+    def test_normal_disabled(self):
+        profile_list = []
+
+        writer = table_writer_class()
+        writer.header_list = header_list
+        writer.value_matrix = value_matrix
+        writer.profile_callback = profile_list.append
+        writer.dumps()
+
+        assert writer.write_profile is None
+        assert profile_list == []
+
+
 class Test_MarkdownTableWriter_from_tablib(object):
     def test_normal_multiple_write(self, capsys):
         import tablib
@@ -266,7 +266,7 @@ class Test_PandasDataFrameWriter_from_dataframe(object):
     )
     def test_normal(self, capsys, table, expected):
         import dateutil
-        from typepy import Integer, RealNumber
+        from typepy import Bool, Integer, RealNumber
 
         writer = table_writer_class()
         writer.table_name = table
@@ -321,7 +321,7 @@ class Test_PandasDataFrameWriter_from_dataframe(object):
             None,
             RealNumber,
             None,
-            None,
+            Bool,
             RealNumber,
             RealNumber,
             RealNumber,
@@ -108,3 +108,13 @@ class Test_SpaceAlignedTableWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class Test_SpaceAlignedTableWriter_write_table_stream(object):
+    def test_exception(self):
+        writer = table_writer_class()
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = [[1, "x"], [123456, "longer string"]]
+
+        with pytest.raises(ptw.NotSupportedError):
+            writer.write_table_stream()
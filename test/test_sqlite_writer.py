@@ -7,6 +7,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import sqlite3
 from decimal import Decimal
 
 import pytablewriter as ptw
@@ -210,3 +211,156 @@ class Test_SqliteTableWriter_dumps(object):
 
         with pytest.raises(NotImplementedError):
             writer.dumps()
+
+
+class Test_SqliteTableWriter_bulk_insert(object):
+    @pytest.mark.parametrize(["batch_size"], [[1], [2], [5], [100]])
+    def test_normal_batch_size(self, tmpdir, batch_size):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "tablename"
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = [[i, "v{}".format(i)] for i in range(5)]
+        writer.batch_size = batch_size
+        writer.write_table()
+        writer.close()
+
+        con = sqlite3.connect(test_file_path)
+        assert con.execute("SELECT sql FROM sqlite_master").fetchone()[0] == (
+            "CREATE TABLE 'tablename' (a INTEGER, b TEXT)"
+        )
+        assert con.execute("SELECT a, b FROM tablename").fetchall() == [
+            (i, "v{}".format(i)) for i in range(5)
+        ]
+
+    def test_normal_pragma_profile(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "tablename"
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = [[1, 1.1], [2, 2.2]]
+        writer.pragma_profile = "fast_load"
+        writer.write_table()
+
+        connection = writer.stream.connection
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert connection.execute("SELECT a, b FROM tablename").fetchall() == [(1, 1.1), (2, 2.2)]
+
+        writer.close()
+
+    def test_exception_pragma_profile(self):
+        writer = ptw.SqliteTableWriter()
+
+        with pytest.raises(ValueError):
+            writer.pragma_profile = "invalid"
+
+    @pytest.mark.parametrize(["chunk_size", "batch_size"], [[1, 1], [2, 3], [3, 2], [3, 100]])
+    def test_normal_write_table_iter(self, tmpdir, chunk_size, batch_size):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+        value_matrix = [[1, 1.1], [2, 2.2], [3, 3.3], ["a", "b"], [5, 5.5]]
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "tablename"
+        writer.header_list = ["a", "b"]
+        writer.value_matrix = iter(value_matrix)
+        writer.batch_size = batch_size
+        writer.write_table_iter(chunk_size=chunk_size)
+        writer.close()
+
+        con = sqlite3.connect(test_file_path)
+
+        # schema created from the first chunk
+        assert con.execute("SELECT sql FROM sqlite_master").fetchone()[0] == (
+            "CREATE TABLE 'tablename' (a INTEGER, b REAL)"
+        )
+        assert con.execute("SELECT a, b FROM tablename").fetchall() == [
+            (1, 1.1),
+            (2, 2.2),
+            (3, 3.3),
+            ("a", "b"),
+            (5, 5.5),
+        ]
+
+
+class Test_SqliteTableWriter_index(object):
+    @pytest.mark.parametrize(["method"], [["write_table"], ["write_table_iter"]])
+    def test_normal(self, tmpdir, method):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "tablename"
+        writer.header_list = ["id", "a b", "c"]
+        writer.value_matrix = iter([[1, "x", 1.1], [2, "y", 2.2], [3, "x", 3.3]])
+        writer.primary_key = "id"
+        writer.index_list = ["a b", ["a b", "c"]]
+        writer.is_analyze = True
+
+        if method == "write_table_iter":
+            writer.write_table_iter(chunk_size=2)
+        else:
+            writer.value_matrix = list(writer.value_matrix)
+            writer.write_table()
+
+        writer.close()
+
+        con = sqlite3.connect(test_file_path)
+        assert con.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' ORDER BY name"
+        ).fetchall() == [
+            ("tablename_a_b_c_index", 'CREATE INDEX "tablename_a_b_c_index" ON tablename([a b],c)'),
+            ("tablename_a_b_index", 'CREATE INDEX "tablename_a_b_index" ON tablename([a b])'),
+            ("tablename_id_pkey", 'CREATE UNIQUE INDEX "tablename_id_pkey" ON tablename(id)'),
+        ]
+        assert con.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+        assert con.execute("SELECT COUNT(*) FROM tablename").fetchone()[0] == 3
+
+    def test_normal_index_name_collision(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.sqlite"))
+
+        writer = ptw.SqliteTableWriter()
+        writer.open(test_file_path)
+        writer.table_name = "tablename"
+        writer.header_list = ["a", "b", "a_b", "b c", "b_c"]
+        writer.value_matrix = [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]
+        writer.index_list = [["a", "b"], "a_b", "b c", "b_c", "a_b"]
+        writer.write_table()
+        writer.close()
+
+        con = sqlite3.connect(test_file_path)
+        assert con.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' ORDER BY name"
+        ).fetchall() == [
+            ("tablename_a_b_index", 'CREATE INDEX "tablename_a_b_index" ON tablename(a,b)'),
+            ("tablename_a_b_index_2", 'CREATE INDEX "tablename_a_b_index_2" ON tablename("a_b")'),
+            ("tablename_b_c_index", 'CREATE INDEX "tablename_b_c_index" ON tablename([b c])'),
+            ("tablename_b_c_index_2", 'CREATE INDEX "tablename_b_c_index_2" ON tablename("b_c")'),
+        ]
+
+    def test_exception_duplicated_primary_key(self, tmpdir):
+        writer = ptw.SqliteTableWriter()
+        writer.open(":memory:")
+        writer.table_name = "tablename"
+        writer.header_list = ["id", "a"]
+        writer.value_matrix = [[1, "x"], [1, "y"]]
+        writer.primary_key = "id"
+
+        with pytest.raises(sqlite3.IntegrityError):
+            writer.write_table()
+
+    def test_exception_unknown_column(self):
+        writer = ptw.SqliteTableWriter()
+        writer.open(":memory:")
+        writer.table_name = "tablename"
+        writer.header_list = ["id", "a"]
+        writer.value_matrix = [[1, "x"]]
+        writer.index_list = ["not_exist"]
+
+        with pytest.raises(ValueError):
+            writer.write_table()
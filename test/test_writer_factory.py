@@ -7,9 +7,53 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import itertools
+import sys
+import textwrap
 
 import pytablewriter as ptw
 import pytest
+from pytablewriter import _plugin
+
+
+PLUGIN_MODULE_SOURCE = """\
+import pytablewriter as ptw
+
+
+class ExampleTableWriter(ptw.CsvTableWriter):
+    FORMAT_NAME = "example"
+
+    @property
+    def format_name(self):
+        return self.FORMAT_NAME
+"""
+
+
+class EntryPoint(object):
+    def __init__(self, name, value):
+        self.name = name
+        self.__value = value
+
+    def load(self):
+        if isinstance(self.__value, Exception):
+            raise self.__value
+
+        return self.__value
+
+
+@pytest.fixture
+def factory_index(monkeypatch):
+    # restore the index of the factory after each test
+    monkeypatch.setattr(ptw.TableWriterFactory, "_TableWriterFactory__index", None)
+
+
+@pytest.fixture
+def plugin_module(tmpdir, monkeypatch):
+    module_name = "ptw_example_plugin_writer"
+    tmpdir.join(module_name + ".py").write(textwrap.dedent(PLUGIN_MODULE_SOURCE))
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    return module_name
 
 
 class Test_WriterFactory_get_format_name_list(object):
@@ -241,3 +285,141 @@ class Test_FileLoaderFactory_create_from_format_name(object):
     def test_exception(self, format_name, expected):
         with pytest.raises(expected):
             ptw.TableWriterFactory.create_from_format_name(format_name)
+
+
+class Test_WriterFactory_find_table_format_list(object):
+    @pytest.mark.parametrize(
+        ["format_attribute", "expected"],
+        [
+            [
+                ptw.FormatAttr.BIN,
+                [ptw.TableFormat.EXCEL_XLS, ptw.TableFormat.EXCEL_XLSX, ptw.TableFormat.SQLITE],
+            ],
+            [
+                ptw.FormatAttr.TEXT | ptw.FormatAttr.WIDTH_SCAN,
+                [
+                    ptw.TableFormat.LATEX_MATRIX,
+                    ptw.TableFormat.LATEX_TABLE,
+                    ptw.TableFormat.MARKDOWN,
+                    ptw.TableFormat.RST_GRID_TABLE,
+                    ptw.TableFormat.RST_SIMPLE_TABLE,
+                    ptw.TableFormat.SPACE_ALIGNED,
+                ],
+            ],
+            [ptw.FormatAttr.API | ptw.FormatAttr.SPLIT_WRITE, [ptw.TableFormat.ELASTICSEARCH]],
+            [
+                ptw.FormatAttr.STREAM_WRITE,
+                [
+                    ptw.TableFormat.CSV,
+                    ptw.TableFormat.JSON_LINES,
+                    ptw.TableFormat.LTSV,
+                    ptw.TableFormat.NULL,
+                    ptw.TableFormat.TSV,
+                ],
+            ],
+            [ptw.FormatAttr.BIN | ptw.FormatAttr.SOURCECODE, []],
+        ],
+    )
+    def test_normal(self, format_attribute, expected):
+        assert ptw.TableWriterFactory.find_table_format_list(format_attribute) == expected
+
+    @pytest.mark.parametrize(["table_format"], [[table_format] for table_format in ptw.TableFormat])
+    def test_normal_write_attr(self, table_format):
+        # attributes should coincide with the writer capabilities
+        writer = table_format.writer_class()
+        format_attribute = table_format.format_attribute
+
+        assert bool(format_attribute & ptw.FormatAttr.SPLIT_WRITE) == writer.support_split_write
+        assert bool(format_attribute & ptw.FormatAttr.STREAM_WRITE) == writer.support_stream_write
+
+
+class Test_WriterFactory_register(object):
+    def test_normal_lazy_import(self, factory_index, plugin_module):
+        ptw.TableWriterFactory.register(
+            ptw.WriterPlugin(
+                name_list=["example", "ex"],
+                writer_class=plugin_module + ":ExampleTableWriter",
+                file_extension_list=[".EXM"],
+            )
+        )
+
+        assert "example" in ptw.TableWriterFactory.get_format_name_list()
+        assert "exm" in ptw.TableWriterFactory.get_extension_list()
+        assert plugin_module not in sys.modules
+
+        writer = ptw.TableWriterFactory.create_from_format_name("EX")
+        assert writer.format_name == "example"
+        assert plugin_module in sys.modules
+
+        writer = ptw.TableWriterFactory.create_from_file_extension("output.exm")
+        assert writer.format_name == "example"
+
+    def test_normal_builtin_precedence(self, factory_index):
+        ptw.TableWriterFactory.register(
+            ptw.WriterPlugin(
+                name_list=["csv", "my_csv"],
+                writer_class=ptw.TsvTableWriter,
+                file_extension_list=["csv"],
+            )
+        )
+
+        assert isinstance(ptw.TableWriterFactory.create_from_format_name("csv"), ptw.CsvTableWriter)
+        assert isinstance(
+            ptw.TableWriterFactory.create_from_format_name("my_csv"), ptw.TsvTableWriter
+        )
+        assert ptw.TableWriterFactory.get_format_name_list().count("csv") == 1
+
+    def test_normal_capability(self, factory_index):
+        plugin = ptw.WriterPlugin(
+            name_list="bin_stream",
+            writer_class="not_exist_module:Writer",
+            format_attribute=ptw.FormatAttr.FILE | ptw.FormatAttr.BIN | ptw.FormatAttr.SPLIT_WRITE,
+        )
+        ptw.TableWriterFactory.register(plugin)
+
+        assert ptw.TableWriterFactory.find_table_format_list(
+            ptw.FormatAttr.BIN | ptw.FormatAttr.SPLIT_WRITE
+        ) == [ptw.TableFormat.EXCEL_XLS, ptw.TableFormat.EXCEL_XLSX, ptw.TableFormat.SQLITE, plugin]
+
+    @pytest.mark.parametrize(
+        ["value", "expected"], [[None, TypeError], [ptw.TableFormat.CSV, TypeError]]
+    )
+    def test_exception(self, factory_index, value, expected):
+        with pytest.raises(expected):
+            ptw.TableWriterFactory.register(value)
+
+    @pytest.mark.parametrize(
+        ["name_list", "writer_class", "expected"],
+        [
+            [[], ptw.CsvTableWriter, ValueError],
+            [["invalid_path"], "not_exist_module", ValueError],
+            [["not_exist"], "not_exist_module:Writer", ImportError],
+        ],
+    )
+    def test_exception_plugin(self, factory_index, name_list, writer_class, expected):
+        with pytest.raises(expected):
+            ptw.TableWriterFactory.register(ptw.WriterPlugin(name_list, writer_class))
+            ptw.TableWriterFactory.create_from_format_name(name_list[0])
+
+
+class Test_WriterFactory_entry_point(object):
+    def test_normal(self, factory_index, plugin_module, monkeypatch):
+        entry_point_list = [
+            EntryPoint(
+                "example",
+                ptw.WriterPlugin(
+                    ["example"], plugin_module + ":ExampleTableWriter", file_extension_list=["exm"]
+                ),
+            ),
+            EntryPoint("broken", ImportError("no module")),
+            EntryPoint("invalid", ptw.CsvTableWriter),
+        ]
+        monkeypatch.setattr(_plugin, "_iter_entry_points", lambda group: entry_point_list)
+
+        assert ptw.TableWriterFactory.get_extension_list().count("exm") == 1
+        assert "broken" not in ptw.TableWriterFactory.get_format_name_list()
+        assert "invalid" not in ptw.TableWriterFactory.get_format_name_list()
+        assert plugin_module not in sys.modules
+
+        writer = ptw.TableWriterFactory.create_from_file_extension("exm")
+        assert writer.format_name == "example"